@@ -1,8 +1,12 @@
 import os
 import logging
 from contextlib import asynccontextmanager
+
+import anyio.to_thread
 from fastapi import FastAPI
 
+from app.config.env import THREADPOOL_SIZE
+
 # 환경 변수로 로깅 레벨 설정 (기본값: INFO)
 # LOG_LEVEL=DEBUG (개발), LOG_LEVEL=WARNING (프로덕션)
 log_level = os.getenv("LOG_LEVEL", "INFO").upper()
@@ -16,10 +20,17 @@ async def lifespan(app: FastAPI):
     """FastAPI 앱 시작/종료 시 실행되는 이벤트"""
     logger.info("✅ FastAPI app starting up...")
 
+    # 동기 DB 호출이 스레드풀 슬롯을 점유하는 동안 다른 요청이 대기하지 않도록
+    # 기본 40개 제한을 커넥션 풀(pool_size + max_overflow)보다 넉넉하게 확장
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+
     yield
 
     # 종료 시 정리 작업 (필요시)
     logger.info("🔄 FastAPI app shutting down...")
 
+    from app.services.voice_service import close_http_client
+    await close_http_client()
+
 
 app = FastAPI(lifespan=lifespan)
\ No newline at end of file
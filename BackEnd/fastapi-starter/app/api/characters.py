@@ -1,5 +1,6 @@
 # app/api/characters.py
 
+from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -8,6 +9,7 @@ from sqlalchemy.orm import Session
 from app.config.db import get_db
 import app.schemas.info as infoSchema
 import app.cruds.info as infoCruds
+from app.services.persona_cache import persona_cache
 
 router = APIRouter()
 
@@ -19,15 +21,18 @@ router = APIRouter()
 @router.get("/user/{user_id}", response_model=list[infoSchema.Character])
 def get_characters_by_user(
     user_id: UUID,
-    skip: int = 0,
+    after_id: Optional[UUID] = None,
     limit: int = 100,
     db: Session = Depends(get_db),
 ):
-    """특정 유저의 캐릭터 리스트 조회"""
+    """
+    특정 유저의 캐릭터 리스트 조회
+    - 다음 페이지는 이전 응답의 마지막 id를 after_id로 전달
+    """
     characters = infoCruds.get_characters_by_user(
         db,
         user_id=user_id,
-        skip=skip,
+        after_id=after_id,
         limit=limit,
     )
     return characters
@@ -46,6 +51,19 @@ def create_character(
     return infoCruds.create_character(db, character)
 
 
+@router.post(
+    "/batch",
+    response_model=list[infoSchema.Character],
+    status_code=status.HTTP_201_CREATED,
+)
+def bulk_create_characters(
+    characters: list[infoSchema.CharacterCreate],
+    db: Session = Depends(get_db),
+):
+    """캐릭터 일괄 생성 (한 번의 INSERT / 커밋)"""
+    return infoCruds.bulk_create_characters(db, characters)
+
+
 @router.get("/{character_id}", response_model=infoSchema.Character)
 def get_character(
     character_id: UUID,
@@ -78,6 +96,7 @@ def update_character(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Character not found",
         )
+    persona_cache.invalidate(character_id)
     return db_character
 
 
@@ -88,6 +107,7 @@ def delete_character(
 ):
     """캐릭터 삭제"""
     ok = infoCruds.delete_character(db, character_id)
+    persona_cache.invalidate(character_id)
     if not ok:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -329,7 +329,7 @@ async def send_chat_message(
 
         # 3. 가전 제어가 필요한 경우
         # 3-1. 현재 상태 조회
-        user = db.query(User).filter(User.id == UUID(user_id)).first()
+        user = db.get(User, UUID(user_id))
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
@@ -740,6 +740,8 @@ async def approve_appliance_control(
         }
 
         execution_results = []
+        # 명령마다 커밋하지 않고 로그를 모아 루프 끝에서 한 번에 저장 + 커밋
+        command_logs: List[Dict[str, Any]] = []
 
         for rec in recommendations:
             appliance_type = rec["appliance_type"]
@@ -805,7 +807,8 @@ async def approve_appliance_control(
                     appliance_type=appliance_type,
                     action=action,
                     settings=settings,
-                    triggered_by="chat_scenario2"
+                    triggered_by="chat_scenario2",
+                    command_logs=command_logs
                 )
 
                 execution_results.append({
@@ -825,33 +828,32 @@ async def approve_appliance_control(
                 if action == "on" and settings and original_intent == "environment_complaint":
                     # "덥다", "건조하다" 등 환경 불편 표현 → 조건 기반 추천 → 학습 ✅
                     try:
-                        preference = db.query(UserAppliancePreference).filter(
-                            UserAppliancePreference.user_id == user_uuid,
-                            UserAppliancePreference.fatigue_level == fatigue_level,
-                            UserAppliancePreference.appliance_type == appliance_type
-                        ).first()
-
-                        if preference:
-                            # 기존 선호 세팅 업데이트
-                            preference.settings_json = settings
-                            preference.is_learned = True  # ✅ 사용자가 승인했으므로 학습됨으로 표시
-                            logger.info(f"📝 Updated preference (is_learned=True) for {appliance_type} at fatigue {fatigue_level} [environment_complaint]")
-                        else:
-                            # 새로운 선호 세팅 생성
-                            new_preference = UserAppliancePreference(
-                                user_id=user_uuid,
-                                fatigue_level=fatigue_level,
-                                appliance_type=appliance_type,
-                                settings_json=settings,
-                                is_learned=True  # ✅ 사용자가 승인했으므로 학습됨으로 표시
-                            )
-                            db.add(new_preference)
-                            logger.info(f"✨ Created new preference (is_learned=True) for {appliance_type} at fatigue {fatigue_level} [environment_complaint]")
+                        # 실패해도 이 학습만 되돌리도록 SAVEPOINT 사용 (커밋은 루프 끝에서 한 번)
+                        with db.begin_nested():
+                            preference = db.query(UserAppliancePreference).filter(
+                                UserAppliancePreference.user_id == user_uuid,
+                                UserAppliancePreference.fatigue_level == fatigue_level,
+                                UserAppliancePreference.appliance_type == appliance_type
+                            ).first()
 
-                        db.commit()
+                            if preference:
+                                # 기존 선호 세팅 업데이트
+                                preference.settings_json = settings
+                                preference.is_learned = True  # ✅ 사용자가 승인했으므로 학습됨으로 표시
+                                logger.info(f"📝 Updated preference (is_learned=True) for {appliance_type} at fatigue {fatigue_level} [environment_complaint]")
+                            else:
+                                # 새로운 선호 세팅 생성
+                                new_preference = UserAppliancePreference(
+                                    user_id=user_uuid,
+                                    fatigue_level=fatigue_level,
+                                    appliance_type=appliance_type,
+                                    settings_json=settings,
+                                    is_learned=True  # ✅ 사용자가 승인했으므로 학습됨으로 표시
+                                )
+                                db.add(new_preference)
+                                logger.info(f"✨ Created new preference (is_learned=True) for {appliance_type} at fatigue {fatigue_level} [environment_complaint]")
                     except Exception as pref_error:
                         logger.error(f"⚠️ Failed to save preference: {str(pref_error)}")
-                        db.rollback()
                 elif original_intent == "appliance_request":
                     # "에어컨 켜줘" 등 직접 명령 → 학습하지 않음 ❌
                     logger.info(f"⏭️ Skipping preference learning for {appliance_type} [appliance_request - user direct command]")
@@ -865,6 +867,9 @@ async def approve_appliance_control(
                 })
                 logger.error(f"❌ {appliance_type} {action} error: {str(e)}")
 
+        # 상태 변경 / 선호 학습 / 명령 로그를 한 번에 커밋
+        appliance_control_service.write_command_logs(db, command_logs)
+
         # 4. 응답 메시지 생성 - LLM을 사용해서 자연스럽게
         success_count = sum(1 for r in execution_results if r["status"] == "success")
         total_count = len(execution_results)
@@ -974,7 +979,7 @@ async def get_chat_history(
         user_uuid = get_user_uuid_by_identifier(db, user_identifier)
 
         # 세션 ID는 이메일 기반으로 생성 (일관성 유지)
-        user = db.query(User).filter(User.id == user_uuid).first()
+        user = db.get(User, user_uuid)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
@@ -162,7 +162,7 @@ async def trigger_auto_notification(user_id: str, distance: float, event_type: s
                 from app.services.supabase_service import supabase_persona_service
 
                 # 4-1. 서버 DB에서 user_id로 email 조회
-                user = db.query(User).filter(User.id == user_id).first()
+                user = db.get(User, user_id)
 
                 if not user or not user.email:
                     logger.warning(f"⚠️ User {user_id} not found or has no email")
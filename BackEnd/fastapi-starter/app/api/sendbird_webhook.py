@@ -246,6 +246,8 @@ async def process_and_respond(
                 logger.info("✅ [APPLIANCE-CONTROL] User approved! Executing appliance controls...")
 
                 execution_results = []
+                # 명령마다 커밋하지 않고 로그를 모아 루프 끝에서 한 번에 저장 + 커밋
+                command_logs = []
                 recommendations = pending_suggestion.get("appliances", [])
                 fatigue_level = pending_suggestion.get("fatigue_level", 2)
 
@@ -339,7 +341,8 @@ async def process_and_respond(
                             appliance_type=appliance_type,
                             action=action,
                             settings=settings,
-                            triggered_by="scenario1_approved"
+                            triggered_by="scenario1_approved",
+                            command_logs=command_logs
                         )
 
                         # 실행 결과 확인
@@ -366,31 +369,31 @@ async def process_and_respond(
                             from app.models.appliance import UserAppliancePreference
                             from uuid import UUID
 
-                            preference = db.query(UserAppliancePreference).filter(
-                                UserAppliancePreference.user_id == UUID(actual_user_id),
-                                UserAppliancePreference.fatigue_level == fatigue_level,
-                                UserAppliancePreference.appliance_type == appliance_type
-                            ).first()
-
-                            if action == "on" and settings:
-                                if preference:
-                                    preference.settings_json = settings
-                                    preference.is_learned = True  # ✅ 사용자가 승인했으므로 학습됨으로 표시
-                                    logger.info(f"📝 [LEARNING] Updated preference (is_learned=True) for {appliance_type}")
-                                else:
-                                    new_preference = UserAppliancePreference(
-                                        user_id=UUID(actual_user_id),
-                                        fatigue_level=fatigue_level,
-                                        appliance_type=appliance_type,
-                                        settings_json=settings,
-                                        is_learned=True  # ✅ 사용자가 승인했으므로 학습됨으로 표시
-                                    )
-                                    db.add(new_preference)
-                                    logger.info(f"✨ [LEARNING] Created preference (is_learned=True) for {appliance_type}")
-                                db.commit()
+                            # 실패해도 이 학습만 되돌리도록 SAVEPOINT 사용 (커밋은 루프 끝에서 한 번)
+                            with db.begin_nested():
+                                preference = db.query(UserAppliancePreference).filter(
+                                    UserAppliancePreference.user_id == UUID(actual_user_id),
+                                    UserAppliancePreference.fatigue_level == fatigue_level,
+                                    UserAppliancePreference.appliance_type == appliance_type
+                                ).first()
+
+                                if action == "on" and settings:
+                                    if preference:
+                                        preference.settings_json = settings
+                                        preference.is_learned = True  # ✅ 사용자가 승인했으므로 학습됨으로 표시
+                                        logger.info(f"📝 [LEARNING] Updated preference (is_learned=True) for {appliance_type}")
+                                    else:
+                                        new_preference = UserAppliancePreference(
+                                            user_id=UUID(actual_user_id),
+                                            fatigue_level=fatigue_level,
+                                            appliance_type=appliance_type,
+                                            settings_json=settings,
+                                            is_learned=True  # ✅ 사용자가 승인했으므로 학습됨으로 표시
+                                        )
+                                        db.add(new_preference)
+                                        logger.info(f"✨ [LEARNING] Created preference (is_learned=True) for {appliance_type}")
                         except Exception as pref_error:
                             logger.error(f"⚠️ [LEARNING] Failed to save preference: {str(pref_error)}")
-                            db.rollback()
 
                     except Exception as e:
                         execution_results.append({
@@ -401,6 +404,9 @@ async def process_and_respond(
                         })
                         logger.error(f"❌ [APPLIANCE-CONTROL] {appliance_type} error: {str(e)}")
 
+                # 상태 변경 / 선호 학습 / 명령 로그를 한 번에 커밋
+                appliance_control_service.write_command_logs(db, command_logs)
+
                 # LLM을 사용해서 자연스러운 실행 결과 메시지 생성
                 success_count = sum(1 for r in execution_results if r["status"] == "success")
 
@@ -1,12 +1,14 @@
 # app/api/tracking.py
 from datetime import datetime
-from typing import List
+from typing import Callable, Iterator, List, Optional, Type
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
-from app.config.db import get_db
+from app.config.db import SessionLocal, get_db
 from app.schemas.tracking import (
     PlaceBase,
     PlaceCreate,
@@ -14,6 +16,7 @@ from app.schemas.tracking import (
     TimeSlotBase,
     TimeSlotCreate,
     TimeSlotRead,
+    TimeSlotPage,
     WeatherObservationCreate,
     WeatherObservationRead,
     SleepSessionBase,
@@ -25,19 +28,27 @@ from app.schemas.tracking import (
     HealthHourlyBase,
     HealthHourlyCreate,
     HealthHourlyRead,
+    HealthHourlyPage,
 )
 from app.cruds.tracking import (
     create_place,
+    bulk_create_places,
     get_places_by_user,
     create_time_slot,
+    bulk_create_time_slots,
     get_time_slots_for_user_range,
+    iter_time_slots_for_user_range,
     upsert_weather_observation,
     create_sleep_session,
+    bulk_create_sleep_sessions,
     get_sleep_sessions_for_user_range,
     create_workout_session,
+    bulk_create_workout_sessions,
     get_workout_sessions_for_user_range,
     upsert_health_hourly,
+    bulk_upsert_health_hourly,
     get_health_hourly_range,
+    iter_health_hourly_range,
 )
 
 router = APIRouter(tags=["tracking"])
@@ -46,6 +57,26 @@ router = APIRouter(tags=["tracking"])
 # 이렇게 include 된다고 가정 (/api + 아래 path들)
 
 
+def _stream_ndjson(
+    iter_rows: Callable[..., Iterator],
+    read_model: Type[BaseModel],
+    **kwargs,
+) -> StreamingResponse:
+    """
+    ORM 행을 한 줄에 하나씩 JSON(NDJSON)으로 스트리밍
+    - 의존성(get_db) 세션은 응답 전송 전에 닫히므로 스트림 전용 세션을 따로 연다
+    """
+    def generate():
+        db = SessionLocal()
+        try:
+            for row in iter_rows(db, **kwargs):
+                yield read_model.model_validate(row).model_dump_json() + "\n"
+        finally:
+            db.close()
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 # ---------------------------------------------------------------------------
 # Places
 # ---------------------------------------------------------------------------
@@ -64,14 +95,40 @@ def create_place_for_user(
     유저의 Place 생성
     - body에는 user_id 없이 label / category / center_lat 등만 보냄
     """
-    data = PlaceCreate(
+    data = PlaceCreate.model_construct(
+        _fields_set=body.model_fields_set | {"user_id"},
         user_id=user_id,
-        **body.model_dump(exclude_unset=True),
+        **body.__dict__,
     )
     place = create_place(db, data)
     return place
 
 
+@router.post(
+    "/users/{user_id}/places/batch",
+    response_model=List[PlaceRead],
+    status_code=status.HTTP_201_CREATED,
+)
+def bulk_create_places_for_user(
+    user_id: UUID,
+    body: List[PlaceBase],
+    db: Session = Depends(get_db),
+):
+    """
+    유저의 Place 일괄 생성
+    - 여러 건을 한 번의 INSERT / 커밋으로 저장
+    """
+    items = [
+        PlaceCreate.model_construct(
+            _fields_set=item.model_fields_set | {"user_id"},
+            user_id=user_id,
+            **item.__dict__,
+        )
+        for item in body
+    ]
+    return bulk_create_places(db, items)
+
+
 @router.get(
     "/users/{user_id}/places",
     response_model=List[PlaceRead],
@@ -103,30 +160,86 @@ def create_time_slot_for_user(
     유저의 1시간 단위 TimeSlot 생성
     - body.ts_hour 는 필수
     """
-    data = TimeSlotCreate(
+    data = TimeSlotCreate.model_construct(
+        _fields_set=body.model_fields_set | {"user_id"},
         user_id=user_id,
-        **body.model_dump(exclude_unset=True),
+        **body.__dict__,
     )
     slot = create_time_slot(db, data)
     return slot
 
 
+@router.post(
+    "/users/{user_id}/time-slots/batch",
+    response_model=List[TimeSlotRead],
+    status_code=status.HTTP_201_CREATED,
+)
+def bulk_create_time_slots_for_user(
+    user_id: UUID,
+    body: List[TimeSlotBase],
+    db: Session = Depends(get_db),
+):
+    """
+    유저의 TimeSlot 일괄 생성
+    - 여러 건을 한 번의 INSERT / 커밋으로 저장
+    """
+    items = [
+        TimeSlotCreate.model_construct(
+            _fields_set=item.model_fields_set | {"user_id"},
+            user_id=user_id,
+            **item.__dict__,
+        )
+        for item in body
+    ]
+    return bulk_create_time_slots(db, items)
+
+
 @router.get(
     "/users/{user_id}/time-slots",
-    response_model=List[TimeSlotRead],
+    response_model=TimeSlotPage,
 )
 def list_time_slots_for_user(
     user_id: UUID,
     start: datetime,
     end: datetime,
+    limit: int = Query(1000, ge=1, le=10000),
+    cursor: Optional[datetime] = None,
     db: Session = Depends(get_db),
 ):
     """
-    유저의 TimeSlot 범위 조회
-    - query: ?start=2025-01-01T00:00:00Z&end=2025-01-02T00:00:00Z
+    유저의 TimeSlot 범위 조회 (ts_hour 기준 커서 페이지네이션)
+    - query: ?start=2025-01-01T00:00:00Z&end=2025-01-02T00:00:00Z&limit=1000
+    - 다음 페이지는 응답의 next_cursor 를 cursor 로 넘겨서 조회
     """
-    slots = get_time_slots_for_user_range(db, user_id=user_id, start=start, end=end)
-    return slots
+    slots = get_time_slots_for_user_range(
+        db,
+        user_id=user_id,
+        start=start,
+        end=end,
+        limit=limit,
+        cursor=cursor,
+    )
+    next_cursor = slots[-1].ts_hour if len(slots) == limit else None
+    return {"items": slots, "next_cursor": next_cursor}
+
+
+@router.get("/users/{user_id}/time-slots/stream")
+def stream_time_slots_for_user(
+    user_id: UUID,
+    start: datetime,
+    end: datetime,
+):
+    """
+    TimeSlot 기간 전체를 NDJSON 으로 스트리밍
+    - 긴 기간도 전체를 메모리에 올리지 않고 1000행 단위로 전송
+    """
+    return _stream_ndjson(
+        iter_time_slots_for_user_range,
+        TimeSlotRead,
+        user_id=user_id,
+        start=start,
+        end=end,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -146,7 +259,10 @@ def upsert_weather(
     - (nx, ny, as_of, provider) 기준으로 존재하면 업데이트, 없으면 생성
     """
     obs = upsert_weather_observation(db, body)
-    return obs
+    # raw_json 은 사이드 테이블에 저장되므로 요청 값을 그대로 응답에 포함
+    return WeatherObservationRead.model_validate(obs).model_copy(
+        update={"raw_json": body.raw_json}
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -166,14 +282,40 @@ def create_sleep_session_for_user(
     """
     수면 세션 생성
     """
-    data = SleepSessionCreate(
+    data = SleepSessionCreate.model_construct(
+        _fields_set=body.model_fields_set | {"user_id"},
         user_id=user_id,
-        **body.model_dump(exclude_unset=True),
+        **body.__dict__,
     )
     session = create_sleep_session(db, data)
     return session
 
 
+@router.post(
+    "/users/{user_id}/sleep-sessions/batch",
+    response_model=List[SleepSessionRead],
+    status_code=status.HTTP_201_CREATED,
+)
+def bulk_create_sleep_sessions_for_user(
+    user_id: UUID,
+    body: List[SleepSessionBase],
+    db: Session = Depends(get_db),
+):
+    """
+    수면 세션 일괄 생성
+    - 여러 건을 한 번의 INSERT / 커밋으로 저장
+    """
+    items = [
+        SleepSessionCreate.model_construct(
+            _fields_set=item.model_fields_set | {"user_id"},
+            user_id=user_id,
+            **item.__dict__,
+        )
+        for item in body
+    ]
+    return bulk_create_sleep_sessions(db, items)
+
+
 @router.get(
     "/users/{user_id}/sleep-sessions",
     response_model=List[SleepSessionRead],
@@ -213,14 +355,40 @@ def create_workout_session_for_user(
     """
     운동 세션 생성
     """
-    data = WorkoutSessionCreate(
+    data = WorkoutSessionCreate.model_construct(
+        _fields_set=body.model_fields_set | {"user_id"},
         user_id=user_id,
-        **body.model_dump(exclude_unset=True),
+        **body.__dict__,
     )
     session = create_workout_session(db, data)
     return session
 
 
+@router.post(
+    "/users/{user_id}/workout-sessions/batch",
+    response_model=List[WorkoutSessionRead],
+    status_code=status.HTTP_201_CREATED,
+)
+def bulk_create_workout_sessions_for_user(
+    user_id: UUID,
+    body: List[WorkoutSessionBase],
+    db: Session = Depends(get_db),
+):
+    """
+    운동 세션 일괄 생성
+    - 여러 건을 한 번의 INSERT / 커밋으로 저장
+    """
+    items = [
+        WorkoutSessionCreate.model_construct(
+            _fields_set=item.model_fields_set | {"user_id"},
+            user_id=user_id,
+            **item.__dict__,
+        )
+        for item in body
+    ]
+    return bulk_create_workout_sessions(db, items)
+
+
 @router.get(
     "/users/{user_id}/workout-sessions",
     response_model=List[WorkoutSessionRead],
@@ -260,31 +428,81 @@ def upsert_health_hourly_for_user(
     1시간 단위 헬스 데이터 upsert
     - ts_hour 가 동일한 레코드가 있으면 업데이트, 없으면 생성
     """
-    data = HealthHourlyCreate(
+    data = HealthHourlyCreate.model_construct(
+        _fields_set=body.model_fields_set | {"user_id"},
         user_id=user_id,
-        **body.model_dump(exclude_unset=True),
+        **body.__dict__,
     )
     row = upsert_health_hourly(db, data)
     return row
 
 
+@router.put(
+    "/users/{user_id}/health-hourly/batch",
+    response_model=List[HealthHourlyRead],
+)
+def bulk_upsert_health_hourly_for_user(
+    user_id: UUID,
+    body: List[HealthHourlyBase],
+    db: Session = Depends(get_db),
+):
+    """
+    1시간 단위 헬스 데이터 일괄 upsert (HealthKit 백필)
+    - 여러 시간대를 한 번의 INSERT ... ON CONFLICT / 커밋으로 저장
+    """
+    items = [
+        HealthHourlyCreate.model_construct(
+            _fields_set=item.model_fields_set | {"user_id"},
+            user_id=user_id,
+            **item.__dict__,
+        )
+        for item in body
+    ]
+    return bulk_upsert_health_hourly(db, items)
+
+
 @router.get(
     "/users/{user_id}/health-hourly",
-    response_model=List[HealthHourlyRead],
+    response_model=HealthHourlyPage,
 )
 def list_health_hourly_for_user(
     user_id: UUID,
     start: datetime,
     end: datetime,
+    limit: int = Query(1000, ge=1, le=10000),
+    cursor: Optional[datetime] = None,
     db: Session = Depends(get_db),
 ):
     """
-    특정 기간의 1시간 단위 헬스 데이터 조회
+    특정 기간의 1시간 단위 헬스 데이터 조회 (ts_hour 기준 커서 페이지네이션)
+    - 다음 페이지는 응답의 next_cursor 를 cursor 로 넘겨서 조회
     """
     rows = get_health_hourly_range(
         db,
         user_id=user_id,
         start=start,
         end=end,
+        limit=limit,
+        cursor=cursor,
+    )
+    next_cursor = rows[-1].ts_hour if len(rows) == limit else None
+    return {"items": rows, "next_cursor": next_cursor}
+
+
+@router.get("/users/{user_id}/health-hourly/stream")
+def stream_health_hourly_for_user(
+    user_id: UUID,
+    start: datetime,
+    end: datetime,
+):
+    """
+    1시간 단위 헬스 데이터 기간 전체를 NDJSON 으로 스트리밍
+    - 긴 기간도 전체를 메모리에 올리지 않고 1000행 단위로 전송
+    """
+    return _stream_ndjson(
+        iter_health_hourly_range,
+        HealthHourlyRead,
+        user_id=user_id,
+        start=start,
+        end=end,
     )
-    return rows
@@ -36,13 +36,13 @@ def create_user(
     db: Session = Depends(get_db),
 ):
     """유저 생성 (현재는 email만 사용)"""
-    db_user = userCruds.get_user_by_email(db, email=user.email)
-    if db_user:
+    db_user = userCruds.create_user(db=db, user=user)
+    if db_user is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered",
         )
-    return userCruds.create_user(db=db, user=user)
+    return db_user
 
 
 @router.get("/{user_id}", response_model=userSchema.User)
@@ -65,7 +65,7 @@ def get_user_profile(
     """
     User + UserPhone + UserDevice 를 한 번에 반환하는 프로필 조회
     """
-    user = userCruds.get_user(db, user_id=user_id)
+    user = userCruds.get_user_with_relations(db, user_id=user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     # SQLAlchemy relationship (phone, device)가 같이 직렬화됨
@@ -104,9 +104,10 @@ def upsert_user_phone(
     유저의 휴대폰 정보 생성/업데이트 (upsert)
     - body에는 user_id 없이 휴대폰 정보만 보냄
     """
-    data = userSchema.UserPhoneCreate(
+    data = userSchema.UserPhoneCreate.model_construct(
+        _fields_set=body.model_fields_set | {"user_id"},
         user_id=user_id,
-        **body.model_dump(exclude_unset=True),
+        **body.__dict__,
     )
     phone = userCruds.create_or_update_user_phone(db, data=data)
     return phone
@@ -144,9 +145,10 @@ def upsert_user_device(
     유저의 웨어러블 정보 생성/업데이트 (upsert)
     - body에는 user_id 없이 디바이스 정보만 보냄
     """
-    data = userSchema.UserDeviceCreate(
+    data = userSchema.UserDeviceCreate.model_construct(
+        _fields_set=body.model_fields_set | {"user_id"},
         user_id=user_id,
-        **body.model_dump(exclude_unset=True),
+        **body.__dict__,
     )
     device = userCruds.create_or_update_user_device(db, data=data)
     return device
@@ -7,24 +7,285 @@ import os
 import logging
 import json
 import asyncio
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.config.db import get_db
+from app.config.db import run_in_session
+from app.models.location import UserLocation
 from app.services.realtime_voice_agent import realtime_agent
 from app.services.appliance_control_service import appliance_control_service
 from app.services.appliance_rule_engine import appliance_rule_engine
-from app.services.weather_service import weather_service
+from app.services.weather_cache import get_combined_weather_cached
 from app.services.hrv_service import hrv_service
-from app.services.supabase_service import supabase_persona_service
-import app.cruds.info as infoCruds
+from app.services.persona_cache import persona_cache
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# 집 위치가 없을 때 사용하는 기본 좌표 (서울 시청)
+DEFAULT_HOME_LATITUDE = 37.5665
+DEFAULT_HOME_LONGITUDE = 126.9780
+
+
+@lru_cache(maxsize=4096)
+def _uuid(value: str) -> UUID:
+    """사용자 ID 문자열 → UUID (같은 세션에서 반복 파싱 방지)"""
+    return UUID(value)
+
+
+def _get_home_coordinates(db: Session, user_id: UUID) -> tuple[float, float]:
+    """사용자 집 좌표 조회 (없으면 기본 좌표)"""
+    row = db.execute(
+        select(UserLocation.home_latitude, UserLocation.home_longitude)
+        .where(UserLocation.user_id == user_id)
+    ).first()
+    if row is not None and row[0] is not None and row[1] is not None:
+        return row[0], row[1]
+    return DEFAULT_HOME_LATITUDE, DEFAULT_HOME_LONGITUDE
+
+
+async def _get_home_weather(user_id: UUID) -> Dict[str, Any]:
+    """집 좌표 조회 후 날씨 조회"""
+    latitude, longitude = await asyncio.to_thread(
+        run_in_session, _get_home_coordinates, user_id
+    )
+    # DB 캐시 조회/저장은 스레드풀에서 짧게, 외부 API 호출은 세션 없이 수행
+    return await get_combined_weather_cached(
+        latitude=latitude,
+        longitude=longitude,
+        sido_name="서울"
+    )
+
+
+# ---------------------------------------------------------------------------
+# Function calling 핸들러
+#   - DB 세션은 호출마다 새로 열기 때문에 연결(핸들러 인스턴스)과 무관
+#   - 모듈 레벨에 한 번만 정의하고 realtime_agent에 한 번만 등록
+# ---------------------------------------------------------------------------
+
+# 1. 가전 제어
+async def handle_control_appliance(
+    uid: str, appliance_type: str, action: str, settings: Dict[str, Any] = None
+):
+    """가전 제어 실행"""
+    try:
+        logger.info(f"🎛️ Control: {appliance_type} {action} {settings}")
+        result = await asyncio.to_thread(
+            run_in_session,
+            appliance_control_service.execute_command,
+            user_id=uid,
+            appliance_type=appliance_type,
+            action=action,
+            settings=settings,
+            triggered_by="voice_realtime"
+        )
+        return {
+            "success": True,
+            "appliance": appliance_type,
+            "action": action,
+            "status": result.get("status", "ok"),
+            "message": f"{appliance_type}을(를) {action} 했습니다."
+        }
+    except Exception as e:
+        logger.error(f"❌ Control error: {str(e)}")
+        return {
+            "success": False,
+            "error": str(e),
+            "message": f"제어 중 오류가 발생했습니다: {str(e)}"
+        }
+
+
+# 사용자별 진행 중인 조회 (같은 요청이 겹치면 한 번만 실행)
+_status_inflight: Dict[str, asyncio.Future] = {}
+_recommend_inflight: Dict[str, asyncio.Future] = {}
+
+
+async def _single_flight(inflight: Dict[str, asyncio.Future], uid: str, compute):
+    """
+    같은 사용자의 동일 조회가 진행 중이면 그 결과를 기다리고,
+    없으면 compute()를 실행해 결과를 대기 중인 호출들과 공유
+    """
+    fut = inflight.get(uid)
+    if fut is not None and not fut.done():
+        return await asyncio.shield(fut)
+
+    fut = asyncio.get_running_loop().create_future()
+    inflight[uid] = fut
+    try:
+        result = await compute()
+    except asyncio.CancelledError:
+        fut.cancel()
+        raise
+    except Exception as e:
+        fut.set_exception(e)
+        fut.exception()  # 대기자가 없을 때 "never retrieved" 경고 방지
+        raise
+    else:
+        fut.set_result(result)
+        return result
+    finally:
+        if inflight.get(uid) is fut:
+            del inflight[uid]
+
+
+# 2. 현재 상태 조회
+async def handle_get_current_status(uid: str):
+    """현재 날씨와 집안 환경 상태 조회"""
+    return await _single_flight(
+        _status_inflight, uid, lambda: _compute_current_status(uid)
+    )
+
+
+async def _compute_current_status(uid: str):
+    try:
+        user_uuid = _uuid(uid)
+
+        # 날씨 / HRV 피로도 / 가전 상태를 동시에 조회
+        # (동기 DB 호출은 스레드풀에서 실행해 이벤트 루프 블로킹 방지)
+        weather_data, fatigue, appliances = await asyncio.gather(
+            _get_home_weather(user_uuid),
+            asyncio.to_thread(
+                run_in_session, hrv_service.get_latest_fatigue_level, user_uuid
+            ),
+            asyncio.to_thread(
+                run_in_session,
+                appliance_control_service.get_appliance_status,
+                user_id=uid
+            ),
+        )
+
+        # 가전 목록을 자연스러운 문자열로 변환
+        if appliances:
+            appliance_list = []
+            for app in appliances:
+                status_text = "켜져 있음" if app.get("is_on") else "꺼져 있음"
+                appliance_list.append(f"{app.get('appliance_type')}({status_text})")
+            appliances_text = ", ".join(appliance_list)
+        else:
+            appliances_text = "등록된 가전이 없습니다"
+
+        return {
+            "weather": {
+                "temperature": weather_data.get("temperature"),
+                "humidity": weather_data.get("humidity"),
+                "pm10": weather_data.get("pm10"),
+                "pm2_5": weather_data.get("pm2_5"),
+                "description": weather_data.get("description")
+            },
+            "fatigue_level": fatigue,
+            "appliances": appliances,
+            "appliances_text": appliances_text,
+            "message": f"현재 온도 {weather_data.get('temperature')}도, 습도 {weather_data.get('humidity')}%, 피로도 레벨 {fatigue}입니다. 등록된 가전: {appliances_text}"
+        }
+    except Exception as e:
+        logger.error(f"❌ Status error: {str(e)}")
+        return {"error": str(e)}
+
+
+# 3. 가전 목록 조회
+async def handle_list_appliances(uid: str):
+    """등록된 가전 목록 조회"""
+    try:
+        # 가전 상태
+        appliances = await asyncio.to_thread(
+            run_in_session,
+            appliance_control_service.get_appliance_status,
+            user_id=uid
+        )
+
+        if not appliances:
+            return {
+                "appliances": [],
+                "message": "등록된 가전이 없습니다."
+            }
+
+        # 가전 목록을 자연스러운 문자열로 변환
+        appliance_list = []
+        for app in appliances:
+            status_text = "켜져 있습니다" if app.get("is_on") else "꺼져 있습니다"
+            appliance_list.append(f"{app.get('appliance_type')}는 현재 {status_text}")
+
+        return {
+            "appliances": appliances,
+            "message": ". ".join(appliance_list) + "."
+        }
+    except Exception as e:
+        logger.error(f"❌ List appliances error: {str(e)}")
+        return {"error": str(e)}
+
+
+# 4. 가전 제어 추천
+async def handle_recommend_appliances(uid: str):
+    """현재 상황 기반 가전 제어 추천"""
+    return await _single_flight(
+        _recommend_inflight, uid, lambda: _compute_recommendations(uid)
+    )
+
+
+async def _compute_recommendations(uid: str):
+    try:
+        user_uuid = _uuid(uid)
+
+        # 날씨 / HRV 피로도를 동시에 조회
+        weather_data, fatigue = await asyncio.gather(
+            _get_home_weather(user_uuid),
+            asyncio.to_thread(
+                run_in_session, hrv_service.get_latest_fatigue_level, user_uuid
+            ),
+        )
+
+        # 추천 생성
+        recommendations = await asyncio.to_thread(
+            run_in_session,
+            appliance_rule_engine.get_appliances_to_control,
+            user_id=uid,
+            weather_data=weather_data,
+            fatigue_level=fatigue
+        )
+
+        if not recommendations:
+            return {
+                "recommendations": [],
+                "message": "현재는 제어가 필요한 가전이 없습니다."
+            }
+
+        # 추천 메시지 생성
+        messages = []
+        for rec in recommendations:
+            action_str = "켜기" if rec["action"] == "on" else "끄기" if rec["action"] == "off" else "설정 변경"
+            messages.append(f"{rec['appliance_type']}: {action_str} ({rec['reason']})")
+
+        return {
+            "recommendations": recommendations,
+            "message": "추천: " + ", ".join(messages)
+        }
+    except Exception as e:
+        logger.error(f"❌ Recommend error: {str(e)}")
+        return {"error": str(e)}
+
+
+_function_handlers_registered = False
+
+
+def _ensure_function_handlers_registered():
+    """Function calling 핸들러 등록 (최초 1회)"""
+    global _function_handlers_registered
+    if _function_handlers_registered:
+        return
+
+    realtime_agent.register_function("control_appliance", handle_control_appliance)
+    realtime_agent.register_function("get_current_status", handle_get_current_status)
+    realtime_agent.register_function("list_appliances", handle_list_appliances)
+    realtime_agent.register_function("recommend_appliances", handle_recommend_appliances)
+
+    _function_handlers_registered = True
+    logger.info("✅ Function handlers registered")
+
 
 class VoiceRealtimeHandler:
     """
@@ -32,183 +293,108 @@ class VoiceRealtimeHandler:
     클라이언트 ↔ FastAPI ↔ OpenAI Realtime API
     """
 
-    def __init__(self, db: Session, use_manual_commit: bool = False):
-        self.db = db
-        self.registered_functions = False
+    def __init__(self, use_manual_commit: bool = False):
+        # DB 세션은 연결 동안 잡아두지 않고, 필요한 조회마다 새로 열고 닫는다
         self.use_manual_commit = use_manual_commit  # 테스트용 수동 커밋 모드
-        self.audio_buffer = bytearray() if use_manual_commit else None
+        # 수동 커밋 모드 오디오 버퍼: 청크 리스트로 보관 후 커밋 시 한 번에 join
+        self.audio_chunks: list[bytes] = [] if use_manual_commit else None
+        self.audio_buffer_len = 0
         self.total_audio_received = 0  # 디버깅용
 
-    def register_function_handlers(self, user_id: str):
-        """Function calling 핸들러 등록"""
-        if self.registered_functions:
+        # 실시간 모드 오디오 마이크로 배칭: 짧은 구간의 청크를 모아 한 번에 전송
+        self.pending_chunks: list[bytes] = []
+        self.pending_len = 0
+        self.flush_task: Optional[asyncio.Task] = None
+        self.flush_interval = 0.04  # 40ms
+        self.flush_max_bytes = 64 * 1024  # 이 크기를 넘으면 즉시 전송
+
+    async def handle_audio_chunk(self, user_id: str, bytes_data: bytes):
+        """클라이언트 오디오 청크 처리"""
+        self.total_audio_received += len(bytes_data)
+
+        if self.use_manual_commit:
+            # 테스트 모드: 버퍼에 쌓기
+            self.audio_chunks.append(bytes_data)
+            self.audio_buffer_len += len(bytes_data)
+            if logger.isEnabledFor(logging.DEBUG):
+                duration_ms = (self.audio_buffer_len / 32000) * 1000
+                logger.debug(
+                    "🎤 Audio chunk received: %d bytes (buffer: %d bytes, ~%.1fms)",
+                    len(bytes_data), self.audio_buffer_len, duration_ms
+                )
+        else:
+            # 실시간 모드: flush_interval 동안 모아서 전송 (Server VAD가 자동으로 처리)
+            logger.debug("🎤 Audio chunk received: %d bytes (realtime streaming)", len(bytes_data))
+            self.pending_chunks.append(bytes_data)
+            self.pending_len += len(bytes_data)
+
+            if self.pending_len >= self.flush_max_bytes:
+                await self.flush_pending_audio(user_id)
+            elif self.flush_task is None or self.flush_task.done():
+                self.flush_task = asyncio.create_task(self._flush_after_interval(user_id))
+
+    async def flush_pending_audio(self, user_id: str):
+        """모아둔 실시간 오디오를 한 번에 전송"""
+        if not self.pending_chunks:
             return
 
-        # 1. 가전 제어
-        async def handle_control_appliance(
-            uid: str, appliance_type: str, action: str, settings: Dict[str, Any] = None
-        ):
-            """가전 제어 실행"""
-            try:
-                logger.info(f"🎛️ Control: {appliance_type} {action} {settings}")
-                result = appliance_control_service.execute_command(
-                    db=self.db,
-                    user_id=uid,
-                    appliance_type=appliance_type,
-                    action=action,
-                    settings=settings,
-                    triggered_by="voice_realtime"
-                )
-                return {
-                    "success": True,
-                    "appliance": appliance_type,
-                    "action": action,
-                    "status": result.get("status", "ok"),
-                    "message": f"{appliance_type}을(를) {action} 했습니다."
-                }
-            except Exception as e:
-                logger.error(f"❌ Control error: {str(e)}")
-                return {
-                    "success": False,
-                    "error": str(e),
-                    "message": f"제어 중 오류가 발생했습니다: {str(e)}"
-                }
-
-        # 2. 현재 상태 조회
-        async def handle_get_current_status(uid: str):
-            """현재 날씨와 집안 환경 상태 조회"""
-            try:
-                # 사용자 정보 조회
-                user = infoCruds.get_user(self.db, UUID(uid))
-                if not user:
-                    return {"error": "User not found"}
-
-                # 날씨 정보
-                weather_data = await weather_service.get_combined_weather(
-                    db=self.db,
-                    latitude=user.home_latitude or 37.5665,
-                    longitude=user.home_longitude or 126.9780,
-                    sido_name="서울"
-                )
+        payload = b"".join(self.pending_chunks)
+        self.pending_chunks.clear()
+        self.pending_len = 0
+        await realtime_agent.send_audio(user_id, payload)
 
-                # HRV 피로도
-                fatigue = hrv_service.get_latest_fatigue_level(self.db, UUID(uid))
+    async def _flush_after_interval(self, user_id: str):
+        """flush_interval 후 모아둔 오디오 전송"""
+        try:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush_pending_audio(user_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ Audio flush error: {str(e)}")
 
-                # 가전 상태
-                appliances = appliance_control_service.get_appliance_status(
-                    db=self.db,
-                    user_id=uid
-                )
+    async def handle_control_message(self, user_id: str, text_data: str) -> bool:
+        """
+        클라이언트 JSON 제어 메시지 처리
 
-                # 가전 목록을 자연스러운 문자열로 변환
-                if appliances:
-                    appliance_list = []
-                    for app in appliances:
-                        status_text = "켜져 있음" if app.get("is_on") else "꺼져 있음"
-                        appliance_list.append(f"{app.get('appliance_type')}({status_text})")
-                    appliances_text = ", ".join(appliance_list)
+        Returns:
+            False면 수신 루프 종료 (close 요청)
+        """
+        try:
+            msg = json.loads(text_data)
+        except json.JSONDecodeError:
+            logger.warning(f"⚠️ Invalid JSON: {text_data[:100]}")
+            return True
+
+        msg_type = msg.get("type")
+
+        if msg_type == "audio_commit":
+            if self.use_manual_commit:
+                # 테스트 모드: 버퍼에 있는 모든 오디오를 한 번에 전송
+                if self.audio_buffer_len > 0:
+                    duration_ms = (self.audio_buffer_len / 32000) * 1000
+                    logger.info(f"📤 Sending buffered audio: {self.audio_buffer_len} bytes (~{duration_ms:.1f}ms)")
+                    payload = b"".join(self.audio_chunks)
+                    self.audio_chunks.clear()
+                    self.audio_buffer_len = 0
+                    await realtime_agent.send_audio(user_id, payload)
+
+                    await asyncio.sleep(0.1)
+                    logger.info("📤 Committing audio buffer")
+                    await realtime_agent.commit_audio(user_id)
                 else:
-                    appliances_text = "등록된 가전이 없습니다"
-
-                return {
-                    "weather": {
-                        "temperature": weather_data.get("temperature"),
-                        "humidity": weather_data.get("humidity"),
-                        "pm10": weather_data.get("pm10"),
-                        "pm2_5": weather_data.get("pm2_5"),
-                        "description": weather_data.get("description")
-                    },
-                    "fatigue_level": fatigue,
-                    "appliances": appliances,
-                    "appliances_text": appliances_text,
-                    "message": f"현재 온도 {weather_data.get('temperature')}도, 습도 {weather_data.get('humidity')}%, 피로도 레벨 {fatigue}입니다. 등록된 가전: {appliances_text}"
-                }
-            except Exception as e:
-                logger.error(f"❌ Status error: {str(e)}")
-                return {"error": str(e)}
-
-        # 3. 가전 목록 조회
-        async def handle_list_appliances(uid: str):
-            """등록된 가전 목록 조회"""
-            try:
-                # 가전 상태
-                appliances = appliance_control_service.get_appliance_status(
-                    db=self.db,
-                    user_id=uid
-                )
+                    logger.warning("⚠️ No audio in buffer to commit")
+            else:
+                # 실시간 모드: Server VAD가 자동 처리하므로 수동 커밋 불필요
+                logger.info("📤 Manual commit ignored (Server VAD enabled)")
 
-                if not appliances:
-                    return {
-                        "appliances": [],
-                        "message": "등록된 가전이 없습니다."
-                    }
-
-                # 가전 목록을 자연스러운 문자열로 변환
-                appliance_list = []
-                for app in appliances:
-                    status_text = "켜져 있습니다" if app.get("is_on") else "꺼져 있습니다"
-                    appliance_list.append(f"{app.get('appliance_type')}는 현재 {status_text}")
-
-                return {
-                    "appliances": appliances,
-                    "message": ". ".join(appliance_list) + "."
-                }
-            except Exception as e:
-                logger.error(f"❌ List appliances error: {str(e)}")
-                return {"error": str(e)}
+        elif msg_type == "close":
+            logger.info(f"🔌 Client requested close: {user_id}")
+            return False
+        else:
+            logger.warning(f"⚠️ Unknown message type: {msg_type}")
 
-        # 4. 가전 제어 추천
-        async def handle_recommend_appliances(uid: str):
-            """현재 상황 기반 가전 제어 추천"""
-            try:
-                # 사용자 정보
-                user = infoCruds.get_user(self.db, UUID(uid))
-                if not user:
-                    return {"error": "User not found"}
-
-                # 날씨 정보
-                weather_data = await weather_service.get_combined_weather(
-                    db=self.db,
-                    latitude=user.home_latitude or 37.5665,
-                    longitude=user.home_longitude or 126.9780,
-                    sido_name="서울"
-                )
-
-                # 추천 생성
-                recommendations = appliance_rule_engine.get_appliances_to_control(
-                    db=self.db,
-                    user_id=uid,
-                    weather_data=weather_data
-                )
-
-                if not recommendations:
-                    return {
-                        "recommendations": [],
-                        "message": "현재는 제어가 필요한 가전이 없습니다."
-                    }
-
-                # 추천 메시지 생성
-                messages = []
-                for rec in recommendations:
-                    action_str = "켜기" if rec["action"] == "on" else "끄기" if rec["action"] == "off" else "설정 변경"
-                    messages.append(f"{rec['appliance_type']}: {action_str} ({rec['reason']})")
-
-                return {
-                    "recommendations": recommendations,
-                    "message": "추천: " + ", ".join(messages)
-                }
-            except Exception as e:
-                logger.error(f"❌ Recommend error: {str(e)}")
-                return {"error": str(e)}
-
-        # 핸들러 등록
-        realtime_agent.register_function("control_appliance", handle_control_appliance)
-        realtime_agent.register_function("get_current_status", handle_get_current_status)
-        realtime_agent.register_function("list_appliances", handle_list_appliances)
-        realtime_agent.register_function("recommend_appliances", handle_recommend_appliances)
-
-        self.registered_functions = True
-        logger.info("✅ Function handlers registered")
+        return True
 
     async def handle_websocket(self, websocket: WebSocket, user_id: str, character_id: str = None):
         """WebSocket 연결 처리"""
@@ -216,31 +402,13 @@ class VoiceRealtimeHandler:
         logger.info(f"🎙️ WebSocket connected: {user_id}, character_id: {character_id}")
 
         try:
-            # Function handlers 등록
-            self.register_function_handlers(user_id)
+            # Function handlers 등록 (프로세스당 한 번)
+            _ensure_function_handlers_registered()
 
-            # 페르소나 로드 (character_id가 있으면)
+            # 페르소나 로드 (character_id가 있으면, 캐시 → Supabase → Character 테이블 순)
             persona_instructions = None
             if character_id:
-                # 1순위: Supabase 페르소나 시스템 시도
-                if supabase_persona_service.is_available():
-                    persona_data = supabase_persona_service.get_persona_for_llm(character_id)
-                    if persona_data:
-                        persona_instructions = persona_data["description"]
-                        logger.info(f"✅ Loaded Supabase persona: {persona_data['nickname']}")
-                    else:
-                        logger.warning(f"⚠️ Supabase persona not found: {character_id}, falling back to FastAPI Character")
-
-                # 2순위: FastAPI Character 테이블 (fallback)
-                if not persona_instructions:
-                    from app.cruds import info as infoCruds
-                    from uuid import UUID
-                    character = infoCruds.get_character(self.db, UUID(character_id))
-                    if character:
-                        persona_instructions = character.persona
-                        logger.info(f"✅ Loaded FastAPI persona: {character.nickname}")
-                    else:
-                        logger.warning(f"⚠️ Character not found in both Supabase and FastAPI DB: {character_id}")
+                persona_instructions = await persona_cache.get_persona(None, character_id)
 
             # Realtime API 세션 생성
             # voice 옵션: alloy(중성), echo(남성/낮음), fable(표현력), onyx(남성/깊음), nova(여성/밝음), shimmer(여성/부드러움)
@@ -275,7 +443,7 @@ class VoiceRealtimeHandler:
                         "role": role,
                         "text": text
                     })
-                    logger.info(f"📝 {role}: {text}")
+                    logger.debug("📝 %s: %s", role, text)
                 except Exception as e:
                     logger.error(f"❌ Transcript send error: {str(e)}")
 
@@ -315,61 +483,25 @@ class VoiceRealtimeHandler:
             # 클라이언트로부터 메시지 수신
             while True:
                 try:
-                    # FastAPI WebSocket의 receive() 메서드 사용
+                    # FastAPI WebSocket의 receive()로 ASGI 메시지를 직접 받음
                     data = await websocket.receive()
 
+                    # 바이너리 오디오 데이터 (hot path): ASGI 메시지의 bytes를 그대로 전달
+                    bytes_data = data.get("bytes")
+                    if bytes_data is not None:
+                        await self.handle_audio_chunk(user_id, bytes_data)
+                        continue
+
                     # WebSocket disconnect 이벤트 처리
-                    if data.get("type") == "websocket.disconnect":
+                    if data["type"] == "websocket.disconnect":
                         logger.info(f"🔌 WebSocket disconnected: {user_id}")
                         break
 
-                    # 바이너리 오디오 데이터 처리
-                    if "bytes" in data:
-                        bytes_data = data["bytes"]
-                        self.total_audio_received += len(bytes_data)
-
-                        if self.use_manual_commit:
-                            # 테스트 모드: 버퍼에 쌓기
-                            self.audio_buffer.extend(bytes_data)
-                            duration_ms = (len(self.audio_buffer) / 32000) * 1000
-                            logger.info(f"🎤 Audio chunk received: {len(bytes_data)} bytes (buffer: {len(self.audio_buffer)} bytes, ~{duration_ms:.1f}ms)")
-                        else:
-                            # 실시간 모드: 즉시 전송 (Server VAD가 자동으로 처리)
-                            logger.info(f"🎤 Audio chunk received: {len(bytes_data)} bytes (realtime streaming)")
-                            await realtime_agent.send_audio(user_id, bytes_data)
-
                     # 텍스트 메시지 처리 (JSON 제어 명령)
-                    elif "text" in data:
-                        text_data = data["text"]
-                        try:
-                            msg = json.loads(text_data)
-                            msg_type = msg.get("type")
-
-                            if msg_type == "audio_commit":
-                                if self.use_manual_commit:
-                                    # 테스트 모드: 버퍼에 있는 모든 오디오를 한 번에 전송
-                                    if self.audio_buffer and len(self.audio_buffer) > 0:
-                                        duration_ms = (len(self.audio_buffer) / 32000) * 1000
-                                        logger.info(f"📤 Sending buffered audio: {len(self.audio_buffer)} bytes (~{duration_ms:.1f}ms)")
-                                        await realtime_agent.send_audio(user_id, bytes(self.audio_buffer))
-                                        self.audio_buffer.clear()
-
-                                        await asyncio.sleep(0.1)
-                                        logger.info("📤 Committing audio buffer")
-                                        await realtime_agent.commit_audio(user_id)
-                                    else:
-                                        logger.warning("⚠️ No audio in buffer to commit")
-                                else:
-                                    # 실시간 모드: Server VAD가 자동 처리하므로 수동 커밋 불필요
-                                    logger.info("📤 Manual commit ignored (Server VAD enabled)")
-
-                            elif msg_type == "close":
-                                logger.info(f"🔌 Client requested close: {user_id}")
-                                break
-                            else:
-                                logger.warning(f"⚠️ Unknown message type: {msg_type}")
-                        except json.JSONDecodeError:
-                            logger.warning(f"⚠️ Invalid JSON: {text_data[:100]}")
+                    text_data = data.get("text")
+                    if text_data is not None:
+                        if not await self.handle_control_message(user_id, text_data):
+                            break
 
                 except WebSocketDisconnect:
                     logger.info(f"🔌 WebSocket disconnected (exception): {user_id}")
@@ -381,6 +513,8 @@ class VoiceRealtimeHandler:
                     break
 
             # 정리
+            if self.flush_task and not self.flush_task.done():
+                self.flush_task.cancel()
             try:
                 event_task.cancel()
                 await event_task  # 태스크가 완전히 종료될 때까지 대기
@@ -413,7 +547,6 @@ async def websocket_voice_endpoint(
     websocket: WebSocket,
     user_identifier: str,
     character_id: str = None,  # Query parameter로 페르소나 선택
-    db: Session = Depends(get_db)
 ):
     """
     OpenAI Realtime API 음성 WebSocket 엔드포인트
@@ -451,8 +584,11 @@ async def websocket_voice_endpoint(
     from app.utils.user_utils import get_user_uuid_by_identifier
 
     # user_identifier(email 또는 UUID)를 서버 DB UUID로 변환
+    # (DB / Supabase 조회가 이벤트 루프를 막지 않도록 스레드풀에서 실행)
     try:
-        user_uuid = get_user_uuid_by_identifier(db, user_identifier)
+        user_uuid = await asyncio.to_thread(
+            run_in_session, get_user_uuid_by_identifier, user_identifier
+        )
         user_id = str(user_uuid)  # UUID를 문자열로 변환
     except Exception as e:
         logger.error(f"❌ Invalid user_identifier: {user_identifier}, error: {str(e)}")
@@ -463,5 +599,5 @@ async def websocket_voice_endpoint(
     # VOICE_MANUAL_COMMIT=true: 수동 커밋 (테스트용)
     # VOICE_MANUAL_COMMIT=false: Server VAD 자동 처리 (실제 서비스)
     use_manual_commit = os.getenv("VOICE_MANUAL_COMMIT", "true").lower() == "true"
-    handler = VoiceRealtimeHandler(db, use_manual_commit=use_manual_commit)
+    handler = VoiceRealtimeHandler(use_manual_commit=use_manual_commit)
     await handler.handle_websocket(websocket, user_id, character_id)
@@ -4,11 +4,12 @@
 import logging
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from datetime import datetime
 
 from app.config.db import get_db
-from app.services.weather_service import weather_service
+from app.services.weather_cache import get_combined_weather_cached
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/weather", tags=["Weather"])
@@ -31,7 +32,6 @@ async def get_current_weather(
     latitude: float = Query(..., description="위도"),
     longitude: float = Query(..., description="경도"),
     sido: str = Query("서울", description="시도 이름 (미세먼지 조회용)"),
-    db: Session = Depends(get_db)
 ):
     """
     현재 날씨 조회 (캐싱됨, 10분 유효)
@@ -42,8 +42,7 @@ async def get_current_weather(
         GET /api/weather/current?latitude=37.5665&longitude=126.9780&sido=서울
     """
     try:
-        weather_data = await weather_service.get_combined_weather(
-            db=db,
+        weather_data = await get_combined_weather_cached(
             latitude=latitude,
             longitude=longitude,
             sido_name=sido
@@ -74,21 +73,22 @@ async def get_home_weather(
         # user_identifier(email 또는 UUID)를 서버 DB UUID로 변환
         user_uuid = get_user_uuid_by_identifier(db, user_identifier)
 
-        # 사용자 집 위치 조회 (서버 DB UUID 사용)
-        location = db.query(UserLocation)\
-            .filter(UserLocation.user_id == user_uuid)\
-            .first()
+        # 사용자 집 위치 조회 (서버 DB UUID 사용, 좌표 두 컬럼만 조회)
+        row = db.execute(
+            select(UserLocation.home_latitude, UserLocation.home_longitude)
+            .where(UserLocation.user_id == user_uuid)
+        ).first()
+        latitude, longitude = row if row is not None else (None, None)
 
-        if not location or not location.home_latitude or not location.home_longitude:
+        if latitude is None or longitude is None:
             raise HTTPException(
                 status_code=404,
                 detail="사용자의 집 위치가 설정되지 않았습니다"
             )
 
-        weather_data = await weather_service.get_combined_weather(
-            db=db,
-            latitude=location.home_latitude,
-            longitude=location.home_longitude,
+        weather_data = await get_combined_weather_cached(
+            latitude=latitude,
+            longitude=longitude,
             sido_name="서울"  # TODO: 위도경도로부터 시도 이름 추출
         )
 
@@ -2,19 +2,66 @@ from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
-from app.config.env import DATABASE_URL
+from app.config.env import (
+    DATABASE_URL,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING,
+)
 
 SQLALCHEMY_DATABASE_URL = DATABASE_URL
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    # 가장 최근에 반납된 커넥션부터 재사용 (캐시가 데워진 백엔드 유지, 남는 overflow 는 자연히 정리)
+    pool_use_lifo=True,
+    # 끊어진 커넥션 재사용 방지는 체크아웃마다 핑하는 대신 주기적 재연결로 처리
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=DB_POOL_PRE_PING,
+    # 업서트는 INSERT ... ON CONFLICT 단일 문장이라 READ COMMITTED 로 충분
+    # (서버/역할 기본값이 REPEATABLE READ 여도 행 잠금 범위를 문장 단위로 유지)
+    isolation_level="READ COMMITTED",
+    # psycopg2 executemany: INSERT는 multi-VALUES로, UPDATE/DELETE는 execute_batch로 묶어서 전송
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=1000,
+    executemany_batch_page_size=500,
+)
+# expire_on_commit=False: commit 후 응답 직렬화 시 객체 재조회(SELECT) 방지
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 
 # for dependency
 def get_db():
+    """
+    요청 단위 세션 (Unit of Work)
+    - CRUD를 commit=False로 호출한 경우 요청이 정상 종료될 때 한 번에 커밋
+    - 예외 발생 시 롤백
+    """
     db = SessionLocal()
     try:
         yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def run_in_session(fn, *args, **kwargs):
+    """
+    새 DB 세션으로 동기 함수 실행 (asyncio.to_thread 와 함께 사용)
+    - 호출마다 세션을 따로 열어 스레드 간 Session 공유를 피하고,
+      await 동안 커넥션을 붙잡지 않도록 조회가 끝나면 바로 반납
+    """
+    db = SessionLocal()
+    try:
+        return fn(db, *args, **kwargs)
     finally:
         db.close()
 
@@ -4,4 +4,14 @@ from dotenv import load_dotenv
 load_dotenv()
 
 DATABASE_URL = os.environ.get("DATABASE_URL")
-DEBUG = os.environ.get("DEBUG") == "True"
\ No newline at end of file
+DEBUG = os.environ.get("DEBUG") == "True"
+# DB 커넥션 풀 설정 (음성 WebSocket 동시 접속 대비)
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.environ.get("DB_POOL_TIMEOUT", "30"))
+# 이 시간(초)보다 오래된 커넥션은 체크아웃 시 새로 연결 (서버/프록시 유휴 종료 대비)
+DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", "1800"))
+# 체크아웃마다 SELECT 1 핑 (커넥션이 자주 끊기는 환경에서만 켬)
+DB_POOL_PRE_PING = os.environ.get("DB_POOL_PRE_PING", "false").lower() == "true"
+# 동기 엔드포인트 / CRUD 를 실행하는 스레드풀 크기 (AnyIO 기본값 40)
+THREADPOOL_SIZE = int(os.environ.get("THREADPOOL_SIZE", "100"))
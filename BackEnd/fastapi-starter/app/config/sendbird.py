@@ -3,7 +3,9 @@ Sendbird 설정 및 상수
 """
 
 import os
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 
 class SendbirdConfig:
@@ -24,22 +26,29 @@ class SendbirdConfig:
     CHAT_API_BASE: str = f"https://api-{APP_ID}.sendbird.com/v3"
     CALLS_API_BASE: str = f"https://api-{APP_ID}.calls.sendbird.com/v1"
 
+    # API 헤더 (요청마다 dict를 새로 만들지 않도록 한 번만 생성, 읽기 전용)
+    CHAT_HEADERS: Mapping[str, str] = MappingProxyType(
+        {"Content-Type": "application/json", "Api-Token": API_TOKEN}
+    )
+    CALLS_HEADERS: Mapping[str, str] = CHAT_HEADERS  # Chat / Calls 헤더 내용 동일
+
     # Geofence 설정
     HOME_LATITUDE: float = float(os.getenv("HOME_LATITUDE", "37.5665"))
     HOME_LONGITUDE: float = float(os.getenv("HOME_LONGITUDE", "126.9780"))
     GEOFENCE_RADIUS_METERS: float = float(os.getenv("GEOFENCE_RADIUS", "100.0"))
 
     @classmethod
-    def get_chat_headers(cls) -> dict:
+    def get_chat_headers(cls) -> Mapping[str, str]:
         """Chat API 헤더"""
-        return {"Content-Type": "application/json", "Api-Token": cls.API_TOKEN}
+        return cls.CHAT_HEADERS
 
     @classmethod
-    def get_calls_headers(cls) -> dict:
+    def get_calls_headers(cls) -> Mapping[str, str]:
         """Calls API 헤더"""
-        return {"Content-Type": "application/json", "Api-Token": cls.API_TOKEN}
+        return cls.CALLS_HEADERS
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def get_channel_url(cls, user_id: str) -> str:
         """채널 URL 생성"""
         return f"chat_{user_id}_{cls.AI_USER_ID}"
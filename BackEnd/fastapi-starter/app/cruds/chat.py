@@ -2,14 +2,21 @@
 """
 채팅 세션 및 메시지 CRUD 연산
 """
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any
 from uuid import UUID
 from datetime import datetime
 
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import delete, desc, func, select, update
+from sqlalchemy.orm import aliased
 
 from app.models.chat import ChatSession, ChatMessage
+from app.utils.ttl_cache import TTLCache
+
+
+# (user_id, persona_id) → 활성 세션 ID
+# 매 턴마다 반복되는 "최근 활성 세션" ORDER BY 조회를 건너뛰기 위한 프로세스 로컬 레지스트리
+_session_registry = TTLCache(maxsize=10_000, ttl=60.0)
 
 
 def get_or_create_session(
@@ -23,7 +30,25 @@ def get_or_create_session(
 
     - 같은 user_id + persona_id 조합의 활성 세션이 있으면 재사용
     - 없으면 새로 생성
+    - 최근에 확인한 세션은 레지스트리에서 찾아 UPDATE ... RETURNING 한 번으로 처리
     """
+    key = (user_id, persona_id)
+
+    cached_id = _session_registry.get(key)
+    if cached_id is not None:
+        session = db.scalars(
+            update(ChatSession)
+            .where(ChatSession.id == cached_id, ChatSession.is_active == True)
+            .values(last_message_at=datetime.utcnow())
+            .returning(ChatSession)
+            .execution_options(synchronize_session=False)
+        ).first()
+        if session is not None:
+            db.commit()
+            return session
+        # 그 사이 비활성화/삭제된 세션: 레지스트리에서 빼고 일반 경로로 조회
+        _session_registry.delete(key)
+
     # 활성 세션 조회
     session = db.query(ChatSession).filter(
         ChatSession.user_id == user_id,
@@ -35,7 +60,7 @@ def get_or_create_session(
         # 기존 세션의 last_message_at 갱신
         session.last_message_at = datetime.utcnow()
         db.commit()
-        db.refresh(session)
+        _session_registry.set(key, session.id)
         return session
 
     # 새 세션 생성
@@ -46,7 +71,7 @@ def get_or_create_session(
     )
     db.add(new_session)
     db.commit()
-    db.refresh(new_session)
+    _session_registry.set(key, new_session.id)
     return new_session
 
 
@@ -84,13 +109,14 @@ def save_message(
 
     db.add(message)
 
-    # 세션의 last_message_at 갱신
-    session = db.query(ChatSession).filter(ChatSession.id == session_id).first()
-    if session:
-        session.last_message_at = datetime.utcnow()
+    # 세션의 last_message_at 갱신 (세션 로드 없이 단일 UPDATE)
+    db.execute(
+        update(ChatSession)
+        .where(ChatSession.id == session_id)
+        .values(last_message_at=datetime.utcnow())
+    )
 
     db.commit()
-    db.refresh(message)
     return message
 
 
@@ -100,13 +126,59 @@ def get_session_messages(
     limit: int = 50
 ) -> List[ChatMessage]:
     """
-    세션의 메시지 목록 조회 (최근 순)
+    세션의 최근 메시지 limit 개 조회 (시간 순으로 반환)
+      - (session_id, created_at) 인덱스를 역방향으로 읽어 최신 limit 개만 가져옴
     """
-    messages = db.query(ChatMessage).filter(
-        ChatMessage.session_id == session_id
-    ).order_by(ChatMessage.created_at).limit(limit).all()
+    messages = db.scalars(
+        select(ChatMessage)
+        .where(ChatMessage.session_id == session_id)
+        .order_by(desc(ChatMessage.created_at))
+        .limit(limit)
+    ).all()
 
-    return messages
+    return list(reversed(messages))
+
+
+def get_recent_messages_by_sessions(
+    db: Session,
+    session_ids: Iterable[UUID],
+    limit_per_session: int = 50
+) -> Dict[UUID, List[ChatMessage]]:
+    """
+    여러 세션의 최근 메시지를 한 번에 조회 (세션별 최대 limit_per_session 개, 시간 순)
+
+    - 세션마다 messages 관계를 로드하면 전체 히스토리를 세션 수만큼 읽게 되므로
+      row_number() OVER (PARTITION BY session_id ORDER BY created_at DESC) 로
+      세션별 상위 N 개만 한 문장으로 가져옴
+    """
+    session_ids = list(session_ids)
+    if not session_ids:
+        return {}
+
+    ranked = (
+        select(
+            ChatMessage,
+            func.row_number()
+            .over(
+                partition_by=ChatMessage.session_id,
+                order_by=desc(ChatMessage.created_at),
+            )
+            .label("rn"),
+        )
+        .where(ChatMessage.session_id.in_(session_ids))
+        .subquery()
+    )
+    recent = aliased(ChatMessage, ranked)
+
+    messages_by_session: Dict[UUID, List[ChatMessage]] = {sid: [] for sid in session_ids}
+    for message in db.scalars(
+        select(recent)
+        .where(ranked.c.rn <= limit_per_session)
+        .order_by(recent.session_id, recent.created_at)
+    ):
+        messages_by_session[message.session_id].append(message)
+
+    return messages_by_session
 
 
 def get_user_sessions(
@@ -129,27 +201,36 @@ def get_user_sessions(
 
 def close_session(db: Session, session_id: UUID) -> bool:
     """
-    세션 비활성화
+    세션 비활성화 (단일 UPDATE)
     """
-    session = db.query(ChatSession).filter(ChatSession.id == session_id).first()
-
-    if not session:
-        return False
-
-    session.is_active = False
+    row = db.execute(
+        update(ChatSession)
+        .where(ChatSession.id == session_id)
+        .values(is_active=False)
+        .returning(ChatSession.user_id, ChatSession.persona_id)
+        .execution_options(synchronize_session=False)
+    ).first()
     db.commit()
+    if row is None:
+        return False
+    # 레지스트리 키 (user_id, persona_id) 로 바로 제거
+    _session_registry.delete((row.user_id, row.persona_id))
     return True
 
 
 def delete_session(db: Session, session_id: UUID) -> bool:
     """
-    세션 삭제 (메시지도 함께 cascade 삭제)
+    세션 삭제 (단일 DELETE, 메시지는 FK ON DELETE CASCADE로 함께 삭제)
     """
-    session = db.query(ChatSession).filter(ChatSession.id == session_id).first()
-
-    if not session:
-        return False
-
-    db.delete(session)
+    row = db.execute(
+        delete(ChatSession)
+        .where(ChatSession.id == session_id)
+        .returning(ChatSession.user_id, ChatSession.persona_id)
+        .execution_options(synchronize_session=False)
+    ).first()
     db.commit()
+    if row is None:
+        return False
+    # 레지스트리 키 (user_id, persona_id) 로 바로 제거
+    _session_registry.delete((row.user_id, row.persona_id))
     return True
@@ -1,9 +1,10 @@
 # app/cruds/info.py
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Type, Union
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, bindparam, delete, lambda_stmt, select, update
+from sqlalchemy.orm import Session, raiseload, selectinload
 
 from app.models.info import (
     Appliance,
@@ -25,6 +26,8 @@ from app.schemas.info import (
     CharacterCreate,
     CharacterUpdate,
 )
+from app.utils.db_utils import bulk_insert, commit_or_flush, pg_upsert
+from app.utils.ttl_cache import TTLCache
 
 # ============================================================
 # Appliance CRUD
@@ -33,14 +36,14 @@ from app.schemas.info import (
 def create_appliance(
     db: Session,
     appliance_in: ApplianceCreate,
+    commit: bool = True,
 ) -> Appliance:
     """
     가전(Appliance) 생성
     """
     db_obj = Appliance(**appliance_in.model_dump())
     db.add(db_obj)
-    db.commit()
-    db.refresh(db_obj)
+    commit_or_flush(db, commit)
     return db_obj
 
 
@@ -51,11 +54,7 @@ def get_appliance(
     """
     appliance_id로 단일 가전 조회
     """
-    return (
-        db.query(Appliance)
-        .filter(Appliance.id == appliance_id)
-        .first()
-    )
+    return db.get(Appliance, appliance_id)
 
 
 def get_appliances_by_user(
@@ -69,80 +68,171 @@ def get_appliances_by_user(
     특정 유저의 가전 목록 조회
       - appliance_code로 필터링 가능 (예: 'AC', 'TV', ...)
     """
-    query = db.query(Appliance).filter(Appliance.user_id == user_id)
+    # 1:1 config 들은 selectinload 로 한 번에 로드 (가전 수만큼 추가 SELECT 방지)
+    stmt = lambda_stmt(
+        lambda: select(Appliance)
+        .options(
+            selectinload(Appliance.air_conditioner_config),
+            selectinload(Appliance.tv_config),
+            selectinload(Appliance.air_purifier_config),
+            selectinload(Appliance.light_config),
+            selectinload(Appliance.humidifier_config),
+        )
+        .where(Appliance.user_id == user_id)
+    )
 
     if appliance_code is not None:
-        query = query.filter(Appliance.appliance_code == appliance_code)
+        stmt += lambda s: s.where(Appliance.appliance_code == appliance_code)
 
-    return query.offset(skip).limit(limit).all()
+    stmt += lambda s: s.offset(skip).limit(limit)
+    return list(db.scalars(stmt))
 
 
 def delete_appliance(
     db: Session,
     appliance_id: UUID,
+    commit: bool = True,
 ) -> bool:
     """
     가전 삭제
       - 성공 시 True, 대상 없으면 False
     """
-    db_obj = (
-        db.query(Appliance)
-        .filter(Appliance.id == appliance_id)
-        .first()
+    # cascade 삭제 대상인 1:1 config 들을 함께 로드 (config 마다 SELECT 방지)
+    db_obj = db.get(
+        Appliance,
+        appliance_id,
+        options=[
+            selectinload(Appliance.air_conditioner_config),
+            selectinload(Appliance.tv_config),
+            selectinload(Appliance.air_purifier_config),
+            selectinload(Appliance.light_config),
+            selectinload(Appliance.humidifier_config),
+        ],
     )
     if db_obj is None:
         return False
 
     db.delete(db_obj)
-    db.commit()
+    commit_or_flush(db, commit)
+    # 설정은 cascade 로 함께 삭제되므로 캐시도 비움
+    for model in CONFIG_MODEL_BY_SCHEMA.values():
+        _config_cache.delete((model.__tablename__, appliance_id))
     return True
 
 
 # ============================================================
 # Config 업서트(1:1) 헬퍼들
-#   - 이미 있으면 UPDATE, 없으면 CREATE
+#   - 이미 있으면 UPDATE, 없으면 CREATE (INSERT ... ON CONFLICT 한 문장)
+#   - 가전 종류별 함수는 스키마 → 모델 매핑으로 공통 함수에 위임
 # ============================================================
 
-# ---------- AirConditionerConfig ----------
+ConfigModel = Union[
+    AirConditionerConfig, TvConfig, AirPurifierConfig, LightConfig, HumidifierConfig
+]
+ConfigCreate = Union[
+    AirConditionerConfigCreate,
+    TvConfigCreate,
+    AirPurifierConfigCreate,
+    LightConfigCreate,
+    HumidifierConfigCreate,
+]
 
-def upsert_air_conditioner_config(
+CONFIG_MODEL_BY_SCHEMA: Dict[Type[ConfigCreate], Type[ConfigModel]] = {
+    AirConditionerConfigCreate: AirConditionerConfig,
+    TvConfigCreate: TvConfig,
+    AirPurifierConfigCreate: AirPurifierConfig,
+    LightConfigCreate: LightConfig,
+    HumidifierConfigCreate: HumidifierConfig,
+}
+
+# appliance_id(UNIQUE) 조회문은 모델별로 한 번만 만들어 두고 파라미터만 바꿔 실행
+_CONFIG_BY_APPLIANCE_STMTS = {
+    model: select(model).where(model.appliance_id == bindparam("appliance_id"))
+    for model in CONFIG_MODEL_BY_SCHEMA.values()
+}
+
+# 모델별 실제 컬럼명 (스키마에만 있는 필드를 걸러내 INSERT 값으로 사용)
+_CONFIG_COLUMNS = {
+    model: frozenset(column.name for column in model.__table__.columns)
+    for model in CONFIG_MODEL_BY_SCHEMA.values()
+}
+
+# (테이블명, appliance_id) → 설정 객체. 설정은 거의 바뀌지 않고 키 개수도 가전 수로 제한됨
+_config_cache = TTLCache(maxsize=4096, ttl=300.0)
+
+
+def upsert_config(
     db: Session,
-    cfg_in: AirConditionerConfigCreate,
-) -> AirConditionerConfig:
+    cfg_in: ConfigCreate,
+    commit: bool = True,
+    as_orm: bool = False,
+) -> Union[ConfigModel, Row]:
     """
-    에어컨 설정 업서트
+    가전 설정 업서트 (스키마 타입으로 대상 모델 결정)
       - appliance_id 기준 1:1
-      - 존재하면 필드 업데이트, 없으면 새로 생성
+      - 존재하면 보낸 필드만 업데이트, 없으면 새로 생성
+      - 기본은 테이블에 Core 문장으로 실행하고 Row 반환 (응답 직렬화에는 충분)
+      - ORM 객체가 필요하면 as_orm=True
     """
-    db_obj = (
-        db.query(AirConditionerConfig)
-        .filter(AirConditionerConfig.appliance_id == cfg_in.appliance_id)
-        .first()
+    model = CONFIG_MODEL_BY_SCHEMA[type(cfg_in)]
+    columns = _CONFIG_COLUMNS[model]
+    values = {k: v for k, v in cfg_in.model_dump().items() if k in columns}
+    db_obj = pg_upsert(
+        db,
+        model,
+        values,
+        ["appliance_id"],
+        # UPDATE 시에는 요청에 포함된 필드만 갱신 (기본값으로 덮어쓰지 않음)
+        update_values={
+            k: v
+            for k, v in cfg_in.model_dump(exclude_unset=True).items()
+            if k in columns
+        },
+        commit=commit,
+        as_orm=as_orm,
     )
+    _config_cache.delete((model.__tablename__, cfg_in.appliance_id))
+    return db_obj
 
-    data = cfg_in.model_dump()
 
-    if db_obj is None:
-        db_obj = AirConditionerConfig(**data)
-        db.add(db_obj)
-    else:
-        for field, value in data.items():
-            setattr(db_obj, field, value)
-
-    db.commit()
-    db.refresh(db_obj)
+def get_config_by_appliance(
+    db: Session,
+    model: Type[ConfigModel],
+    appliance_id: UUID,
+) -> Optional[ConfigModel]:
+    """
+    appliance_id로 가전 설정 조회
+    """
+    key = (model.__tablename__, appliance_id)
+    cached = _config_cache.get(key)
+    if cached is not None:
+        return cached
+
+    stmt = _CONFIG_BY_APPLIANCE_STMTS[model]
+    db_obj = db.scalars(stmt, {"appliance_id": appliance_id}).first()
+    if db_obj is not None:
+        # 세션에서 분리한 뒤 캐시 (요청 간 읽기 전용으로 공유)
+        db.expunge(db_obj)
+        _config_cache.set(key, db_obj)
     return db_obj
 
 
+# ---------- AirConditionerConfig ----------
+
+def upsert_air_conditioner_config(
+    db: Session,
+    cfg_in: AirConditionerConfigCreate,
+    commit: bool = True,
+) -> Union[AirConditionerConfig, Row]:
+    """에어컨 설정 업서트"""
+    return upsert_config(db, cfg_in, commit=commit)
+
+
 def get_air_conditioner_config_by_appliance(
     db: Session,
     appliance_id: UUID,
 ) -> Optional[AirConditionerConfig]:
-    return (
-        db.query(AirConditionerConfig)
-        .filter(AirConditionerConfig.appliance_id == appliance_id)
-        .first()
-    )
+    return get_config_by_appliance(db, AirConditionerConfig, appliance_id)
 
 
 # ---------- TvConfig ----------
@@ -150,39 +240,17 @@ def get_air_conditioner_config_by_appliance(
 def upsert_tv_config(
     db: Session,
     cfg_in: TvConfigCreate,
-) -> TvConfig:
-    """
-    TV 설정 업서트
-    """
-    db_obj = (
-        db.query(TvConfig)
-        .filter(TvConfig.appliance_id == cfg_in.appliance_id)
-        .first()
-    )
-
-    data = cfg_in.model_dump()
-
-    if db_obj is None:
-        db_obj = TvConfig(**data)
-        db.add(db_obj)
-    else:
-        for field, value in data.items():
-            setattr(db_obj, field, value)
-
-    db.commit()
-    db.refresh(db_obj)
-    return db_obj
+    commit: bool = True,
+) -> Union[TvConfig, Row]:
+    """TV 설정 업서트"""
+    return upsert_config(db, cfg_in, commit=commit)
 
 
 def get_tv_config_by_appliance(
     db: Session,
     appliance_id: UUID,
 ) -> Optional[TvConfig]:
-    return (
-        db.query(TvConfig)
-        .filter(TvConfig.appliance_id == appliance_id)
-        .first()
-    )
+    return get_config_by_appliance(db, TvConfig, appliance_id)
 
 
 # ---------- AirPurifierConfig ----------
@@ -190,39 +258,17 @@ def get_tv_config_by_appliance(
 def upsert_air_purifier_config(
     db: Session,
     cfg_in: AirPurifierConfigCreate,
-) -> AirPurifierConfig:
-    """
-    공기청정기 설정 업서트
-    """
-    db_obj = (
-        db.query(AirPurifierConfig)
-        .filter(AirPurifierConfig.appliance_id == cfg_in.appliance_id)
-        .first()
-    )
-
-    data = cfg_in.model_dump()
-
-    if db_obj is None:
-        db_obj = AirPurifierConfig(**data)
-        db.add(db_obj)
-    else:
-        for field, value in data.items():
-            setattr(db_obj, field, value)
-
-    db.commit()
-    db.refresh(db_obj)
-    return db_obj
+    commit: bool = True,
+) -> Union[AirPurifierConfig, Row]:
+    """공기청정기 설정 업서트"""
+    return upsert_config(db, cfg_in, commit=commit)
 
 
 def get_air_purifier_config_by_appliance(
     db: Session,
     appliance_id: UUID,
 ) -> Optional[AirPurifierConfig]:
-    return (
-        db.query(AirPurifierConfig)
-        .filter(AirPurifierConfig.appliance_id == appliance_id)
-        .first()
-    )
+    return get_config_by_appliance(db, AirPurifierConfig, appliance_id)
 
 
 # ---------- LightConfig ----------
@@ -230,39 +276,17 @@ def get_air_purifier_config_by_appliance(
 def upsert_light_config(
     db: Session,
     cfg_in: LightConfigCreate,
-) -> LightConfig:
-    """
-    조명 설정 업서트
-    """
-    db_obj = (
-        db.query(LightConfig)
-        .filter(LightConfig.appliance_id == cfg_in.appliance_id)
-        .first()
-    )
-
-    data = cfg_in.model_dump()
-
-    if db_obj is None:
-        db_obj = LightConfig(**data)
-        db.add(db_obj)
-    else:
-        for field, value in data.items():
-            setattr(db_obj, field, value)
-
-    db.commit()
-    db.refresh(db_obj)
-    return db_obj
+    commit: bool = True,
+) -> Union[LightConfig, Row]:
+    """조명 설정 업서트"""
+    return upsert_config(db, cfg_in, commit=commit)
 
 
 def get_light_config_by_appliance(
     db: Session,
     appliance_id: UUID,
 ) -> Optional[LightConfig]:
-    return (
-        db.query(LightConfig)
-        .filter(LightConfig.appliance_id == appliance_id)
-        .first()
-    )
+    return get_config_by_appliance(db, LightConfig, appliance_id)
 
 
 # ---------- HumidifierConfig ----------
@@ -270,39 +294,17 @@ def get_light_config_by_appliance(
 def upsert_humidifier_config(
     db: Session,
     cfg_in: HumidifierConfigCreate,
-) -> HumidifierConfig:
-    """
-    가습기 설정 업서트
-    """
-    db_obj = (
-        db.query(HumidifierConfig)
-        .filter(HumidifierConfig.appliance_id == cfg_in.appliance_id)
-        .first()
-    )
-
-    data = cfg_in.model_dump()
-
-    if db_obj is None:
-        db_obj = HumidifierConfig(**data)
-        db.add(db_obj)
-    else:
-        for field, value in data.items():
-            setattr(db_obj, field, value)
-
-    db.commit()
-    db.refresh(db_obj)
-    return db_obj
+    commit: bool = True,
+) -> Union[HumidifierConfig, Row]:
+    """가습기 설정 업서트"""
+    return upsert_config(db, cfg_in, commit=commit)
 
 
 def get_humidifier_config_by_appliance(
     db: Session,
     appliance_id: UUID,
 ) -> Optional[HumidifierConfig]:
-    return (
-        db.query(HumidifierConfig)
-        .filter(HumidifierConfig.appliance_id == appliance_id)
-        .first()
-    )
+    return get_config_by_appliance(db, HumidifierConfig, appliance_id)
 
 
 # ============================================================
@@ -312,6 +314,7 @@ def get_humidifier_config_by_appliance(
 def create_character(
     db: Session,
     character_in: CharacterCreate,
+    commit: bool = True,
 ) -> Character:
     """
     캐릭터 생성
@@ -319,11 +322,23 @@ def create_character(
     """
     db_obj = Character(**character_in.model_dump())
     db.add(db_obj)
-    db.commit()
-    db.refresh(db_obj)
+    commit_or_flush(db, commit)
     return db_obj
 
 
+def bulk_create_characters(
+    db: Session,
+    characters_in: List[CharacterCreate],
+    commit: bool = True,
+) -> List[Character]:
+    """
+    캐릭터 여러 개를 한 번의 INSERT / 커밋으로 생성
+    """
+    return bulk_insert(
+        db, Character, [c.model_dump() for c in characters_in], commit=commit
+    )
+
+
 def get_character(
     db: Session,
     character_id: UUID,
@@ -331,73 +346,68 @@ def get_character(
     """
     character_id로 캐릭터 단건 조회
     """
-    return (
-        db.query(Character)
-        .filter(Character.id == character_id)
-        .first()
-    )
+    return db.get(Character, character_id)
 
 
 def get_characters_by_user(
     db: Session,
     user_id: UUID,
-    skip: int = 0,
+    after_id: Optional[UUID] = None,
     limit: int = 100,
 ) -> List[Character]:
     """
     특정 유저(user_id)의 캐릭터 리스트 조회
+      - 키셋 페이지네이션: after_id 이후(id 순)부터 limit 개
     """
-    return (
-        db.query(Character)
-        .filter(Character.user_id == user_id)
-        .offset(skip)
-        .limit(limit)
-        .all()
+    stmt = lambda_stmt(
+        lambda: select(Character)
+        .options(raiseload("*"))
+        .where(Character.user_id == user_id)
     )
+    if after_id is not None:
+        stmt += lambda s: s.where(Character.id > after_id)
+    stmt += lambda s: s.order_by(Character.id).limit(limit)
+    return list(db.scalars(stmt))
 
 
 def update_character(
     db: Session,
     character_id: UUID,
     character_in: CharacterUpdate,
+    commit: bool = True,
 ) -> Optional[Character]:
     """
     캐릭터 정보 수정 (닉네임 / 페르소나 부분 업데이트)
+      - PK 기준 UPDATE ... RETURNING 한 문장 (대상 없으면 None)
     """
-    db_obj = (
-        db.query(Character)
-        .filter(Character.id == character_id)
-        .first()
-    )
-    if db_obj is None:
-        return None
-
     update_data = character_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_obj, field, value)
-
-    db.add(db_obj)
-    db.commit()
-    db.refresh(db_obj)
+    if not update_data:
+        return get_character(db, character_id)
+
+    db_obj = db.scalars(
+        update(Character)
+        .where(Character.id == character_id)
+        .values(**update_data)
+        .returning(Character)
+        .execution_options(populate_existing=True)
+    ).one_or_none()
+    commit_or_flush(db, commit)
     return db_obj
 
 
 def delete_character(
     db: Session,
     character_id: UUID,
+    commit: bool = True,
 ) -> bool:
     """
-    캐릭터 삭제
+    캐릭터 삭제 (PK 기준 단일 DELETE)
       - 삭제 성공 시 True, 대상 없으면 False
     """
-    db_obj = (
-        db.query(Character)
-        .filter(Character.id == character_id)
-        .first()
+    result = db.execute(
+        delete(Character)
+        .where(Character.id == character_id)
+        .execution_options(synchronize_session=False)
     )
-    if db_obj is None:
-        return False
-
-    db.delete(db_obj)
-    db.commit()
-    return True
+    commit_or_flush(db, commit)
+    return result.rowcount > 0
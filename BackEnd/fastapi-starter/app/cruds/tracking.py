@@ -1,14 +1,16 @@
 # app/cruds/tracking.py
 from datetime import datetime
 from uuid import UUID
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, bindparam, lambda_stmt, select
+from sqlalchemy.orm import Session, raiseload
 
 from app.models.tracking import (
     Place,
     TimeSlot,
     WeatherObservation,
+    WeatherObservationRaw,
     SleepSession,
     WorkoutSession,
     HealthHourly,
@@ -21,35 +23,77 @@ from app.schemas.tracking import (
     WorkoutSessionCreate,
     HealthHourlyCreate,
 )
+from app.utils.db_utils import (
+    bulk_insert,
+    commit_or_flush,
+    core_insert_one,
+    pg_upsert,
+    pg_upsert_many,
+)
 
 
 # ---------- Place ----------
 
-def create_place(db: Session, data: PlaceCreate) -> Place:
+def create_place(db: Session, data: PlaceCreate, commit: bool = True) -> Place:
     db_place = Place(**data.model_dump())
     db.add(db_place)
-    db.commit()
-    db.refresh(db_place)
+    commit_or_flush(db, commit)
     return db_place
 
 
+def bulk_create_places(
+    db: Session,
+    items: List[PlaceCreate],
+    commit: bool = True,
+) -> List[Place]:
+    return bulk_insert(
+        db, Place, [item.model_dump() for item in items], commit=commit
+    )
+
+
 def get_places_by_user(db: Session, user_id: UUID) -> List[Place]:
-    return (
-        db.query(Place)
-        .filter(Place.user_id == user_id)
+    # 목록 조회 결과는 컬럼만 직렬화하므로 관계 지연 로딩(N+1)은 raiseload 로 차단
+    stmt = lambda_stmt(
+        lambda: select(Place)
+        .options(raiseload("*"))
+        .where(Place.user_id == user_id)
         .order_by(Place.first_seen.asc().nullsfirst())
-        .all()
     )
+    return list(db.scalars(stmt))
 
 
 # ---------- TimeSlot ----------
 
-def create_time_slot(db: Session, data: TimeSlotCreate) -> TimeSlot:
-    db_slot = TimeSlot(**data.model_dump())
-    db.add(db_slot)
-    db.commit()
-    db.refresh(db_slot)
-    return db_slot
+# 기간 조회문은 모듈 로드 시 한 번만 만들고 user_id / start / end 파라미터만 바꿔 실행
+_TIME_SLOTS_RANGE_STMT = (
+    select(TimeSlot)
+    .options(raiseload("*"))
+    .where(
+        TimeSlot.user_id == bindparam("user_id"),
+        TimeSlot.ts_hour >= bindparam("start"),
+        TimeSlot.ts_hour < bindparam("end"),
+    )
+    .order_by(TimeSlot.ts_hour.asc())
+)
+_TIME_SLOTS_PAGE_STMT = _TIME_SLOTS_RANGE_STMT.limit(bindparam("limit"))
+_TIME_SLOTS_PAGE_AFTER_STMT = _TIME_SLOTS_RANGE_STMT.where(
+    TimeSlot.ts_hour > bindparam("cursor")
+).limit(bindparam("limit"))
+
+
+def create_time_slot(db: Session, data: TimeSlotCreate, commit: bool = True) -> Row:
+    # 매시간 유저별로 쌓이는 쓰기 경로라 ORM 대신 Core INSERT ... RETURNING 사용
+    return core_insert_one(db, TimeSlot, data.model_dump(), commit=commit)
+
+
+def bulk_create_time_slots(
+    db: Session,
+    items: List[TimeSlotCreate],
+    commit: bool = True,
+) -> List[TimeSlot]:
+    return bulk_insert(
+        db, TimeSlot, [item.model_dump() for item in items], commit=commit
+    )
 
 
 def get_time_slots_for_user_range(
@@ -57,16 +101,32 @@ def get_time_slots_for_user_range(
     user_id: UUID,
     start: datetime,
     end: datetime,
+    limit: int = 1000,
+    cursor: Optional[datetime] = None,
 ) -> List[TimeSlot]:
-    return (
-        db.query(TimeSlot)
-        .filter(
-            TimeSlot.user_id == user_id,
-            TimeSlot.ts_hour >= start,
-            TimeSlot.ts_hour < end,
+    params = {"user_id": user_id, "start": start, "end": end, "limit": limit}
+    if cursor is None:
+        return list(db.scalars(_TIME_SLOTS_PAGE_STMT, params))
+    params["cursor"] = cursor
+    return list(db.scalars(_TIME_SLOTS_PAGE_AFTER_STMT, params))
+
+
+def iter_time_slots_for_user_range(
+    db: Session,
+    user_id: UUID,
+    start: datetime,
+    end: datetime,
+    batch_size: int = 1000,
+) -> Iterator[TimeSlot]:
+    """
+    기간 전체를 서버 사이드 커서로 batch_size 행씩 가져오며 순회 (스트리밍 응답용)
+    """
+    return iter(
+        db.scalars(
+            _TIME_SLOTS_RANGE_STMT,
+            {"user_id": user_id, "start": start, "end": end},
+            execution_options={"yield_per": batch_size},
         )
-        .order_by(TimeSlot.ts_hour.asc())
-        .all()
     )
 
 
@@ -75,41 +135,61 @@ def get_time_slots_for_user_range(
 def upsert_weather_observation(
     db: Session,
     data: WeatherObservationCreate,
+    commit: bool = True,
 ) -> WeatherObservation:
-    key = {
-        "nx": data.nx,
-        "ny": data.ny,
-        "as_of": data.as_of,
-        "provider": data.provider,
-    }
-    existing = db.query(WeatherObservation).get(
-        (data.nx, data.ny, data.as_of, data.provider)
+    key_cols = ["nx", "ny", "as_of", "provider"]
+    obs = pg_upsert(
+        db,
+        WeatherObservation,
+        data.model_dump(exclude={"raw_json"}),
+        key_cols,
+        update_values=data.model_dump(exclude_unset=True, exclude={"raw_json"}),
+        commit=False,
     )
-    if existing:
-        for field, value in data.model_dump(exclude_unset=True).items():
-            setattr(existing, field, value)
-        db.commit()
-        db.refresh(existing)
-        return existing
-
-    db_obs = WeatherObservation(**data.model_dump())
-    db.add(db_obs)
-    db.commit()
-    db.refresh(db_obs)
-    return db_obs
+    # 원본 응답은 사이드 테이블에 따로 저장 (요청에 포함된 경우만)
+    if "raw_json" in data.model_fields_set:
+        pg_upsert(
+            db,
+            WeatherObservationRaw,
+            data.model_dump(include={*key_cols, "raw_json"}),
+            key_cols,
+            commit=False,
+            as_orm=False,
+        )
+    commit_or_flush(db, commit)
+    return obs
 
 
 # ---------- SleepSession ----------
 
+_SLEEP_SESSIONS_RANGE_STMT = (
+    select(SleepSession)
+    .options(raiseload("*"))
+    .where(
+        SleepSession.user_id == bindparam("user_id"),
+        SleepSession.start_at >= bindparam("start"),
+        SleepSession.end_at <= bindparam("end"),
+    )
+    .order_by(SleepSession.start_at.asc())
+)
+
+
 def create_sleep_session(
     db: Session,
     data: SleepSessionCreate,
-) -> SleepSession:
-    db_session = SleepSession(**data.model_dump())
-    db.add(db_session)
-    db.commit()
-    db.refresh(db_session)
-    return db_session
+    commit: bool = True,
+) -> Row:
+    return core_insert_one(db, SleepSession, data.model_dump(), commit=commit)
+
+
+def bulk_create_sleep_sessions(
+    db: Session,
+    items: List[SleepSessionCreate],
+    commit: bool = True,
+) -> List[SleepSession]:
+    return bulk_insert(
+        db, SleepSession, [item.model_dump() for item in items], commit=commit
+    )
 
 
 def get_sleep_sessions_for_user_range(
@@ -118,29 +198,40 @@ def get_sleep_sessions_for_user_range(
     start: datetime,
     end: datetime,
 ) -> List[SleepSession]:
-    return (
-        db.query(SleepSession)
-        .filter(
-            SleepSession.user_id == user_id,
-            SleepSession.start_at >= start,
-            SleepSession.end_at <= end,
-        )
-        .order_by(SleepSession.start_at.asc())
-        .all()
-    )
+    params = {"user_id": user_id, "start": start, "end": end}
+    return list(db.scalars(_SLEEP_SESSIONS_RANGE_STMT, params))
 
 
 # ---------- WorkoutSession ----------
 
+_WORKOUT_SESSIONS_RANGE_STMT = (
+    select(WorkoutSession)
+    .options(raiseload("*"))
+    .where(
+        WorkoutSession.user_id == bindparam("user_id"),
+        WorkoutSession.start_at >= bindparam("start"),
+        WorkoutSession.end_at <= bindparam("end"),
+    )
+    .order_by(WorkoutSession.start_at.asc())
+)
+
+
 def create_workout_session(
     db: Session,
     data: WorkoutSessionCreate,
-) -> WorkoutSession:
-    db_session = WorkoutSession(**data.model_dump())
-    db.add(db_session)
-    db.commit()
-    db.refresh(db_session)
-    return db_session
+    commit: bool = True,
+) -> Row:
+    return core_insert_one(db, WorkoutSession, data.model_dump(), commit=commit)
+
+
+def bulk_create_workout_sessions(
+    db: Session,
+    items: List[WorkoutSessionCreate],
+    commit: bool = True,
+) -> List[WorkoutSession]:
+    return bulk_insert(
+        db, WorkoutSession, [item.model_dump() for item in items], commit=commit
+    )
 
 
 def get_workout_sessions_for_user_range(
@@ -149,44 +240,76 @@ def get_workout_sessions_for_user_range(
     start: datetime,
     end: datetime,
 ) -> List[WorkoutSession]:
-    return (
-        db.query(WorkoutSession)
-        .filter(
-            WorkoutSession.user_id == user_id,
-            WorkoutSession.start_at >= start,
-            WorkoutSession.end_at <= end,
-        )
-        .order_by(WorkoutSession.start_at.asc())
-        .all()
-    )
+    params = {"user_id": user_id, "start": start, "end": end}
+    return list(db.scalars(_WORKOUT_SESSIONS_RANGE_STMT, params))
 
 
 # ---------- HealthHourly ----------
 
+_HEALTH_HOURLY_RANGE_STMT = (
+    select(HealthHourly)
+    .options(raiseload("*"))
+    .where(
+        HealthHourly.user_id == bindparam("user_id"),
+        HealthHourly.ts_hour >= bindparam("start"),
+        HealthHourly.ts_hour < bindparam("end"),
+    )
+    .order_by(HealthHourly.ts_hour.asc())
+)
+_HEALTH_HOURLY_PAGE_STMT = _HEALTH_HOURLY_RANGE_STMT.limit(bindparam("limit"))
+_HEALTH_HOURLY_PAGE_AFTER_STMT = _HEALTH_HOURLY_RANGE_STMT.where(
+    HealthHourly.ts_hour > bindparam("cursor")
+).limit(bindparam("limit"))
+
+
 def upsert_health_hourly(
     db: Session,
     data: HealthHourlyCreate,
+    commit: bool = True,
 ) -> HealthHourly:
-    existing: Optional[HealthHourly] = (
-        db.query(HealthHourly)
-        .filter(
-            HealthHourly.user_id == data.user_id,
-            HealthHourly.ts_hour == data.ts_hour,
-        )
-        .first()
+    return pg_upsert(
+        db,
+        HealthHourly,
+        data.model_dump(),
+        ["user_id", "ts_hour"],
+        update_values=data.model_dump(exclude_unset=True),
+        commit=commit,
     )
-    if existing:
-        for field, value in data.model_dump(exclude_unset=True).items():
-            setattr(existing, field, value)
-        db.commit()
-        db.refresh(existing)
-        return existing
 
-    db_row = HealthHourly(**data.model_dump())
-    db.add(db_row)
-    db.commit()
-    db.refresh(db_row)
-    return db_row
+
+def bulk_upsert_health_hourly(
+    db: Session,
+    items: List[HealthHourlyCreate],
+    commit: bool = True,
+) -> List[HealthHourly]:
+    """
+    HealthKit 백필용 다건 업서트 (한 번의 커밋)
+    - 같은 (user_id, ts_hour) 가 여러 번 오면 마지막 값만 사용
+    - 충돌 시 각 행이 보낸 필드들만 갱신
+      (보낸 필드 조합이 같은 행끼리 묶어 조합마다 한 문장, 보통 1~2개)
+    """
+    latest = {(item.user_id, item.ts_hour): item for item in items}
+
+    groups: Dict[frozenset, List[HealthHourlyCreate]] = {}
+    for item in latest.values():
+        groups.setdefault(frozenset(item.model_fields_set), []).append(item)
+
+    upserted: Dict[int, HealthHourly] = {}
+    for fields_set, group in groups.items():
+        db_objs = pg_upsert_many(
+            db,
+            HealthHourly,
+            [item.model_dump() for item in group],
+            ["user_id", "ts_hour"],
+            update_cols=fields_set,
+            commit=False,
+        )
+        # RETURNING 은 입력 순서대로 오므로 요청 항목과 짝지어 둠
+        for item, db_obj in zip(group, db_objs):
+            upserted[id(item)] = db_obj
+    commit_or_flush(db, commit)
+    # 입력 순서 유지
+    return [upserted[id(item)] for item in latest.values()]
 
 
 def get_health_hourly_range(
@@ -194,14 +317,30 @@ def get_health_hourly_range(
     user_id: UUID,
     start: datetime,
     end: datetime,
+    limit: int = 1000,
+    cursor: Optional[datetime] = None,
 ) -> List[HealthHourly]:
-    return (
-        db.query(HealthHourly)
-        .filter(
-            HealthHourly.user_id == user_id,
-            HealthHourly.ts_hour >= start,
-            HealthHourly.ts_hour < end,
+    params = {"user_id": user_id, "start": start, "end": end, "limit": limit}
+    if cursor is None:
+        return list(db.scalars(_HEALTH_HOURLY_PAGE_STMT, params))
+    params["cursor"] = cursor
+    return list(db.scalars(_HEALTH_HOURLY_PAGE_AFTER_STMT, params))
+
+
+def iter_health_hourly_range(
+    db: Session,
+    user_id: UUID,
+    start: datetime,
+    end: datetime,
+    batch_size: int = 1000,
+) -> Iterator[HealthHourly]:
+    """
+    기간 전체를 서버 사이드 커서로 batch_size 행씩 가져오며 순회 (스트리밍 응답용)
+    """
+    return iter(
+        db.scalars(
+            _HEALTH_HOURLY_RANGE_STMT,
+            {"user_id": user_id, "start": start, "end": end},
+            execution_options={"yield_per": batch_size},
         )
-        .order_by(HealthHourly.ts_hour.asc())
-        .all()
     )
@@ -1,34 +1,66 @@
 # app/cruds/user.py
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, func, lambda_stmt, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, joinedload
 
 from app.models.user import User, UserPhone, UserDevice
 from app.schemas.user import UserCreate, UserPhoneCreate, UserDeviceCreate
+from app.utils.db_utils import pg_upsert
+from app.utils.ttl_cache import TTLCache
+
+
+# 자주 쓰는 단건 조회문은 모듈 로드 시 한 번만 만들어 두고 파라미터만 바꿔 실행
+# (lower(email) / user_id 모두 UNIQUE 인덱스로 조회)
+_USER_BY_EMAIL_STMT = select(User).where(func.lower(User.email) == bindparam("email"))
+_USER_PHONE_BY_USER_STMT = select(UserPhone).where(UserPhone.user_id == bindparam("user_id"))
+_USER_DEVICE_BY_USER_STMT = select(UserDevice).where(UserDevice.user_id == bindparam("user_id"))
+
+# user_id → 폰/워치 정보 (거의 바뀌지 않는 1:1 조회, 업서트 시 무효화)
+_user_phone_cache = TTLCache(maxsize=4096, ttl=300.0)
+_user_device_cache = TTLCache(maxsize=4096, ttl=300.0)
 
 
 # -----------------------------
 # User
 # -----------------------------
 def get_user(db: Session, user_id: UUID) -> User | None:
-    return db.query(User).filter(User.id == user_id).first()
+    return db.get(User, user_id)
 
 
-def get_user_by_email(db: Session, email: str) -> User | None:
-    return db.query(User).filter(User.email == email).first()
+def get_user_with_relations(db: Session, user_id: UUID) -> User | None:
+    """프로필 직렬화용: phone / device (1:1) 를 LEFT JOIN 으로 함께 로드"""
+    return db.get(
+        User,
+        user_id,
+        options=[joinedload(User.phone), joinedload(User.device)],
+    )
 
 
-def get_users(db: Session, skip: int = 0, limit: int = 100) -> list[User]:
-    return db.query(User).offset(skip).limit(limit).all()
+def get_user_by_email(db: Session, email: str) -> User | None:
+    # lower(email) 함수 인덱스(ix_users_email_lower)를 타도록 비교
+    return db.scalars(_USER_BY_EMAIL_STMT, {"email": email.lower()}).first()
 
 
-def create_user(db: Session, user: UserCreate) -> User:
-    db_user = User(
-        email=user.email,
+def get_users(db: Session, skip: int = 0, limit: int = 100) -> list[User]:
+    stmt = lambda_stmt(lambda: select(User).offset(skip).limit(limit))
+    return list(db.scalars(stmt))
+
+
+def create_user(db: Session, user: UserCreate) -> User | None:
+    """
+    INSERT ... ON CONFLICT (lower(email)) DO NOTHING RETURNING *
+    - 이미 등록된 이메일이면 None 반환 (조회 + 삽입을 한 번의 왕복으로 처리)
+    """
+    stmt = (
+        pg_insert(User)
+        .values(email=user.email)
+        .on_conflict_do_nothing(index_elements=[func.lower(User.email)])
+        .returning(User)
     )
-    db.add(db_user)
+    db_user = db.scalars(stmt).first()
     db.commit()
-    db.refresh(db_user)
     return db_user
 
 
@@ -36,43 +68,57 @@ def create_user(db: Session, user: UserCreate) -> User:
 # UserPhone
 # -----------------------------
 def get_user_phone(db: Session, user_id: UUID) -> UserPhone | None:
-    return db.query(UserPhone).filter(UserPhone.user_id == user_id).first()
-
-
-def create_or_update_user_phone(db: Session, data: UserPhoneCreate) -> UserPhone:
-    existing = get_user_phone(db, data.user_id)
-    if existing:
-        for field, value in data.model_dump(exclude_unset=True).items():
-            setattr(existing, field, value)
-        db.commit()
-        db.refresh(existing)
-        return existing
-
-    db_phone = UserPhone(**data.model_dump())
-    db.add(db_phone)
-    db.commit()
-    db.refresh(db_phone)
-    return db_phone
+    cached = _user_phone_cache.get(user_id)
+    if cached is not None:
+        return cached
+
+    db_obj = db.scalars(_USER_PHONE_BY_USER_STMT, {"user_id": user_id}).first()
+    if db_obj is not None:
+        db.expunge(db_obj)
+        _user_phone_cache.set(user_id, db_obj)
+    return db_obj
+
+
+def create_or_update_user_phone(
+    db: Session, data: UserPhoneCreate, commit: bool = True
+) -> UserPhone:
+    db_obj = pg_upsert(
+        db,
+        UserPhone,
+        data.model_dump(),
+        ["user_id"],
+        update_values=data.model_dump(exclude_unset=True),
+        commit=commit,
+    )
+    _user_phone_cache.delete(data.user_id)
+    return db_obj
 
 
 # -----------------------------
 # UserDevice
 # -----------------------------
 def get_user_device(db: Session, user_id: UUID) -> UserDevice | None:
-    return db.query(UserDevice).filter(UserDevice.user_id == user_id).first()
-
-
-def create_or_update_user_device(db: Session, data: UserDeviceCreate) -> UserDevice:
-    existing = get_user_device(db, data.user_id)
-    if existing:
-        for field, value in data.model_dump(exclude_unset=True).items():
-            setattr(existing, field, value)
-        db.commit()
-        db.refresh(existing)
-        return existing
-
-    db_device = UserDevice(**data.model_dump())
-    db.add(db_device)
-    db.commit()
-    db.refresh(db_device)
-    return db_device
+    cached = _user_device_cache.get(user_id)
+    if cached is not None:
+        return cached
+
+    db_obj = db.scalars(_USER_DEVICE_BY_USER_STMT, {"user_id": user_id}).first()
+    if db_obj is not None:
+        db.expunge(db_obj)
+        _user_device_cache.set(user_id, db_obj)
+    return db_obj
+
+
+def create_or_update_user_device(
+    db: Session, data: UserDeviceCreate, commit: bool = True
+) -> UserDevice:
+    db_obj = pg_upsert(
+        db,
+        UserDevice,
+        data.model_dump(),
+        ["user_id"],
+        update_values=data.model_dump(exclude_unset=True),
+        commit=commit,
+    )
+    _user_device_cache.delete(data.user_id)
+    return db_obj
@@ -100,6 +100,16 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
+        if connection.dialect.name == "postgresql":
+            # ALTER TABLE 이 ACCESS EXCLUSIVE 락을 기다리는 동안 뒤에 오는 읽기/쓰기가
+            # 모두 줄을 서게 되므로, 락을 바로 못 잡으면 실패시키고 다시 실행
+            connection.exec_driver_sql(
+                f"SET lock_timeout = '{os.getenv('MIGRATION_LOCK_TIMEOUT', '5s')}'"
+            )
+            # 락을 잡은 뒤의 인덱스 생성 / 데이터 복사는 역할별 statement_timeout 에 끊기지 않도록 해제
+            connection.exec_driver_sql("SET statement_timeout = 0")
+            connection.commit()
+
         context.configure(
             connection=connection, target_metadata=target_metadata
         )
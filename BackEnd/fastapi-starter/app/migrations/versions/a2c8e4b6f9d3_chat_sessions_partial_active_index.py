@@ -0,0 +1,46 @@
+"""add partial index for active chat sessions
+
+Revision ID: a2c8e4b6f9d3
+Revises: f7b5d9e3a2c6
+Create Date: 2025-12-12 14:27:58.106413
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a2c8e4b6f9d3'
+down_revision: Union[str, None] = 'f7b5d9e3a2c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 유저별 세션 목록 (WHERE user_id = ? ORDER BY last_message_at DESC LIMIT ?)
+    # 선두 컬럼이 user_id 라 기존 ix_chat_sessions_user_id 를 대체
+    op.create_index(
+        'ix_chat_sessions_user_id_last_message_at',
+        'chat_sessions',
+        ['user_id', sa.text('last_message_at DESC')],
+        unique=False,
+    )
+    op.drop_index('ix_chat_sessions_user_id', table_name='chat_sessions')
+
+    # 활성 세션 재사용 조회 (user_id, persona_id, is_active)
+    # 비활성 세션은 인덱스에 포함하지 않아 크기를 활성 세션 수로 제한
+    op.create_index(
+        'ix_chat_sessions_active_user_persona',
+        'chat_sessions',
+        ['user_id', 'persona_id', sa.text('last_message_at DESC')],
+        unique=False,
+        postgresql_where=sa.text('is_active'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_chat_sessions_active_user_persona', table_name='chat_sessions')
+    op.create_index('ix_chat_sessions_user_id', 'chat_sessions', ['user_id'], unique=False)
+    op.drop_index('ix_chat_sessions_user_id_last_message_at', table_name='chat_sessions')
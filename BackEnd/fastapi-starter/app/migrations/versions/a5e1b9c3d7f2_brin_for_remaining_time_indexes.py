@@ -0,0 +1,47 @@
+"""replace remaining timestamp-only btree indexes with BRIN
+
+Revision ID: a5e1b9c3d7f2
+Revises: f2c6d8a4e9b7
+Create Date: 2025-12-10 14:32:09.551873
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5e1b9c3d7f2'
+down_revision: Union[str, None] = 'f2c6d8a4e9b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (테이블, 시간 컬럼, 기존 btree 인덱스명)
+# ix_chat_sessions_last_message_at 은 최근 대화 정렬에 쓰이므로 btree 유지
+BRIN_TARGETS = [
+    ('sleep_sessions', 'end_at', 'ix_sleep_sessions_end_at'),
+    ('workout_sessions', 'end_at', 'ix_workout_sessions_end_at'),
+    ('chat_messages', 'created_at', 'ix_chat_messages_created_at'),
+    ('fatigue_predictions', 'timestamp', 'ix_fatigue_predictions_timestamp'),
+    ('stress_assessments', 'timestamp', 'ix_stress_assessments_timestamp'),
+]
+
+
+def upgrade() -> None:
+    for table, column, btree_name in BRIN_TARGETS:
+        op.create_index(
+            f'ix_{table}_{column}_brin',
+            table,
+            [column],
+            unique=False,
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+        )
+        op.drop_index(btree_name, table_name=table)
+
+
+def downgrade() -> None:
+    for table, column, btree_name in reversed(BRIN_TARGETS):
+        op.create_index(btree_name, table, [column], unique=False)
+        op.drop_index(f'ix_{table}_{column}_brin', table_name=table)
@@ -0,0 +1,80 @@
+"""stamp updated_at / last_updated with BEFORE UPDATE triggers
+
+Revision ID: a7d3e9c5f1b8
+Revises: f8c4a2e7d1b9
+Create Date: 2025-12-15 13:05:22.671390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d3e9c5f1b8'
+down_revision: Union[str, None] = 'f8c4a2e7d1b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 트리거 함수 → 적용 테이블
+TRIGGER_TABLES = {
+    'set_updated_at': [
+        'appliance_condition_rules',
+        'user_appliance_preferences',
+        'air_conditioner_configs',
+        'tv_configs',
+        'air_purifier_configs',
+        'light_configs',
+        'humidifier_configs',
+        'user_locations',
+    ],
+    'set_last_updated': [
+        'appliance_status',
+    ],
+}
+
+TRIGGER_COLUMNS = {
+    'set_updated_at': 'updated_at',
+    'set_last_updated': 'last_updated',
+}
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # 모델의 onupdate=func.now() 대신 DB 가 직접 갱신
+    # (ORM 을 거치지 않는 UPDATE / ON CONFLICT DO UPDATE 에도 동일하게 적용)
+    for function, column in TRIGGER_COLUMNS.items():
+        op.execute(
+            f"""
+            CREATE OR REPLACE FUNCTION {function}() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                NEW.{column} := now();
+                RETURN NEW;
+            END;
+            $$
+            """
+        )
+
+    for function, tables in TRIGGER_TABLES.items():
+        for table in tables:
+            op.execute(
+                f"CREATE TRIGGER trg_{table}_{function} "
+                f"BEFORE UPDATE ON {table} "
+                f"FOR EACH ROW EXECUTE FUNCTION {function}()"
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for function, tables in TRIGGER_TABLES.items():
+        for table in tables:
+            op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_{function} ON {table}")
+
+    for function in TRIGGER_COLUMNS:
+        op.execute(f"DROP FUNCTION IF EXISTS {function}()")
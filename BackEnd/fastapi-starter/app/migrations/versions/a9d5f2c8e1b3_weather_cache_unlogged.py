@@ -0,0 +1,29 @@
+"""make weather_cache UNLOGGED
+
+Revision ID: a9d5f2c8e1b3
+Revises: f4c1e8b2a6d7
+Create Date: 2025-12-14 13:45:16.027583
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d5f2c8e1b3'
+down_revision: Union[str, None] = 'f4c1e8b2a6d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # weather_cache 는 10분 만료 후 기상청/에어코리아 API 로 다시 채우는 캐시
+    # WAL 기록을 생략해 쓰기 비용을 줄이고, 크래시 후 비워져도 다음 조회에서 재생성
+    # (참조하는 FK 없음, 스탠바이로 복제되지 않음)
+    op.execute("ALTER TABLE weather_cache SET UNLOGGED")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE weather_cache SET LOGGED")
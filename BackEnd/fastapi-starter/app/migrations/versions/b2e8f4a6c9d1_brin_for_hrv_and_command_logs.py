@@ -0,0 +1,43 @@
+"""BRIN indexes on hrv_logs.measured_at / appliance_command_logs.executed_at
+
+Revision ID: b2e8f4a6c9d1
+Revises: a7d3e9c5f1b8
+Create Date: 2025-12-15 13:48:51.120466
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2e8f4a6c9d1'
+down_revision: Union[str, None] = 'a7d3e9c5f1b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (테이블, 시간 컬럼)
+# user_id 는 물리적 저장 순서와 상관이 없으므로 BRIN 에는 시간 컬럼만 사용
+# (유저별 조회는 기존 (user_id, 시각) btree 가 담당)
+BRIN_TARGETS = [
+    ('hrv_logs', 'measured_at'),
+    ('appliance_command_logs', 'executed_at'),
+]
+
+
+def upgrade() -> None:
+    for table, column in BRIN_TARGETS:
+        op.create_index(
+            f'ix_{table}_{column}_brin',
+            table,
+            [column],
+            unique=False,
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+        )
+
+
+def downgrade() -> None:
+    for table, column in reversed(BRIN_TARGETS):
+        op.drop_index(f'ix_{table}_{column}_brin', table_name=table)
@@ -0,0 +1,46 @@
+"""use BIGINT identity primary key for chat_messages
+
+Revision ID: b4d9f1a7c3e2
+Revises: a2c8e4b6f9d3
+Create Date: 2025-12-12 17:40:22.918364
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d9f1a7c3e2'
+down_revision: Union[str, None] = 'a2c8e4b6f9d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 메시지 id 는 API 로 노출되지 않고 다른 테이블이 참조하지도 않음
+    # UUID(16B) 대신 BIGINT IDENTITY(8B) 로 PK 인덱스를 절반으로 줄이고 항상 오른쪽 끝에 추가
+    op.drop_constraint('chat_messages_pkey', 'chat_messages', type_='primary')
+    op.drop_column('chat_messages', 'id')
+    op.add_column(
+        'chat_messages',
+        sa.Column('id', sa.BigInteger(), sa.Identity(always=True), nullable=False),
+    )
+    op.create_primary_key('chat_messages_pkey', 'chat_messages', ['id'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('chat_messages_pkey', 'chat_messages', type_='primary')
+    op.drop_column('chat_messages', 'id')
+    op.add_column(
+        'chat_messages',
+        sa.Column(
+            'id',
+            sa.UUID(),
+            server_default=sa.text('gen_random_uuid()'),
+            nullable=False,
+        ),
+    )
+    op.alter_column('chat_messages', 'id', server_default=None)
+    op.create_primary_key('chat_messages_pkey', 'chat_messages', ['id'])
@@ -0,0 +1,39 @@
+"""tune autovacuum for write-heavy health_hourly / time_slots
+
+Revision ID: b6e3a8d4f2c9
+Revises: a9d5f2c8e1b3
+Create Date: 2025-12-14 16:03:58.419726
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e3a8d4f2c9'
+down_revision: Union[str, None] = 'a9d5f2c8e1b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ['health_hourly', 'time_slots']
+
+
+def upgrade() -> None:
+    # 백필 업서트로 갱신/삽입이 몰리는 테이블: 기본값(20%)보다 자주 vacuum / analyze
+    for table in TABLES:
+        op.execute(
+            f"ALTER TABLE {table} SET ("
+            "autovacuum_vacuum_scale_factor = 0.02, "
+            "autovacuum_analyze_scale_factor = 0.01)"
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(
+            f"ALTER TABLE {table} RESET ("
+            "autovacuum_vacuum_scale_factor, "
+            "autovacuum_analyze_scale_factor)"
+        )
@@ -0,0 +1,51 @@
+"""add unique lower(email) index to users
+
+Revision ID: b7d2e4f81a3c
+Revises: aea74eef514b
+Create Date: 2025-12-08 10:12:41.208113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2e4f81a3c'
+down_revision: Union[str, None] = 'aea74eef514b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 대소문자만 다른 이메일이 이미 있으면 UNIQUE 인덱스 생성이 실패하므로 먼저 확인
+    # (해당 계정들을 하나로 합치거나 이메일을 수정한 뒤 다시 실행)
+    rows = op.get_bind().execute(
+        sa.text(
+            "SELECT email FROM users WHERE lower(email) IN ("
+            "SELECT lower(email) FROM users GROUP BY lower(email) HAVING count(*) > 1"
+            ") ORDER BY lower(email), email"
+        )
+    ).fetchall()
+    if rows:
+        conflicts: dict = {}
+        for row in rows:
+            conflicts.setdefault(row.email.lower(), []).append(row.email)
+        details = "\n".join(f"  {key}: {', '.join(emails)}" for key, emails in conflicts.items())
+        raise RuntimeError(
+            "users.email 에 대소문자만 다른 중복이 있어 ix_users_email_lower 를 만들 수 없습니다. "
+            f"중복을 정리한 뒤 다시 실행하세요:\n{details}"
+        )
+
+    # 대소문자 무시 이메일 중복 방지 + get_user_by_email / ON CONFLICT 대상 인덱스
+    op.create_index(
+        'ix_users_email_lower',
+        'users',
+        [sa.text('lower(email)')],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_email_lower', table_name='users')
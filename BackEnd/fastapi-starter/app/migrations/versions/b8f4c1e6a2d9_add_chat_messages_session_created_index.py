@@ -0,0 +1,35 @@
+"""replace chat_messages session_id index with (session_id, created_at)
+
+Revision ID: b8f4c1e6a2d9
+Revises: a5e1b9c3d7f2
+Create Date: 2025-12-10 17:18:45.204639
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8f4c1e6a2d9'
+down_revision: Union[str, None] = 'a5e1b9c3d7f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 세션별 메시지 조회 (WHERE session_id = ? ORDER BY created_at LIMIT ?)
+    # 선두 컬럼이 session_id 라 기존 단일 컬럼 인덱스의 역할도 대신함
+    op.create_index(
+        'ix_chat_messages_session_id_created_at',
+        'chat_messages',
+        ['session_id', 'created_at'],
+        unique=False,
+    )
+    op.drop_index('ix_chat_messages_session_id', table_name='chat_messages')
+
+
+def downgrade() -> None:
+    op.create_index('ix_chat_messages_session_id', 'chat_messages', ['session_id'], unique=False)
+    op.drop_index('ix_chat_messages_session_id_created_at', table_name='chat_messages')
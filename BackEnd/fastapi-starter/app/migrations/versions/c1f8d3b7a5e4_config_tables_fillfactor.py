@@ -0,0 +1,39 @@
+"""lower fillfactor on appliance config tables for HOT updates
+
+Revision ID: c1f8d3b7a5e4
+Revises: b6e3a8d4f2c9
+Create Date: 2025-12-15 09:27:40.663195
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c1f8d3b7a5e4'
+down_revision: Union[str, None] = 'b6e3a8d4f2c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CONFIG_TABLES = [
+    'air_conditioner_configs',
+    'tv_configs',
+    'air_purifier_configs',
+    'light_configs',
+    'humidifier_configs',
+]
+
+
+def upgrade() -> None:
+    # 설정 업서트는 인덱스가 없는 컬럼(power_state, updated_at 등)만 바꾸므로
+    # 페이지에 여유 공간을 남겨 두면 같은 페이지 안에서 HOT 업데이트 (인덱스 갱신 없음)
+    # 기존 페이지는 다음 재작성(VACUUM FULL 등) 이후부터 적용
+    for table in CONFIG_TABLES:
+        op.execute(f"ALTER TABLE {table} SET (fillfactor = 70)")
+
+
+def downgrade() -> None:
+    for table in CONFIG_TABLES:
+        op.execute(f"ALTER TABLE {table} RESET (fillfactor)")
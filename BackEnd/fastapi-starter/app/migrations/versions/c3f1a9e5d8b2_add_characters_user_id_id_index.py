@@ -0,0 +1,32 @@
+"""add (user_id, id) index to characters
+
+Revision ID: c3f1a9e5d8b2
+Revises: b7d2e4f81a3c
+Create Date: 2025-12-08 14:03:27.514920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f1a9e5d8b2'
+down_revision: Union[str, None] = 'b7d2e4f81a3c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 유저별 캐릭터 키셋 페이지네이션 (WHERE user_id = ? AND id > ? ORDER BY id)
+    op.create_index(
+        'ix_characters_user_id_id',
+        'characters',
+        ['user_id', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_characters_user_id_id', table_name='characters')
@@ -0,0 +1,112 @@
+"""partition weather_observations by month on as_of
+
+Revision ID: c7e2a5d8f4b1
+Revises: b4d9f1a7c3e2
+Create Date: 2025-12-13 10:36:14.552807
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e2a5d8f4b1'
+down_revision: Union[str, None] = 'b4d9f1a7c3e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 마이그레이션 시점 기준 과거 3개월 ~ 향후 12개월 월별 파티션 생성
+# (범위 밖 데이터는 DEFAULT 파티션으로 들어가므로 INSERT 는 실패하지 않음)
+MONTHS_BEFORE = 3
+MONTHS_AHEAD = 12
+
+
+def _add_months(d: date, months: int) -> date:
+    total = d.year * 12 + (d.month - 1) + months
+    return date(total // 12, total % 12 + 1, 1)
+
+
+def _use_native_partitioning() -> bool:
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return False
+    # TimescaleDB 가 있으면 f2c6d8a4e9b7 에서 이미 하이퍼테이블로 변환됨
+    return bind.execute(
+        sa.text("SELECT 1 FROM pg_extension WHERE extname = 'timescaledb'")
+    ).first() is None
+
+
+def _create_brin_index() -> None:
+    op.create_index(
+        'ix_weather_observations_as_of_brin',
+        'weather_observations',
+        ['as_of'],
+        unique=False,
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32},
+    )
+
+
+def upgrade() -> None:
+    # 시간 조건 조회 시 파티션 프루닝, 보존 기간 정리는 DELETE 대신 파티션 DROP
+    if not _use_native_partitioning():
+        return
+
+    op.execute("ALTER TABLE weather_observations RENAME TO weather_observations_old")
+    op.execute("ALTER INDEX weather_observations_pkey RENAME TO weather_observations_old_pkey")
+    op.execute(
+        "ALTER INDEX ix_weather_observations_as_of_brin "
+        "RENAME TO ix_weather_observations_old_as_of_brin"
+    )
+
+    op.execute(
+        "CREATE TABLE weather_observations "
+        "(LIKE weather_observations_old INCLUDING DEFAULTS) "
+        "PARTITION BY RANGE (as_of)"
+    )
+    op.create_primary_key(
+        'weather_observations_pkey',
+        'weather_observations',
+        ['nx', 'ny', 'as_of', 'provider'],
+    )
+    _create_brin_index()
+
+    first_month = _add_months(date.today().replace(day=1), -MONTHS_BEFORE)
+    for i in range(MONTHS_BEFORE + MONTHS_AHEAD + 1):
+        start = _add_months(first_month, i)
+        end = _add_months(start, 1)
+        op.execute(
+            f"CREATE TABLE weather_observations_{start:%Y%m} "
+            "PARTITION OF weather_observations "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+    op.execute(
+        "CREATE TABLE weather_observations_default "
+        "PARTITION OF weather_observations DEFAULT"
+    )
+
+    op.execute("INSERT INTO weather_observations SELECT * FROM weather_observations_old")
+    op.execute("DROP TABLE weather_observations_old")
+
+
+def downgrade() -> None:
+    if not _use_native_partitioning():
+        return
+
+    op.execute(
+        "CREATE TABLE weather_observations_plain "
+        "(LIKE weather_observations INCLUDING DEFAULTS)"
+    )
+    op.execute("INSERT INTO weather_observations_plain SELECT * FROM weather_observations")
+    # 파티션 테이블을 DROP 하면 자식 파티션도 함께 삭제됨
+    op.execute("DROP TABLE weather_observations")
+    op.execute("ALTER TABLE weather_observations_plain RENAME TO weather_observations")
+    op.create_primary_key(
+        'weather_observations_pkey',
+        'weather_observations',
+        ['nx', 'ny', 'as_of', 'provider'],
+    )
+    _create_brin_index()
@@ -0,0 +1,60 @@
+"""split fatigue_predictions.class_probabilities into float columns
+
+Revision ID: c9d2a6f4b8e1
+Revises: b8f4c1e6a2d9
+Create Date: 2025-12-11 09:42:17.630528
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9d2a6f4b8e1'
+down_revision: Union[str, None] = 'b8f4c1e6a2d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 컬럼명 → 기존 JSONB 키
+PROB_COLUMNS = [
+    ('prob_low', 'Low'),
+    ('prob_medium', 'Medium'),
+    ('prob_high', 'High'),
+]
+
+
+def upgrade() -> None:
+    # 고정 길이(3) 확률 벡터를 JSONB 대신 float 컬럼으로 저장 (jsonb 파싱 / 키 문자열 오버헤드 제거)
+    for column, _ in PROB_COLUMNS:
+        op.add_column('fatigue_predictions', sa.Column(column, sa.Float(), nullable=True))
+
+    op.execute(
+        "UPDATE fatigue_predictions SET "
+        + ", ".join(
+            f"{column} = COALESCE((class_probabilities ->> '{key}')::float8, 0)"
+            for column, key in PROB_COLUMNS
+        )
+    )
+
+    for column, _ in PROB_COLUMNS:
+        op.alter_column('fatigue_predictions', column, nullable=False)
+    op.drop_column('fatigue_predictions', 'class_probabilities')
+
+
+def downgrade() -> None:
+    op.add_column(
+        'fatigue_predictions',
+        sa.Column('class_probabilities', postgresql.JSONB(), nullable=True),
+    )
+    op.execute(
+        "UPDATE fatigue_predictions SET class_probabilities = jsonb_build_object("
+        + ", ".join(f"'{key}', {column}" for column, key in PROB_COLUMNS)
+        + ")"
+    )
+    op.alter_column('fatigue_predictions', 'class_probabilities', nullable=False)
+
+    for column, _ in PROB_COLUMNS:
+        op.drop_column('fatigue_predictions', column)
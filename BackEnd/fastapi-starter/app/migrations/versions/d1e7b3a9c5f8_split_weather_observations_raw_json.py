@@ -0,0 +1,50 @@
+"""move weather_observations.raw_json to weather_observations_raw
+
+Revision ID: d1e7b3a9c5f8
+Revises: c9d2a6f4b8e1
+Create Date: 2025-12-11 13:26:51.078342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1e7b3a9c5f8'
+down_revision: Union[str, None] = 'c9d2a6f4b8e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 원본 응답(JSONB)을 같은 PK 의 사이드 테이블로 분리해 관측값 테이블 행을 좁게 유지
+    op.create_table('weather_observations_raw',
+        sa.Column('nx', sa.Integer(), nullable=False),
+        sa.Column('ny', sa.Integer(), nullable=False),
+        sa.Column('as_of', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('provider', sa.String(), nullable=False),
+        sa.Column('raw_json', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.PrimaryKeyConstraint('nx', 'ny', 'as_of', 'provider')
+    )
+    op.execute(
+        "INSERT INTO weather_observations_raw (nx, ny, as_of, provider, raw_json) "
+        "SELECT nx, ny, as_of, provider, raw_json FROM weather_observations "
+        "WHERE raw_json IS NOT NULL"
+    )
+    op.drop_column('weather_observations', 'raw_json')
+
+
+def downgrade() -> None:
+    op.add_column(
+        'weather_observations',
+        sa.Column('raw_json', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+    op.execute(
+        "UPDATE weather_observations AS o SET raw_json = r.raw_json "
+        "FROM weather_observations_raw AS r "
+        "WHERE o.nx = r.nx AND o.ny = r.ny AND o.as_of = r.as_of AND o.provider = r.provider"
+    )
+    op.drop_table('weather_observations_raw')
@@ -0,0 +1,55 @@
+"""store appliance rule / status / command json columns as jsonb
+
+Revision ID: d3a9f6c2b8e5
+Revises: c1f8d3b7a5e4
+Create Date: 2025-12-15 10:12:08.418530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3a9f6c2b8e5'
+down_revision: Union[str, None] = 'c1f8d3b7a5e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (테이블, 컬럼, nullable)
+JSON_COLUMNS = [
+    ('appliance_condition_rules', 'condition_json', False),
+    ('appliance_condition_rules', 'settings_json', True),
+    ('user_appliance_preferences', 'settings_json', False),
+    ('appliance_status', 'current_settings', True),
+    ('appliance_status', 'last_command', True),
+    ('appliance_command_logs', 'settings', True),
+]
+
+
+def upgrade() -> None:
+    # json 은 텍스트 그대로 저장되어 읽을 때마다 다시 파싱됨
+    # jsonb 는 파싱된 바이너리로 저장 (룰 평가 시 반복 조회 비용 감소)
+    for table, column, nullable in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            existing_type=sa.JSON(),
+            existing_nullable=nullable,
+            postgresql_using=f'{column}::jsonb',
+        )
+
+
+def downgrade() -> None:
+    for table, column, nullable in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(astext_type=sa.Text()),
+            existing_nullable=nullable,
+            postgresql_using=f'{column}::json',
+        )
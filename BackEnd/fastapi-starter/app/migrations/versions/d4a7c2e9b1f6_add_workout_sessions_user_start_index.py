@@ -0,0 +1,34 @@
+"""add (user_id, start_at) index to workout_sessions
+
+Revision ID: d4a7c2e9b1f6
+Revises: c3f1a9e5d8b2
+Create Date: 2025-12-09 10:21:44.183502
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a7c2e9b1f6'
+down_revision: Union[str, None] = 'c3f1a9e5d8b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 유저별 운동 기간 조회 (WHERE user_id = ? AND start_at >= ? ORDER BY start_at)
+    # time_slots / health_hourly / sleep_sessions 는 (user_id, ts_hour|start_at, ...)
+    # UNIQUE 제약의 인덱스가 같은 역할을 하므로 중복 인덱스를 만들지 않음
+    op.create_index(
+        'ix_workout_sessions_user_id_start_at',
+        'workout_sessions',
+        ['user_id', 'start_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_workout_sessions_user_id_start_at', table_name='workout_sessions')
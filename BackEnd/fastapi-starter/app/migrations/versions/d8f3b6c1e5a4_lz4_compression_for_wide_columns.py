@@ -0,0 +1,55 @@
+"""use lz4 TOAST compression for wide JSONB / text columns
+
+Revision ID: d8f3b6c1e5a4
+Revises: c7e2a5d8f4b1
+Create Date: 2025-12-13 13:08:47.295610
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8f3b6c1e5a4'
+down_revision: Union[str, None] = 'c7e2a5d8f4b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# TOAST 로 압축 저장되는 큰 값이 들어가는 컬럼
+WIDE_COLUMNS = [
+    ('weather_observations_raw', 'raw_json'),
+    ('workout_sessions', 'meta'),
+    ('stress_assessments', 'hrv_metrics'),
+    ('chat_messages', 'content'),
+    ('chat_messages', 'suggestions'),
+    ('chat_messages', 'execution_results'),
+]
+
+
+def _set_compression(method: str) -> None:
+    bind = op.get_bind()
+    # 컬럼별 압축 방식은 PostgreSQL 14+ 에서만 지원
+    if bind.dialect.name != 'postgresql' or bind.dialect.server_version_info < (14,):
+        return
+
+    for table, column in WIDE_COLUMNS:
+        # lz4 없이 빌드된 서버면 기본(pglz) 유지
+        op.execute(
+            "DO $$ BEGIN "
+            f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION {method}; "
+            "EXCEPTION WHEN feature_not_supported THEN NULL; "
+            "END $$"
+        )
+
+
+def upgrade() -> None:
+    # lz4 는 pglz 대비 압축/해제가 수 배 빨라 JSONB 읽기/쓰기 CPU 감소
+    # (이후 새로 쓰이는 값부터 적용, 기존 값은 그대로 읽힘)
+    # 새로 만드는 컬럼의 기본값은 f7b5d9e3a2c6 에서 default_toast_compression 으로 지정
+    _set_compression('lz4')
+
+
+def downgrade() -> None:
+    _set_compression('pglz')
@@ -0,0 +1,28 @@
+"""drop standalone chat_sessions.persona_id index
+
+Revision ID: e2a7c9f5b3d6
+Revises: d8f3b6c1e5a4
+Create Date: 2025-12-13 15:52:31.640178
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a7c9f5b3d6'
+down_revision: Union[str, None] = 'd8f3b6c1e5a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # persona_id 는 항상 user_id 와 함께 조회되므로
+    # ix_chat_sessions_active_user_persona / ix_chat_sessions_user_id_last_message_at 로 충분
+    op.drop_index('ix_chat_sessions_persona_id', table_name='chat_sessions')
+
+
+def downgrade() -> None:
+    op.create_index('ix_chat_sessions_persona_id', 'chat_sessions', ['persona_id'], unique=False)
@@ -0,0 +1,36 @@
+"""covering index for latest hrv / fatigue lookup
+
+Revision ID: e5b2d8f4a1c7
+Revises: d3a9f6c2b8e5
+Create Date: 2025-12-15 10:41:53.207614
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b2d8f4a1c7'
+down_revision: Union[str, None] = 'd3a9f6c2b8e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (user_id, measured_at DESC) INCLUDE (hrv_value, fatigue_level)
+    # 최신 피로도 조회가 힙을 읽지 않고 인덱스만으로 끝나도록 교체
+    op.drop_index('idx_hrv_user_measured', table_name='hrv_logs')
+    op.create_index(
+        'idx_hrv_user_measured',
+        'hrv_logs',
+        ['user_id', sa.text('measured_at DESC')],
+        unique=False,
+        postgresql_include=['hrv_value', 'fatigue_level'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_hrv_user_measured', table_name='hrv_logs')
+    op.create_index('idx_hrv_user_measured', 'hrv_logs', ['user_id', 'measured_at'], unique=False)
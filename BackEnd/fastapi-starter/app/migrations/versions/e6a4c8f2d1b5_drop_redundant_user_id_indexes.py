@@ -0,0 +1,41 @@
+"""drop user_id indexes covered by (user_id, time) composites
+
+Revision ID: e6a4c8f2d1b5
+Revises: d1e7b3a9c5f8
+Create Date: 2025-12-11 16:54:03.417296
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a4c8f2d1b5'
+down_revision: Union[str, None] = 'd1e7b3a9c5f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (테이블, 삭제할 user_id 단일 인덱스) - 같은 user_id 선두 복합 인덱스가 이미 존재
+#   time_slots       : uq_time_slots_user_hour (user_id, ts_hour)
+#   health_hourly    : uq_health_user_hour (user_id, ts_hour)
+#   sleep_sessions   : uq_sleep_user_period (user_id, start_at, end_at)
+#   workout_sessions : ix_workout_sessions_user_id_start_at (user_id, start_at)
+REDUNDANT_INDEXES = [
+    ('time_slots', 'ix_time_slots_user_id'),
+    ('health_hourly', 'ix_health_hourly_user_id'),
+    ('sleep_sessions', 'ix_sleep_sessions_user_id'),
+    ('workout_sessions', 'ix_workout_sessions_user_id'),
+]
+
+
+def upgrade() -> None:
+    # 행마다 갱신되는 btree 수를 줄여 INSERT 쓰기 증폭 감소
+    for table, index_name in REDUNDANT_INDEXES:
+        op.drop_index(index_name, table_name=table)
+
+
+def downgrade() -> None:
+    for table, index_name in reversed(REDUNDANT_INDEXES):
+        op.create_index(index_name, table, ['user_id'], unique=False)
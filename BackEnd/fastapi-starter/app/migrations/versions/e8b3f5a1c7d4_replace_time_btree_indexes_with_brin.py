@@ -0,0 +1,51 @@
+"""replace single-column time btree indexes with BRIN
+
+Revision ID: e8b3f5a1c7d4
+Revises: d4a7c2e9b1f6
+Create Date: 2025-12-09 15:47:12.306915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b3f5a1c7d4'
+down_revision: Union[str, None] = 'd4a7c2e9b1f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (테이블, 시간 컬럼, 기존 btree 인덱스명 또는 None)
+BRIN_TARGETS = [
+    ('time_slots', 'ts_hour', 'ix_time_slots_ts_hour'),
+    ('health_hourly', 'ts_hour', 'ix_health_hourly_ts_hour'),
+    ('sleep_sessions', 'start_at', 'ix_sleep_sessions_start_at'),
+    ('workout_sessions', 'start_at', 'ix_workout_sessions_start_at'),
+    ('weather_observations', 'as_of', None),
+]
+
+
+def upgrade() -> None:
+    # 시간순 append-only 테이블: 페이지 범위별 min/max 만 저장하는 BRIN 으로
+    # 시간 범위 조회를 처리하고, 행마다 갱신되던 단일 컬럼 btree 는 제거
+    # (유저별 조회는 (user_id, 시간) 복합 인덱스 / UNIQUE 제약이 담당)
+    for table, column, btree_name in BRIN_TARGETS:
+        op.create_index(
+            f'ix_{table}_{column}_brin',
+            table,
+            [column],
+            unique=False,
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+        )
+        if btree_name is not None:
+            op.drop_index(btree_name, table_name=table)
+
+
+def downgrade() -> None:
+    for table, column, btree_name in reversed(BRIN_TARGETS):
+        if btree_name is not None:
+            op.create_index(btree_name, table, [column], unique=False)
+        op.drop_index(f'ix_{table}_{column}_brin', table_name=table)
@@ -0,0 +1,72 @@
+"""convert weather_observations to a TimescaleDB hypertable when available
+
+Revision ID: f2c6d8a4e9b7
+Revises: e8b3f5a1c7d4
+Create Date: 2025-12-10 11:05:38.917264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c6d8a4e9b7'
+down_revision: Union[str, None] = 'e8b3f5a1c7d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_timescaledb() -> bool:
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return False
+    return bind.execute(
+        sa.text("SELECT 1 FROM pg_extension WHERE extname = 'timescaledb'")
+    ).first() is not None
+
+
+def upgrade() -> None:
+    # TimescaleDB 확장이 설치된 DB 에서만 시간 파티셔닝 적용 (없으면 일반 테이블 유지)
+    # 하이퍼테이블은 PK/UNIQUE 에 시간 컬럼이 포함돼야 하므로
+    # 복합 PK (nx, ny, as_of, provider) 를 가진 weather_observations 만 대상
+    # (time_slots / health_hourly / *_sessions 는 id 단독 PK 라 BRIN 인덱스로 대체)
+    if not _has_timescaledb():
+        return
+
+    op.execute(
+        "SELECT create_hypertable("
+        "'weather_observations', 'as_of', "
+        "chunk_time_interval => INTERVAL '7 days', "
+        "create_default_indexes => FALSE, "
+        "if_not_exists => TRUE, "
+        "migrate_data => TRUE)"
+    )
+
+
+def downgrade() -> None:
+    if not _has_timescaledb():
+        return
+
+    # 하이퍼테이블은 일반 테이블로 되돌릴 수 없으므로 데이터를 복사해 재생성
+    op.execute(
+        "CREATE TABLE weather_observations_plain "
+        "(LIKE weather_observations INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    )
+    op.execute("INSERT INTO weather_observations_plain SELECT * FROM weather_observations")
+    op.execute("DROP TABLE weather_observations")
+    op.execute("ALTER TABLE weather_observations_plain RENAME TO weather_observations")
+    op.create_primary_key(
+        'weather_observations_pkey',
+        'weather_observations',
+        ['nx', 'ny', 'as_of', 'provider'],
+    )
+    op.create_index(
+        'ix_weather_observations_as_of_brin',
+        'weather_observations',
+        ['as_of'],
+        unique=False,
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32},
+    )
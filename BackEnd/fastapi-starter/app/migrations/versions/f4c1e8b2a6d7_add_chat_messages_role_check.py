@@ -0,0 +1,31 @@
+"""add CHECK constraint on chat_messages.role
+
+Revision ID: f4c1e8b2a6d7
+Revises: e2a7c9f5b3d6
+Create Date: 2025-12-14 10:19:05.873241
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4c1e8b2a6d7'
+down_revision: Union[str, None] = 'e2a7c9f5b3d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # role 은 서버 코드만 기록하는 고정 값 집합
+    op.create_check_constraint(
+        'ck_chat_messages_role',
+        'chat_messages',
+        "role IN ('user', 'assistant', 'system')",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('ck_chat_messages_role', 'chat_messages', type_='check')
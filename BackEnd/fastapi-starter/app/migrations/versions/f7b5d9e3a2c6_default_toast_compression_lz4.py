@@ -0,0 +1,45 @@
+"""default new TOAST-able columns to lz4 compression
+
+Revision ID: f7b5d9e3a2c6
+Revises: e6a4c8f2d1b5
+Create Date: 2025-12-12 10:11:36.842190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7b5d9e3a2c6'
+down_revision: Union[str, None] = 'e6a4c8f2d1b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _alter_database(format_args: str) -> None:
+    """format_args: PL/pgSQL format() 인자 (DB 이름은 %I 로 채움)"""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql' or bind.dialect.server_version_info < (14,):
+        return
+
+    # DB 소유자 권한이 없거나 lz4 없이 빌드된 서버면 기존 설정 유지
+    op.execute(
+        "DO $$ BEGIN "
+        f"EXECUTE format({format_args}); "
+        "EXCEPTION WHEN insufficient_privilege OR invalid_parameter_value THEN NULL; "
+        "END $$"
+    )
+
+
+def upgrade() -> None:
+    # 이후 새로 만드는 컬럼은 lz4 를 기본으로 사용 (기존 컬럼은 d8f3b6c1e5a4 에서 개별 지정)
+    # 값은 %L 로 넘겨 format() 이 따옴표를 처리하도록 함
+    _alter_database(
+        "'ALTER DATABASE %I SET default_toast_compression = %L', current_database(), 'lz4'"
+    )
+
+
+def downgrade() -> None:
+    _alter_database("'ALTER DATABASE %I RESET default_toast_compression', current_database()")
@@ -0,0 +1,116 @@
+"""partition hrv_logs / appliance_command_logs by month
+
+Revision ID: f8c4a2e7d1b9
+Revises: e5b2d8f4a1c7
+Create Date: 2025-12-15 11:20:37.904152
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8c4a2e7d1b9'
+down_revision: Union[str, None] = 'e5b2d8f4a1c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 마이그레이션 시점 기준 과거 3개월 ~ 향후 12개월 월별 파티션 생성
+# (범위 밖 데이터는 DEFAULT 파티션으로 들어가므로 INSERT 는 실패하지 않음)
+MONTHS_BEFORE = 3
+MONTHS_AHEAD = 12
+
+# 테이블 → (파티션 키 시간 컬럼, (user_id, 시각) 복합 인덱스명)
+PARTITIONED_TABLES = {
+    'hrv_logs': ('measured_at', 'idx_hrv_user_measured'),
+    'appliance_command_logs': ('executed_at', 'idx_command_log_user_executed'),
+}
+
+
+def _add_months(d: date, months: int) -> date:
+    total = d.year * 12 + (d.month - 1) + months
+    return date(total // 12, total % 12 + 1, 1)
+
+
+def _create_indexes(table: str) -> None:
+    if table == 'hrv_logs':
+        op.create_index(
+            'idx_hrv_user_measured',
+            'hrv_logs',
+            ['user_id', sa.text('measured_at DESC')],
+            unique=False,
+            postgresql_include=['hrv_value', 'fatigue_level'],
+        )
+    else:
+        op.create_index(
+            'idx_command_log_user_executed',
+            'appliance_command_logs',
+            ['user_id', 'executed_at'],
+            unique=False,
+        )
+
+
+def _create_user_fk(table: str) -> None:
+    op.create_foreign_key(
+        f'{table}_user_id_fkey', table, 'users', ['user_id'], ['id'], ondelete='CASCADE'
+    )
+
+
+def upgrade() -> None:
+    # (user_id, 최근 기간) 조회 시 파티션 프루닝, 보존 기간 정리는 DELETE 대신 파티션 DROP
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    first_month = _add_months(date.today().replace(day=1), -MONTHS_BEFORE)
+    for table, (column, time_index) in PARTITIONED_TABLES.items():
+        op.execute(f"ALTER TABLE {table} RENAME TO {table}_old")
+        # 새 부모 테이블과 이름이 겹치는 제약 / 인덱스는 미리 제거 (기존 테이블은 복사 후 삭제)
+        op.execute(f"ALTER TABLE {table}_old DROP CONSTRAINT {table}_pkey")
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_user_id")
+        op.execute(f"DROP INDEX IF EXISTS {time_index}")
+
+        op.execute(
+            f"CREATE TABLE {table} "
+            f"(LIKE {table}_old INCLUDING DEFAULTS INCLUDING COMMENTS) "
+            f"PARTITION BY RANGE ({column})"
+        )
+        # 파티션 테이블의 PK 에는 파티션 키가 포함되어야 함
+        op.create_primary_key(f'{table}_pkey', table, ['id', column])
+        _create_user_fk(table)
+        # user_id 단독 인덱스는 (user_id, 시각) 복합 인덱스로 대체
+        _create_indexes(table)
+
+        for i in range(MONTHS_BEFORE + MONTHS_AHEAD + 1):
+            start = _add_months(first_month, i)
+            end = _add_months(start, 1)
+            op.execute(
+                f"CREATE TABLE {table}_{start:%Y%m} "
+                f"PARTITION OF {table} "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            )
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+        op.execute(f"INSERT INTO {table} SELECT * FROM {table}_old")
+        op.execute(f"DROP TABLE {table}_old")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table in PARTITIONED_TABLES:
+        op.execute(
+            f"CREATE TABLE {table}_plain "
+            f"(LIKE {table} INCLUDING DEFAULTS INCLUDING COMMENTS)"
+        )
+        op.execute(f"INSERT INTO {table}_plain SELECT * FROM {table}")
+        # 파티션 테이블을 DROP 하면 자식 파티션 / 인덱스도 함께 삭제됨
+        op.execute(f"DROP TABLE {table}")
+        op.execute(f"ALTER TABLE {table}_plain RENAME TO {table}")
+        op.create_primary_key(f'{table}_pkey', table, ['id'])
+        _create_user_fk(table)
+        _create_indexes(table)
+        op.create_index(f'ix_{table}_user_id', table, ['user_id'], unique=False)
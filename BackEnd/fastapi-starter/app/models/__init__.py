@@ -1,4 +1,6 @@
 # Import all models for Alembic auto-detection
+from sqlalchemy.orm import configure_mappers
+
 from app.models.user import User, UserPhone, UserDevice
 from app.models.hrv import HRVLog, FatigueHistory
 from app.models.appliance import (
@@ -15,6 +17,7 @@ from app.models.tracking import (
     Place,
     TimeSlot,
     WeatherObservation,
+    WeatherObservationRaw,
     SleepSession,
     WorkoutSession,
     HealthHourly
@@ -30,6 +33,10 @@ from app.models.info import (
 )
 from app.models.chat import ChatSession, ChatMessage
 
+# 모든 모델을 import 한 뒤 문자열 relationship("User", "ChatMessage" 등)을 한 번에 해석
+# (첫 요청에서 매퍼 구성 비용을 치르지 않도록 import 시점에 미리 수행)
+configure_mappers()
+
 __all__ = [
     # User models
     "User",
@@ -55,6 +62,7 @@ __all__ = [
     "Place",
     "TimeSlot",
     "WeatherObservation",
+    "WeatherObservationRaw",
     "SleepSession",
     "WorkoutSession",
     "HealthHourly",
@@ -1,19 +1,20 @@
 """
 가전 제어 관련 모델
 """
-import uuid
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Boolean, JSON, Index
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, FetchedValue, String, Integer, DateTime, ForeignKey, Boolean, Index
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.sql import func
 
 from app.config.db import Base
+from app.utils.uuid7 import uuid7
 
 
 class ApplianceConditionRule(Base):
     """가전 작동 조건 테이블 (사용자별 x 피로도별)"""
     __tablename__ = "appliance_condition_rules"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # 피로도 레벨 (1~4)
@@ -25,18 +26,19 @@ class ApplianceConditionRule(Base):
     # 작동 조건 (JSON)
     # 예: {"temp_threshold": 28, "operator": ">="}
     # 예: {"humidity_threshold": 30, "operator": "<=", "mode": "humidify"}
-    condition_json = Column(JSON, nullable=False, comment="작동 조건")
+    condition_json = Column(JSONB, nullable=False, comment="작동 조건")
 
     # 제어 액션 및 설정
     action = Column(String, nullable=False, server_default="on", comment="제어 액션 (on/off/auto)")
-    settings_json = Column(JSON, nullable=True, comment="제어 설정값 (온도, 풍속 등)")
+    settings_json = Column(JSONB, nullable=True, comment="제어 설정값 (온도, 풍속 등)")
     priority = Column(Integer, nullable=False, server_default="1", comment="우선순위 (1이 가장 높음)")
 
     # 활성화 여부
     is_enabled = Column(Boolean, nullable=False, server_default="true", comment="이 규칙 활성화 여부")
 
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), nullable=True)
+    # UPDATE 시 BEFORE UPDATE 트리거(set_updated_at)가 갱신
+    updated_at = Column(DateTime(timezone=True), server_onupdate=FetchedValue(), nullable=True)
 
     __table_args__ = (
         Index('idx_condition_user_fatigue', 'user_id', 'fatigue_level', 'appliance_type'),
@@ -46,8 +48,9 @@ class ApplianceConditionRule(Base):
 class UserAppliancePreference(Base):
     """사용자 선호 가전 세팅 (사용자별 x 피로도별)"""
     __tablename__ = "user_appliance_preferences"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # 피로도 레벨 (1~4)
@@ -59,14 +62,14 @@ class UserAppliancePreference(Base):
     # 선호 세팅 (JSON)
     # 에어컨: {"target_temp_c": 25, "fan_speed": "mid", "swing_mode": "both"}
     # 가습기: {"mode": "auto", "target_humidity_pct": 50}
-    settings_json = Column(JSON, nullable=False, comment="선호 세팅")
+    settings_json = Column(JSONB, nullable=False, comment="선호 세팅")
 
     # 학습 여부 (기본값은 False - 시스템 기본값)
     is_learned = Column(Boolean, nullable=False, server_default="false",
                        comment="사용자가 실제로 승인/수정한 학습된 선호 세팅인지 여부")
 
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_onupdate=FetchedValue(), nullable=True)
 
     __table_args__ = (
         Index('idx_preference_user_fatigue', 'user_id', 'fatigue_level', 'appliance_type'),
@@ -76,18 +79,20 @@ class UserAppliancePreference(Base):
 class ApplianceStatus(Base):
     """가상 가전 상태 (모니터링용)"""
     __tablename__ = "appliance_status"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
     appliance_type = Column(String, nullable=False, comment="가전 종류")
 
     # 현재 상태
     is_on = Column(Boolean, nullable=False, server_default="false", comment="전원 상태")
-    current_settings = Column(JSON, nullable=True, comment="현재 설정값")
+    current_settings = Column(JSONB, nullable=True, comment="현재 설정값")
 
-    last_command = Column(JSON, nullable=True, comment="마지막 명령")
-    last_updated = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    last_command = Column(JSONB, nullable=True, comment="마지막 명령")
+    # UPDATE 시 BEFORE UPDATE 트리거(set_last_updated)가 갱신
+    last_updated = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue(), nullable=False)
 
     __table_args__ = (
         Index('idx_appliance_status_user', 'user_id', 'appliance_type'),
@@ -95,15 +100,16 @@ class ApplianceStatus(Base):
 
 
 class ApplianceCommandLog(Base):
-    """가전 제어 명령 로그"""
+    """가전 제어 명령 로그 (executed_at 기준 월별 RANGE 파티션)"""
     __tablename__ = "appliance_command_logs"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
 
     appliance_type = Column(String, nullable=False)
     action = Column(String, nullable=False, comment="on/off/set")
-    settings = Column(JSON, nullable=True)
+    settings = Column(JSONB, nullable=True)
 
     # 실행 결과
     success = Column(Boolean, nullable=False)
@@ -113,8 +119,16 @@ class ApplianceCommandLog(Base):
     triggered_by = Column(String, nullable=True, comment="scenario1/scenario2/manual")
     fatigue_level_used = Column(Integer, nullable=True)
 
-    executed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    # 파티션 키 (파티션 테이블의 PK 에는 파티션 키가 포함되어야 함)
+    executed_at = Column(DateTime(timezone=True), primary_key=True, server_default=func.now())
 
     __table_args__ = (
         Index('idx_command_log_user_executed', 'user_id', 'executed_at'),
+        # 실행 시각 순으로만 쌓이는 로그라 시간 범위 조회는 BRIN
+        Index(
+            'ix_appliance_command_logs_executed_at_brin',
+            'executed_at',
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+        ),
     )
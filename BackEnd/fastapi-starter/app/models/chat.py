@@ -3,11 +3,13 @@
 채팅 세션 및 메시지 모델
 사용자와 AI(페르소나)의 대화 내역을 저장
 """
-import uuid
 from datetime import datetime
 
 from sqlalchemy import (
+    BigInteger,
+    CheckConstraint,
     Column,
+    Identity,
     String,
     Text,
     DateTime,
@@ -16,10 +18,11 @@ from sqlalchemy import (
     Index,
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.orm import deferred, relationship
+from sqlalchemy.sql import func, text
 
 from app.config.db import Base
+from app.utils.uuid7 import uuid7
 
 
 class ChatSession(Base):
@@ -31,16 +34,30 @@ class ChatSession(Base):
     - 세션별로 대화 메시지들을 그룹화
     """
     __tablename__ = "chat_sessions"
+    # server_default 컬럼을 INSERT ... RETURNING 으로 함께 조회 (refresh 불필요)
+    __mapper_args__ = {"eager_defaults": True}
     __table_args__ = (
-        Index("ix_chat_sessions_user_id", "user_id"),
-        Index("ix_chat_sessions_persona_id", "persona_id"),
+        # 유저별 세션 목록 (WHERE user_id = ? ORDER BY last_message_at DESC)
+        Index(
+            "ix_chat_sessions_user_id_last_message_at",
+            "user_id",
+            text("last_message_at DESC"),
+        ),
+        # 활성 세션 재사용 조회: 비활성 세션은 인덱스에서 제외 (부분 인덱스)
+        Index(
+            "ix_chat_sessions_active_user_persona",
+            "user_id",
+            "persona_id",
+            text("last_message_at DESC"),
+            postgresql_where=text("is_active"),
+        ),
         Index("ix_chat_sessions_last_message_at", "last_message_at"),
     )
 
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
 
     user_id = Column(
@@ -73,7 +90,7 @@ class ChatSession(Base):
     is_active = Column(Boolean, nullable=False, default=True)
 
     # Relationships
-    user = relationship("User", backref="chat_sessions")
+    user = relationship("User", back_populates="chat_sessions")
     messages = relationship(
         "ChatMessage",
         back_populates="session",
@@ -90,15 +107,28 @@ class ChatMessage(Base):
     - 가전 제어 관련 메타데이터 포함 (의도, 제안, 실행 결과)
     """
     __tablename__ = "chat_messages"
+    __mapper_args__ = {"eager_defaults": True}
     __table_args__ = (
-        Index("ix_chat_messages_session_id", "session_id"),
-        Index("ix_chat_messages_created_at", "created_at"),
+        # 세션별 메시지 조회 (WHERE session_id = ? ORDER BY created_at) 를 정렬 없이 처리
+        Index("ix_chat_messages_session_id_created_at", "session_id", "created_at"),
+        CheckConstraint(
+            "role IN ('user', 'assistant', 'system')",
+            name="ck_chat_messages_role",
+        ),
+        # 생성 시각 순으로만 쌓이므로 btree 대신 BRIN
+        Index(
+            "ix_chat_messages_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
+    # 외부에 노출되지 않는 append-only 로그라 8바이트 순차 IDENTITY PK 사용
     id = Column(
-        UUID(as_uuid=True),
+        BigInteger,
+        Identity(always=True),
         primary_key=True,
-        default=uuid.uuid4,
     )
 
     session_id = Column(
@@ -118,8 +148,9 @@ class ChatMessage(Base):
     needs_control = Column(Boolean, nullable=True)
 
     # 가전 제어 관련 (JSONB)
-    suggestions = Column(JSONB, nullable=True)  # 제안한 가전 제어 목록
-    execution_results = Column(JSONB, nullable=True)  # 실행 결과
+    # 메시지 목록 조회 시에는 읽지 않도록 지연 로딩 (접근할 때 한 번에 SELECT)
+    suggestions = deferred(Column(JSONB, nullable=True), group="payload")  # 제안한 가전 제어 목록
+    execution_results = deferred(Column(JSONB, nullable=True), group="payload")  # 실행 결과
 
     created_at = Column(
         DateTime(timezone=True),
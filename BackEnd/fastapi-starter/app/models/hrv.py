@@ -1,41 +1,57 @@
 """
 HRV (Heart Rate Variability) 및 피로도 관련 모델
 """
-import uuid
 from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 
 from app.config.db import Base
+from app.utils.uuid7 import uuid7
 
 
 class HRVLog(Base):
-    """HRV 측정 로그"""
+    """HRV 측정 로그 (measured_at 기준 월별 RANGE 파티션)"""
     __tablename__ = "hrv_logs"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
 
     # HRV 데이터
     hrv_value = Column(Float, nullable=False, comment="HRV 값 (ms)")
     fatigue_level = Column(Integer, nullable=False, comment="피로도 레벨 (1: 좋음, 2: 보통, 3: 나쁨, 4: 매우 나쁨)")
 
     # 타임스탬프
-    measured_at = Column(DateTime(timezone=True), nullable=False, comment="애플워치에서 측정한 시각")
+    # 파티션 키 (파티션 테이블의 PK 에는 파티션 키가 포함되어야 함)
+    measured_at = Column(DateTime(timezone=True), primary_key=True, comment="애플워치에서 측정한 시각")
     synced_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), comment="백엔드에 동기화된 시각")
 
     # 인덱스: 사용자별 최신 데이터 조회용
+    #   - 최신 피로도 조회는 INCLUDE 컬럼만 읽으므로 index-only scan
     __table_args__ = (
-        Index('idx_hrv_user_measured', 'user_id', 'measured_at'),
+        Index(
+            'idx_hrv_user_measured',
+            'user_id',
+            text('measured_at DESC'),
+            postgresql_include=['hrv_value', 'fatigue_level'],
+        ),
+        # 측정 시각 순으로 쌓이므로 전체 기간 조회 / 보존 정리는 작은 BRIN 으로 처리
+        Index(
+            'ix_hrv_logs_measured_at_brin',
+            'measured_at',
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+        ),
     )
 
 
 class FatigueHistory(Base):
     """피로도 변화 히스토리 (집계용)"""
     __tablename__ = "fatigue_history"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
     date = Column(DateTime(timezone=True), nullable=False, comment="날짜")
@@ -1,9 +1,9 @@
 # app/models/info.py
-import uuid
 from datetime import datetime
 
 from sqlalchemy import (
     Column,
+    FetchedValue,
     String,
     Boolean,
     DateTime,
@@ -18,6 +18,7 @@ from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.config.db import Base
+from app.utils.uuid7 import uuid7
 
 
 # --------------------------------
@@ -42,6 +43,8 @@ class Appliance(Base):
       - INDEX(user_id, place_id)
     """
     __tablename__ = "appliances"
+    # registered_at(server_default)을 INSERT ... RETURNING 으로 함께 조회
+    __mapper_args__ = {"eager_defaults": True}
     __table_args__ = (
         Index("ix_appliances_user_id_appliance_code", "user_id", "appliance_code"),
         Index("ix_appliances_user_id_place_id", "user_id", "place_id"),
@@ -50,7 +53,7 @@ class Appliance(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
 
     user_id = Column(
@@ -82,7 +85,7 @@ class Appliance(Base):
     last_seen_at = Column(DateTime(timezone=True), nullable=True)
 
     # 관계 설정 (1:N or 1:1)
-    user = relationship("User", backref="appliances")
+    user = relationship("User", back_populates="appliances")
     place = relationship("Place", backref="appliances")
 
     air_conditioner_config = relationship(
@@ -135,6 +138,7 @@ class AirConditionerConfig(Base):
       - UNIQUE(appliance_id)
     """
     __tablename__ = "air_conditioner_configs"
+    __mapper_args__ = {"eager_defaults": True}
     __table_args__ = (
         UniqueConstraint("appliance_id", name="uq_air_conditioner_configs_appliance_id"),
     )
@@ -142,7 +146,7 @@ class AirConditionerConfig(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
 
     appliance_id = Column(
@@ -159,11 +163,12 @@ class AirConditionerConfig(Base):
     swing_mode = Column(String, nullable=True)          # none | vertical | horizontal | both
     target_humidity_pct = Column(Float, nullable=True)  # (%)
 
+    # UPDATE 시 BEFORE UPDATE 트리거(set_updated_at)가 갱신 (설정 테이블 공통)
     updated_at = Column(
         DateTime(timezone=True),
         nullable=False,
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),
     )
 
     appliance = relationship("Appliance", back_populates="air_conditioner_config")
@@ -186,6 +191,7 @@ class TvConfig(Base):
       - UNIQUE(appliance_id)
     """
     __tablename__ = "tv_configs"
+    __mapper_args__ = {"eager_defaults": True}
     __table_args__ = (
         UniqueConstraint("appliance_id", name="uq_tv_configs_appliance_id"),
     )
@@ -193,7 +199,7 @@ class TvConfig(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
 
     appliance_id = Column(
@@ -215,7 +221,7 @@ class TvConfig(Base):
         DateTime(timezone=True),
         nullable=False,
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),
     )
 
     appliance = relationship("Appliance", back_populates="tv_config")
@@ -239,6 +245,7 @@ class AirPurifierConfig(Base):
       - UNIQUE(appliance_id)
     """
     __tablename__ = "air_purifier_configs"
+    __mapper_args__ = {"eager_defaults": True}
     __table_args__ = (
         UniqueConstraint("appliance_id", name="uq_air_purifier_configs_appliance_id"),
     )
@@ -246,7 +253,7 @@ class AirPurifierConfig(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
 
     appliance_id = Column(
@@ -267,7 +274,7 @@ class AirPurifierConfig(Base):
         DateTime(timezone=True),
         nullable=False,
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),
     )
 
     appliance = relationship("Appliance", back_populates="air_purifier_config")
@@ -290,6 +297,7 @@ class LightConfig(Base):
       - UNIQUE(appliance_id)
     """
     __tablename__ = "light_configs"
+    __mapper_args__ = {"eager_defaults": True}
     __table_args__ = (
         UniqueConstraint("appliance_id", name="uq_light_configs_appliance_id"),
     )
@@ -297,7 +305,7 @@ class LightConfig(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
 
     appliance_id = Column(
@@ -317,7 +325,7 @@ class LightConfig(Base):
         DateTime(timezone=True),
         nullable=False,
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),
     )
 
     appliance = relationship("Appliance", back_populates="light_config")
@@ -340,6 +348,7 @@ class HumidifierConfig(Base):
       - UNIQUE(appliance_id)
     """
     __tablename__ = "humidifier_configs"
+    __mapper_args__ = {"eager_defaults": True}
     __table_args__ = (
         UniqueConstraint("appliance_id", name="uq_humidifier_configs_appliance_id"),
     )
@@ -347,7 +356,7 @@ class HumidifierConfig(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
 
     appliance_id = Column(
@@ -367,7 +376,7 @@ class HumidifierConfig(Base):
         DateTime(timezone=True),
         nullable=False,
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),
     )
 
     appliance = relationship("Appliance", back_populates="humidifier_config")
@@ -384,13 +393,18 @@ class Character(Base):
       - nickname: text
       - persona: text
       - (1:N) User → Character
+      - INDEX(user_id, id)  -- 유저별 키셋 페이지네이션
     """
     __tablename__ = "characters"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index("ix_characters_user_id_id", "user_id", "id"),
+    )
 
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
 
     user_id = Column(
@@ -402,4 +416,4 @@ class Character(Base):
     nickname = Column(String, nullable=False)
     persona = Column(String, nullable=False)
 
-    user = relationship("User", backref="characters")
+    user = relationship("User", back_populates="characters")
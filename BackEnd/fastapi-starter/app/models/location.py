@@ -1,19 +1,20 @@
 """
 위치 추적 및 Geofence 모델
 """
-import uuid
-from sqlalchemy import Column, String, Float, DateTime, Boolean, ForeignKey, Index
+from sqlalchemy import Column, FetchedValue, String, Float, DateTime, Boolean, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 
 from app.config.db import Base
+from app.utils.uuid7 import uuid7
 
 
 class UserLocation(Base):
     """사용자 위치 정보"""
     __tablename__ = "user_locations"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # 집 위치
@@ -23,14 +24,16 @@ class UserLocation(Base):
     # Geofence 설정
     geofence_radius_meters = Column(Float, nullable=False, server_default="100.0", comment="Geofence 반경 (미터)")
 
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now(), nullable=False)
+    # UPDATE 시 BEFORE UPDATE 트리거(set_updated_at)가 갱신
+    updated_at = Column(DateTime(timezone=True), server_onupdate=FetchedValue(), server_default=func.now(), nullable=False)
 
 
 class GeofenceTracking(Base):
     """Geofence 추적 로그 (10분 단위)"""
     __tablename__ = "geofence_tracking"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # 현재 위치
@@ -56,8 +59,9 @@ class GeofenceTracking(Base):
 class GeofenceEvent(Base):
     """Geofence 이벤트 (ENTER/EXIT)"""
     __tablename__ = "geofence_events"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
     event_type = Column(String, nullable=False, comment="ENTER/EXIT/APPROACHING_DETECTED")
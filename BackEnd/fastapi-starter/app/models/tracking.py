@@ -1,5 +1,4 @@
 # app/models/tracking.py
-import uuid
 from datetime import datetime
 
 from sqlalchemy import (
@@ -10,6 +9,7 @@ from sqlalchemy import (
     DateTime,
     Boolean,
     ForeignKey,
+    Index,
     UniqueConstraint,
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
@@ -17,13 +17,24 @@ from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.config.db import Base
+from app.utils.uuid7 import uuid7
 
 
 class StressAssessment(Base):
     """스트레스 평가 결과 (1분 간격)"""
     __tablename__ = "stress_assessments"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # 시간순으로만 쌓이는 측정 결과라 timestamp 는 BRIN
+        Index(
+            "ix_stress_assessments_timestamp_brin",
+            "timestamp",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
@@ -34,15 +45,25 @@ class StressAssessment(Base):
     stress_score = Column(Float, nullable=False)  # 0-100
     confidence = Column(Float, nullable=False)
     hrv_metrics = Column(JSONB, nullable=False)
-    timestamp = Column(DateTime(timezone=True), nullable=False, index=True)
+    timestamp = Column(DateTime(timezone=True), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
 class FatiguePrediction(Base):
     """피로도 예측 결과 (일일)"""
     __tablename__ = "fatigue_predictions"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # 시간순으로만 쌓이는 측정 결과라 timestamp 는 BRIN
+        Index(
+            "ix_fatigue_predictions_timestamp_brin",
+            "timestamp",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
@@ -52,8 +73,11 @@ class FatiguePrediction(Base):
     fatigue_level = Column(String, nullable=False)  # Low, Medium, High
     fatigue_class = Column(Integer, nullable=False)  # 0, 1, 2
     confidence = Column(Float, nullable=False)  # 0-1
-    class_probabilities = Column(JSONB, nullable=False)  # {"Low": 0.7, "Medium": 0.2, "High": 0.1}
-    timestamp = Column(DateTime(timezone=True), nullable=False, index=True)
+    # 클래스 수가 고정(3)이므로 JSONB 대신 클래스별 확률 컬럼
+    prob_low = Column(Float, nullable=False)
+    prob_medium = Column(Float, nullable=False)
+    prob_high = Column(Float, nullable=False)
+    timestamp = Column(DateTime(timezone=True), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
@@ -63,8 +87,9 @@ class Place(Base):
     - User 1 : N Place
     """
     __tablename__ = "places"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
@@ -91,19 +116,27 @@ class TimeSlot(Base):
     - 1시간 단위 시간 블록
     """
     __tablename__ = "time_slots"
+    __mapper_args__ = {"eager_defaults": True}
     __table_args__ = (
         UniqueConstraint("user_id", "ts_hour", name="uq_time_slots_user_hour"),
+        # 시간순으로만 쌓이는 테이블이라 ts_hour 단독 범위 조회는 btree 대신 BRIN
+        # (유저별 조회는 위 UNIQUE 제약의 (user_id, ts_hour) 인덱스가 담당)
+        Index(
+            "ix_time_slots_ts_hour_brin",
+            "ts_hour",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
-    ts_hour = Column(DateTime(timezone=True), nullable=False, index=True)
+    ts_hour = Column(DateTime(timezone=True), nullable=False)
 
     latitude = Column(Float, nullable=True)
     longitude = Column(Float, nullable=True)
@@ -133,6 +166,16 @@ class WeatherObservation(Base):
     - (nx, ny, as_of, provider) 복합키
     """
     __tablename__ = "weather_observations"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # 복합 PK 의 선두 컬럼이 아닌 as_of 로 기간 조회할 때 사용
+        Index(
+            "ix_weather_observations_as_of_brin",
+            "as_of",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
     nx = Column(Integer, primary_key=True)
     ny = Column(Integer, primary_key=True)
@@ -147,6 +190,21 @@ class WeatherObservation(Base):
     pm10 = Column(Float, nullable=True)
     pm2_5 = Column(Float, nullable=True)
 
+
+class WeatherObservationRaw(Base):
+    """
+    WeatherObservation 원본 응답 (raw_json)
+    - weather_observations 와 같은 (nx, ny, as_of, provider) 키의 1:1 사이드 테이블
+    - 큰 JSONB 를 분리해 관측값 테이블 행을 좁게 유지 (수치 컬럼 스캔 시 TOAST 접근 없음)
+    """
+    __tablename__ = "weather_observations_raw"
+    __mapper_args__ = {"eager_defaults": True}
+
+    nx = Column(Integer, primary_key=True)
+    ny = Column(Integer, primary_key=True)
+    as_of = Column(DateTime(timezone=True), primary_key=True)
+    provider = Column(String, primary_key=True)
+
     raw_json = Column(JSONB, nullable=True)
 
 
@@ -155,21 +213,33 @@ class SleepSession(Base):
     ERD: SleepSession
     """
     __tablename__ = "sleep_sessions"
+    __mapper_args__ = {"eager_defaults": True}
     __table_args__ = (
         # 자주 조회할 패턴: user_id + 기간
         UniqueConstraint("user_id", "start_at", "end_at", name="uq_sleep_user_period"),
+        Index(
+            "ix_sleep_sessions_start_at_brin",
+            "start_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "ix_sleep_sessions_end_at_brin",
+            "end_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
-    start_at = Column(DateTime(timezone=True), nullable=False, index=True)
-    end_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    start_at = Column(DateTime(timezone=True), nullable=False)
+    end_at = Column(DateTime(timezone=True), nullable=False)
 
     in_bed_hr = Column(Float, nullable=True)
     asleep_hr = Column(Float, nullable=True)
@@ -193,17 +263,33 @@ class WorkoutSession(Base):
     ERD: WorkoutSession
     """
     __tablename__ = "workout_sessions"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # user_id + 기간 조회 (WHERE user_id = ? AND start_at >= ? ORDER BY start_at)
+        Index("ix_workout_sessions_user_id_start_at", "user_id", "start_at"),
+        Index(
+            "ix_workout_sessions_start_at_brin",
+            "start_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "ix_workout_sessions_end_at_brin",
+            "end_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
-    start_at = Column(DateTime(timezone=True), nullable=False, index=True)
-    end_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    start_at = Column(DateTime(timezone=True), nullable=False)
+    end_at = Column(DateTime(timezone=True), nullable=False)
 
     workout_type = Column(String, nullable=False)  # running / cycling / ...
     step_count = Column(Integer, nullable=True)
@@ -234,19 +320,25 @@ class HealthHourly(Base):
     ERD: HealthHourly
     """
     __tablename__ = "health_hourly"
+    __mapper_args__ = {"eager_defaults": True}
     __table_args__ = (
         UniqueConstraint("user_id", "ts_hour", name="uq_health_user_hour"),
+        Index(
+            "ix_health_hourly_ts_hour_brin",
+            "ts_hour",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
-    ts_hour = Column(DateTime(timezone=True), nullable=False, index=True)
+    ts_hour = Column(DateTime(timezone=True), nullable=False)
 
     heart_rate_bpm = Column(Float, nullable=True)
     resting_hr_bpm = Column(Float, nullable=True)
@@ -1,5 +1,4 @@
 # app/models/user.py
-import uuid
 from datetime import datetime
 
 from sqlalchemy import (
@@ -8,13 +7,15 @@ from sqlalchemy import (
     Boolean,
     DateTime,
     ForeignKey,
+    Index,
     UniqueConstraint,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 
 from app.config.db import Base
+from app.utils.uuid7 import uuid7
 
 
 class User(Base):
@@ -24,13 +25,18 @@ class User(Base):
       - email: text
       - created_at: timestamptz
       - deleted_at: timestamptz (nullable)
+      - UNIQUE(lower(email))
     """
     __tablename__ = "users"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index("ix_users_email_lower", text("lower(email)"), unique=True),
+    )
 
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     email = Column(String, unique=True, nullable=False, index=True)
 
@@ -55,12 +61,27 @@ class User(Base):
         cascade="all, delete-orphan",
     )
     
-    # 1 : N 관계 (Character 모델이 있을 경우에만 활성화)
-    # characters = relationship(
-    #     "Character",
-    #     back_populates="user",
-    #     cascade="all, delete-orphan",
-    # )
+    # 1 : N 관계
+    #   - 유저는 매 요청마다 조회되므로 컬렉션은 접근할 때만 로드 (기본 select)
+    #   - 목록 화면 등에서 필요하면 쿼리에서 selectinload() 로 명시
+    #   - 자식 FK 가 ON DELETE CASCADE 이므로 삭제 시 컬렉션을 읽지 않고 DB 에 위임
+    chat_sessions = relationship(
+        "ChatSession",
+        back_populates="user",
+        order_by="ChatSession.last_message_at.desc()",
+        passive_deletes=True,
+    )
+    appliances = relationship(
+        "Appliance",
+        back_populates="user",
+        passive_deletes=True,
+    )
+    characters = relationship(
+        "Character",
+        back_populates="user",
+        order_by="Character.id",
+        passive_deletes=True,
+    )
 
 
 class UserPhone(Base):
@@ -74,6 +95,7 @@ class UserPhone(Base):
       - UNIQUE(user_id)  -- 1인 1폰
     """
     __tablename__ = "user_phones"
+    __mapper_args__ = {"eager_defaults": True}
     __table_args__ = (
         UniqueConstraint("user_id", name="uq_user_phones_user_id"),
     )
@@ -81,7 +103,7 @@ class UserPhone(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     user_id = Column(
         UUID(as_uuid=True),
@@ -120,6 +142,7 @@ class UserDevice(Base):
       - UNIQUE(user_id)  -- 1인 1워치
     """
     __tablename__ = "user_devices"
+    __mapper_args__ = {"eager_defaults": True}
     __table_args__ = (
         UniqueConstraint("user_id", name="uq_user_devices_user_id"),
     )
@@ -127,7 +150,7 @@ class UserDevice(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     user_id = Column(
         UUID(as_uuid=True),
@@ -1,19 +1,20 @@
 """
 날씨 캐시 모델
 """
-import uuid
 from sqlalchemy import Column, String, Float, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 
 from app.config.db import Base
+from app.utils.uuid7 import uuid7
 
 
 class WeatherCache(Base):
     """날씨 데이터 캐시"""
     __tablename__ = "weather_cache"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     # 위치 키 (위도경도 해시)
     location_key = Column(String, nullable=False, unique=True, index=True, comment="위도경도 조합 (예: 37.5665_126.9780)")
@@ -34,4 +35,6 @@ class WeatherCache(Base):
 
     __table_args__ = (
         Index('idx_weather_location_fetched', 'location_key', 'fetched_at'),
+        # 만료되면 외부 API 로 다시 채우는 캐시라 WAL 을 쓰지 않음 (크래시 시 비워짐)
+        {'prefixes': ['UNLOGGED']},
     )
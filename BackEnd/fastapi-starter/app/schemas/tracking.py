@@ -1,6 +1,6 @@
 # app/schemas/tracking.py
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel
@@ -59,6 +59,11 @@ class TimeSlotRead(TimeSlotBase):
         from_attributes = True
 
 
+class TimeSlotPage(BaseModel):
+    items: List[TimeSlotRead]
+    next_cursor: Optional[datetime] = None
+
+
 # ---------- WeatherObservation ----------
 
 class WeatherObservationBase(BaseModel):
@@ -191,3 +196,8 @@ class HealthHourlyRead(HealthHourlyBase):
 
     class Config:
         from_attributes = True
+
+
+class HealthHourlyPage(BaseModel):
+    items: List[HealthHourlyRead]
+    next_cursor: Optional[datetime] = None
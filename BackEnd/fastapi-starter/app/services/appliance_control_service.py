@@ -3,12 +3,13 @@
 실제 가전 제어는 추후 IoT 통합 시 구현
 """
 import logging
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
 from uuid import UUID
 from sqlalchemy.orm import Session
 
 from app.models.appliance import ApplianceStatus, ApplianceCommandLog
+from app.utils.db_utils import core_insert_many
 from app.utils.appliance_mapping import (
     validate_settings,
     format_settings_for_frontend,
@@ -29,7 +30,8 @@ class ApplianceControlService:
         action: str,
         settings: Optional[Dict[str, Any]] = None,
         triggered_by: str = "manual",
-        fatigue_level_used: Optional[int] = None
+        fatigue_level_used: Optional[int] = None,
+        command_logs: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """
         가전 제어 명령 실행 (가상)
@@ -42,10 +44,13 @@ class ApplianceControlService:
             settings: 설정값
             triggered_by: 트리거 소스 (scenario1/scenario2/manual)
             fatigue_level_used: 사용된 피로도 레벨
+            command_logs: 명령 로그를 모아 둘 리스트
+                (주어지면 로그 INSERT / 커밋을 호출 측에 맡기고, 상태 변경은 명령별 SAVEPOINT 로 격리)
 
         Returns:
             실행 결과
         """
+        savepoint = None
         try:
             # user_id를 UUID로 변환 (문자열로 전달되는 경우 대응)
             if isinstance(user_id, str):
@@ -67,6 +72,10 @@ class ApplianceControlService:
                         "error_message": error
                     }
 
+            # 일괄 실행 중이면 이 명령의 변경만 되돌릴 수 있도록 SAVEPOINT 안에서 수행
+            if command_logs is not None:
+                savepoint = db.begin_nested()
+
             # 가상 제어 시뮬레이션
             success = True
             error_message = None
@@ -131,7 +140,9 @@ class ApplianceControlService:
                     error_message = "Cannot set settings when appliance is off"
 
             # 명령 로그 저장 (PostgreSQL UUID 사용)
-            command_log = ApplianceCommandLog(
+            ApplianceControlService._write_command_log(
+                db,
+                command_logs,
                 user_id=user_id_uuid,
                 appliance_type=appliance_type,
                 action=action,
@@ -141,10 +152,8 @@ class ApplianceControlService:
                 triggered_by=triggered_by,
                 fatigue_level_used=fatigue_level_used
             )
-            db.add(command_log)
-
-            db.commit()
-            db.refresh(status)
+            if savepoint is not None:
+                savepoint.commit()
 
             if success:
                 logger.info(f"✅ Command executed successfully: {appliance_type} is now {action}")
@@ -172,8 +181,17 @@ class ApplianceControlService:
             else:
                 user_id_uuid = user_id
 
+            # DB 오류 후에는 세션이 롤백 대기 상태이므로 실패 로그보다 먼저 되돌림
+            # (일괄 실행 중이면 이 명령의 SAVEPOINT 만, 아니면 트랜잭션 전체)
+            if savepoint is not None and savepoint.is_active:
+                savepoint.rollback()
+            else:
+                db.rollback()
+
             # 실패 로그 저장 (PostgreSQL UUID 사용)
-            command_log = ApplianceCommandLog(
+            ApplianceControlService._write_command_log(
+                db,
+                command_logs,
                 user_id=user_id_uuid,
                 appliance_type=appliance_type,
                 action=action,
@@ -183,8 +201,6 @@ class ApplianceControlService:
                 triggered_by=triggered_by,
                 fatigue_level_used=fatigue_level_used
             )
-            db.add(command_log)
-            db.commit()
 
             return {
                 "success": False,
@@ -222,6 +238,8 @@ class ApplianceControlService:
             실행 결과 리스트
         """
         results = []
+        # 명령마다 커밋하지 않고 로그를 모아 한 번의 multi-VALUES INSERT + 커밋으로 저장
+        command_logs: List[Dict[str, Any]] = []
 
         for cmd in commands:
             result = ApplianceControlService.execute_command(
@@ -231,12 +249,44 @@ class ApplianceControlService:
                 action=cmd.get("action", "on"),
                 settings=cmd.get("settings"),
                 triggered_by=triggered_by,
-                fatigue_level_used=cmd.get("fatigue_level")
+                fatigue_level_used=cmd.get("fatigue_level"),
+                command_logs=command_logs
             )
             results.append(result)
 
+        ApplianceControlService.write_command_logs(db, command_logs)
+
         return results
 
+    @staticmethod
+    def write_command_logs(db: Session, command_logs: List[Dict[str, Any]]) -> int:
+        """
+        모아 둔 명령 로그를 한 번의 multi-VALUES INSERT 로 저장하고 커밋
+
+        (execute_command(command_logs=...) 로 실행한 명령들의 상태 변경도 함께 커밋됨)
+        """
+        if not command_logs:
+            db.commit()
+            return 0
+        return core_insert_many(db, ApplianceCommandLog, command_logs)
+
+    @staticmethod
+    def _write_command_log(
+        db: Session,
+        command_logs: Optional[List[Dict[str, Any]]],
+        **values: Any
+    ) -> None:
+        """
+        명령 로그 기록
+
+        - command_logs 가 주어지면 행만 모아 둠 (일괄 실행용, write_command_logs 로 저장)
+        - 아니면 ORM 을 거치지 않는 Core INSERT 와 함께 바로 커밋
+        """
+        if command_logs is not None:
+            command_logs.append(values)
+        else:
+            core_insert_many(db, ApplianceCommandLog, [values])
+
     @staticmethod
     def get_appliance_status(
         db: Session,
@@ -271,6 +321,11 @@ class ApplianceControlService:
             logger.warning(f"⚠️ No registered appliances found for user {user_id}")
             return []
 
+        # 사용자의 가전 상태를 한 번에 조회 (가전별 SELECT 방지)
+        status_by_type = {}
+        for status in db.query(ApplianceStatus).filter(ApplianceStatus.user_id == user_id_uuid):
+            status_by_type.setdefault(status.appliance_type, status)
+
         # 등록된 가전 목록을 기반으로 상태 정보 병합
         result = []
         for appliance in registered_appliances:
@@ -281,13 +336,8 @@ class ApplianceControlService:
             if appliance_type and display_type != appliance_type:
                 continue
 
-            # 해당 가전의 상태 조회 (PostgreSQL UUID 사용)
-            status = db.query(ApplianceStatus)\
-                .filter(
-                    ApplianceStatus.user_id == user_id_uuid,
-                    ApplianceStatus.appliance_type == display_type
-                )\
-                .first()
+            # 해당 가전의 상태
+            status = status_by_type.get(display_type)
 
             if status:
                 # 상태가 있으면 사용
@@ -6,12 +6,21 @@ import logging
 from datetime import datetime, timedelta
 from typing import Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import bindparam, desc, select
 
 from app.models.hrv import HRVLog, FatigueHistory
 
 logger = logging.getLogger(__name__)
 
+# 최신 피로도만 필요하므로 컬럼 하나만 조회
+# (idx_hrv_user_measured 의 INCLUDE 컬럼으로 힙 접근 없이 index-only scan)
+_LATEST_FATIGUE_LEVEL_STMT = (
+    select(HRVLog.fatigue_level)
+    .where(HRVLog.user_id == bindparam("user_id"))
+    .order_by(HRVLog.measured_at.desc())
+    .limit(1)
+)
+
 
 class HRVService:
     """HRV 관리 및 피로도 계산 서비스"""
@@ -84,13 +93,12 @@ class HRVService:
         Returns:
             피로도 레벨 (1~4) 또는 None (데이터 없음)
         """
-        latest_log = db.query(HRVLog)\
-            .filter(HRVLog.user_id == user_id)\
-            .order_by(desc(HRVLog.measured_at))\
-            .first()
+        fatigue_level = db.scalars(
+            _LATEST_FATIGUE_LEVEL_STMT, {"user_id": user_id}
+        ).first()
 
-        if latest_log:
-            return latest_log.fatigue_level
+        if fatigue_level is not None:
+            return fatigue_level
 
         logger.warning(f"⚠️ No HRV data found for user {user_id}")
         return None
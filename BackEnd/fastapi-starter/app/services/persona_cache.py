@@ -0,0 +1,139 @@
+"""
+페르소나 조회 캐시
+음성 WebSocket 연결마다 반복되는 Supabase / Character 조회를 줄이기 위한 프로세스 로컬 TTL 캐시
+"""
+import asyncio
+import logging
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.config.db import SessionLocal
+from app.services.supabase_service import supabase_persona_service
+import app.cruds.info as infoCruds
+from app.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class _KeyLock:
+    """키별 조회 락 + 이 락을 잡고 있거나 기다리는 코루틴 수"""
+
+    __slots__ = ("lock", "users")
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
+class PersonaCache:
+    """
+    character_id → (persona_instructions, nickname) TTL LRU 캐시
+
+    조회 순서:
+    1. 프로세스 로컬 캐시 (L1)
+    2. Supabase 페르소나 시스템
+    3. FastAPI Character 테이블 (fallback)
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        # invalidate()는 동기 엔드포인트(스레드풀)에서도 호출되므로 스레드 안전한 TTLCache 사용
+        self._entries = TTLCache(maxsize=maxsize, ttl=ttl)
+        # character_id → 최초 조회 락 (동시 접속 시 같은 페르소나는 한 번만 조회)
+        # (마지막 사용자가 빠질 때 제거하므로 대기 중인 코루틴이 있는 동안은 같은 락 유지)
+        self._load_locks: Dict[str, _KeyLock] = {}
+
+    async def get_persona(self, db: Optional[Session], character_id: str) -> Optional[str]:
+        """
+        페르소나 instructions 조회 (캐시 우선)
+
+        Args:
+            db: 데이터베이스 세션 (None이면 캐시 미스 시에만 새 세션을 열어 조회)
+            character_id: Supabase persona ID 또는 FastAPI Character ID
+
+        Returns:
+            persona instructions 또는 None
+        """
+        key = str(character_id)
+
+        cached = self._get_fresh(key)
+        if cached is not None:
+            return cached
+
+        # 이벤트 루프 안에서만 접근하므로 조회 ~ 카운트 증가 사이에 끼어드는 코루틴 없음
+        load_lock = self._load_locks.get(key)
+        if load_lock is None:
+            load_lock = self._load_locks[key] = _KeyLock()
+        load_lock.users += 1
+        try:
+            async with load_lock.lock:
+                # 락을 기다리는 동안 다른 연결이 채웠을 수 있음
+                cached = self._get_fresh(key)
+                if cached is not None:
+                    return cached
+
+                # 캐시 미스: 블로킹 조회는 스레드풀에서 실행
+                if db is None:
+                    loaded = await asyncio.to_thread(self._load_with_new_session, key)
+                else:
+                    loaded = await asyncio.to_thread(self._load, db, key)
+                if loaded is None:
+                    return None
+
+                self._entries.set(key, loaded)
+                return loaded[0]
+        finally:
+            load_lock.users -= 1
+            if load_lock.users == 0 and self._load_locks.get(key) is load_lock:
+                del self._load_locks[key]
+
+    def _get_fresh(self, key: str) -> Optional[str]:
+        """만료되지 않은 캐시 항목의 instructions 반환"""
+        entry = self._entries.get(key)
+        return entry[0] if entry is not None else None
+
+    def invalidate(self, character_id) -> None:
+        """캐릭터 수정/삭제 시 캐시 무효화"""
+        self._entries.delete(str(character_id))
+
+    def clear(self) -> None:
+        """캐시 전체 비우기"""
+        self._entries.clear()
+
+    @classmethod
+    def _load_with_new_session(cls, character_id: str) -> Optional[Tuple[str, str]]:
+        """조회 동안만 DB 세션을 열어 _load 실행"""
+        db = SessionLocal()
+        try:
+            return cls._load(db, character_id)
+        finally:
+            db.close()
+
+    @staticmethod
+    def _load(db: Session, character_id: str) -> Optional[Tuple[str, str]]:
+        """Supabase → Character 테이블 순서로 페르소나 조회"""
+        # 1순위: Supabase 페르소나 시스템 시도
+        if supabase_persona_service.is_available():
+            persona_data = supabase_persona_service.get_persona_for_llm(character_id)
+            if persona_data:
+                logger.info(f"✅ Loaded Supabase persona: {persona_data['nickname']}")
+                return persona_data["description"], persona_data["nickname"]
+            logger.warning(f"⚠️ Supabase persona not found: {character_id}, falling back to FastAPI Character")
+
+        # 2순위: FastAPI Character 테이블 (fallback)
+        try:
+            character = infoCruds.get_character(db, UUID(character_id))
+        except ValueError:
+            character = None
+
+        if character and character.persona:
+            logger.info(f"✅ Loaded FastAPI persona: {character.nickname}")
+            return character.persona, character.nickname
+
+        logger.warning(f"⚠️ Character not found in both Supabase and FastAPI DB: {character_id}")
+        return None
+
+
+# 싱글톤 인스턴스
+persona_cache = PersonaCache()
@@ -7,6 +7,7 @@ import json
 import logging
 import asyncio
 import base64
+from functools import lru_cache
 from typing import Dict, Any, Optional, Callable, Awaitable
 from datetime import datetime
 
@@ -15,6 +16,10 @@ from websockets.client import WebSocketClientProtocol
 
 logger = logging.getLogger(__name__)
 
+# input_audio_buffer.append 이벤트 JSON 템플릿 (audio 값만 끼워 넣음)
+_AUDIO_APPEND_PREFIX = '{"type":"input_audio_buffer.append","audio":"'
+_AUDIO_APPEND_SUFFIX = '"}'
+
 
 class RealtimeVoiceAgent:
     """
@@ -89,14 +94,8 @@ class RealtimeVoiceAgent:
             self.sessions[user_id] = ws
             logger.info(f"✅ Realtime session created for user {user_id}")
 
-            # 세션 설정
-            if instructions is None:
-                # 페르소나 없음: 기본 시스템 프롬프트
-                instructions = self._build_system_instructions()
-            else:
-                # 페르소나 있음: 기본 프롬프트 + 페르소나 결합
-                base_instructions = self._build_system_instructions()
-                instructions = f"{base_instructions}\n\n**페르소나 (말투/성격):**\n{instructions}"
+            # 세션 설정 (기본 프롬프트 + 페르소나 결합 결과는 페르소나별로 캐시)
+            instructions = self._compose_instructions(instructions)
 
             session_config = {
                 "type": "session.update",
@@ -134,6 +133,14 @@ class RealtimeVoiceAgent:
             logger.error(f"❌ Session creation error: {str(e)}")
             raise
 
+    @lru_cache(maxsize=256)
+    def _compose_instructions(self, persona: Optional[str]) -> str:
+        """기본 시스템 프롬프트에 페르소나(말투/성격)를 결합"""
+        base_instructions = self._build_system_instructions()
+        if persona is None:
+            return base_instructions
+        return f"{base_instructions}\n\n**페르소나 (말투/성격):**\n{persona}"
+
     def _build_system_instructions(self) -> str:
         """시스템 프롬프트 생성 (텍스트 LLM과 동일한 스타일)"""
         return """당신은 사용자의 스마트홈 AI 어시스턴트입니다.
@@ -253,14 +260,13 @@ class RealtimeVoiceAgent:
                 raise ValueError(f"No session found for user {user_id}")
 
             # OpenAI Realtime API는 base64 인코딩된 오디오를 JSON으로 전송
-            duration_ms = (len(audio_data) / 32000) * 1000  # 16kHz * 2 bytes = 32000 bytes/sec
-            logger.info(f"📤 Sending audio chunk: {len(audio_data)} bytes (~{duration_ms:.1f}ms)")
+            if logger.isEnabledFor(logging.DEBUG):
+                duration_ms = (len(audio_data) / 32000) * 1000  # 16kHz * 2 bytes = 32000 bytes/sec
+                logger.debug("📤 Sending audio chunk: %d bytes (~%.1fms)", len(audio_data), duration_ms)
 
-            event = {
-                "type": "input_audio_buffer.append",
-                "audio": base64.b64encode(audio_data).decode('utf-8')
-            }
-            await ws.send(json.dumps(event))
+            # base64 문자열은 JSON 이스케이프가 필요 없으므로 직렬화 없이 직접 조립
+            encoded = base64.b64encode(audio_data).decode("ascii")
+            await ws.send(_AUDIO_APPEND_PREFIX + encoded + _AUDIO_APPEND_SUFFIX)
 
         except Exception as e:
             logger.error(f"❌ Send audio error: {str(e)}")
@@ -214,7 +214,7 @@ class SendbirdCallsClient:
             async with httpx.AsyncClient() as client:
                 response = await client.post(
                     chat_user_url,
-                    headers=SendbirdConfig.get_chat_headers(),
+                    headers=SendbirdConfig.CHAT_HEADERS,
                     json=chat_payload,
                     timeout=10.0
                 )
@@ -237,7 +237,7 @@ class SendbirdCallsClient:
                         async with httpx.AsyncClient() as client:
                             user_response = await client.get(
                                 f"{chat_user_url}/{assistant_id}",
-                                headers=SendbirdConfig.get_chat_headers(),
+                                headers=SendbirdConfig.CHAT_HEADERS,
                                 timeout=10.0
                             )
                             user_response.raise_for_status()
@@ -251,7 +251,7 @@ class SendbirdCallsClient:
                                 async with httpx.AsyncClient() as token_client:
                                     token_response = await token_client.put(
                                         f"{chat_user_url}/{assistant_id}",
-                                        headers=SendbirdConfig.get_chat_headers(),
+                                        headers=SendbirdConfig.CHAT_HEADERS,
                                         json={"issue_access_token": True},
                                         timeout=10.0
                                     )
@@ -325,7 +325,7 @@ class SendbirdCallsClient:
             async with httpx.AsyncClient() as client:
                 response = await client.post(
                     chat_user_url,
-                    headers=SendbirdConfig.get_chat_headers(),
+                    headers=SendbirdConfig.CHAT_HEADERS,
                     json=chat_payload,
                     timeout=10.0
                 )
@@ -346,7 +346,7 @@ class SendbirdCallsClient:
                         async with httpx.AsyncClient() as client:
                             user_response = await client.get(
                                 f"{chat_user_url}/{user_id}",
-                                headers=SendbirdConfig.get_chat_headers(),
+                                headers=SendbirdConfig.CHAT_HEADERS,
                                 timeout=10.0
                             )
                             user_response.raise_for_status()
@@ -360,7 +360,7 @@ class SendbirdCallsClient:
                                 async with httpx.AsyncClient() as token_client:
                                     token_response = await token_client.put(
                                         f"{chat_user_url}/{user_id}",
-                                        headers=SendbirdConfig.get_chat_headers(),
+                                        headers=SendbirdConfig.CHAT_HEADERS,
                                         json={"issue_access_token": True},
                                         timeout=10.0
                                     )
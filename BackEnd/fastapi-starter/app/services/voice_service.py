@@ -4,13 +4,29 @@
 import os
 import logging
 from typing import AsyncIterator, Optional
+import httpx
 from openai import AsyncOpenAI
 import base64
 
 logger = logging.getLogger(__name__)
 
+# 프로세스 단위로 공유하는 HTTP 커넥션 풀
+# - STT / TTS 호출마다 TLS 핸드셰이크가 반복되지 않도록 keep-alive 연결 재사용
+http_client = httpx.AsyncClient(
+    timeout=httpx.Timeout(30.0, connect=5.0),
+    limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+)
+
 # OpenAI 클라이언트
-client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY", ""))
+client = AsyncOpenAI(
+    api_key=os.getenv("OPENAI_API_KEY", ""),
+    http_client=http_client,
+)
+
+
+async def close_http_client():
+    """앱 종료 시 공유 HTTP 커넥션 풀 정리"""
+    await http_client.aclose()
 
 
 class VoiceService:
@@ -0,0 +1,96 @@
+"""
+날씨 조회 L1 캐시
+weather_service 의 DB 캐시 / 외부 API 앞단의 프로세스 로컬 TTL 캐시 + single-flight
+"""
+import asyncio
+import logging
+from typing import Dict, Tuple
+
+from app.config.db import run_in_session
+from app.services.weather_service import weather_service
+from app.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# DB 캐시(WeatherCache)와 동일하게 10분 유효
+WEATHER_CACHE_TTL_SECONDS = 600.0
+# 키가 클라이언트 좌표에서 오므로 개수 상한을 두고 LRU 로 제거
+WEATHER_CACHE_MAXSIZE = 1024
+
+CacheKey = Tuple[float, float, str]
+
+# key → 날씨 데이터
+_cache = TTLCache(maxsize=WEATHER_CACHE_MAXSIZE, ttl=WEATHER_CACHE_TTL_SECONDS)
+# key → 진행 중인 업스트림 조회 결과 (동시 미스를 한 번의 조회로 합침, 완료 시 제거)
+_inflight: Dict[CacheKey, asyncio.Future] = {}
+
+
+def _make_key(latitude: float, longitude: float, sido_name: str) -> CacheKey:
+    return round(latitude, 3), round(longitude, 3), sido_name
+
+
+async def get_combined_weather_cached(
+    latitude: float,
+    longitude: float,
+    sido_name: str = "서울"
+) -> Dict:
+    """
+    날씨 + 미세먼지 통합 조회 (L1 캐시 + single-flight)
+
+    - 캐시 히트: 메모리에서 바로 반환
+    - 캐시 미스: 같은 키로 진행 중인 조회가 있으면 그 결과(또는 예외)를 함께 받음,
+      없으면 DB 캐시 → 외부 API 순서로 한 번만 조회
+    - DB 캐시 조회/저장은 스레드풀에서 새 세션으로 짧게 수행하고,
+      외부 API 를 기다리는 동안에는 세션(커넥션)을 잡고 있지 않음
+    """
+    key = _make_key(latitude, longitude, sido_name)
+
+    while True:
+        cached = _cache.get(key)
+        if cached is not None:
+            return {**cached, "cached": True}
+
+        future = _inflight.get(key)
+        if future is None:
+            break
+        try:
+            # 선행 조회가 실패하면 대기 중인 요청들도 같은 예외를 받음 (동시 재조회 방지)
+            return {**await asyncio.shield(future), "cached": True}
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise
+            # 선행 요청이 취소된 경우에만 다시 시도
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        weather_data = await asyncio.to_thread(
+            run_in_session, weather_service.get_cached_weather, latitude, longitude
+        )
+        if weather_data is None:
+            weather_data = await weather_service.fetch_combined_weather(
+                latitude, longitude, sido_name
+            )
+            await asyncio.to_thread(
+                run_in_session, weather_service.save_cached_weather,
+                latitude, longitude, weather_data
+            )
+        _cache.set(key, weather_data)
+        future.set_result(weather_data)
+        return weather_data
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as exc:
+        future.set_exception(exc)
+        # 대기자가 없어도 "exception was never retrieved" 경고가 남지 않도록 회수
+        future.exception()
+        raise
+    finally:
+        if _inflight.get(key) is future:
+            del _inflight[key]
+
+
+def clear_weather_cache() -> None:
+    """L1 캐시 비우기"""
+    _cache.clear()
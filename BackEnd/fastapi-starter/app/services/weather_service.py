@@ -201,32 +201,15 @@ class WeatherService:
             logger.error(f"❌ Air quality API error: {str(e)}")
             return None
 
-    async def get_combined_weather(
+    def get_cached_weather(
         self,
         db: Session,
         latitude: float,
-        longitude: float,
-        sido_name: str = "서울"
-    ) -> Dict:
-        """
-        날씨 + 미세먼지 통합 조회 (캐싱 포함)
-
-        캐시 유효 시간: 10분
-
-        Returns:
-            {
-                "temperature": 25.3,
-                "humidity": 65.0,
-                "precipitation": 0.0,
-                "wind_speed": 2.5,
-                "pm10": 45.0,
-                "pm2_5": 25.0,
-                "cached": True/False
-            }
-        """
+        longitude: float
+    ) -> Optional[Dict]:
+        """DB 캐시(WeatherCache) 조회 - 만료 전 항목이 없으면 None (동기, 스레드풀에서 호출 가능)"""
         location_key = self._generate_location_key(latitude, longitude)
 
-        # 캐시 조회
         cached = db.query(WeatherCache)\
             .filter(
                 WeatherCache.location_key == location_key,
@@ -234,22 +217,29 @@ class WeatherService:
             )\
             .first()
 
-        if cached:
-            logger.info(f"✅ Weather cache hit: {location_key}")
-            return {
-                "temperature": cached.temperature,
-                "humidity": cached.humidity,
-                "precipitation": cached.precipitation,
-                "wind_speed": cached.wind_speed,
-                "pm10": cached.pm10,
-                "pm2_5": cached.pm2_5,
-                "cached": True,
-                "fetched_at": cached.fetched_at
-            }
+        if not cached:
+            logger.info(f"⏳ Weather cache miss: {location_key}")
+            return None
 
-        # 캐시 미스 - API 호출
-        logger.info(f"⏳ Weather cache miss, fetching: {location_key}")
+        logger.info(f"✅ Weather cache hit: {location_key}")
+        return {
+            "temperature": cached.temperature,
+            "humidity": cached.humidity,
+            "precipitation": cached.precipitation,
+            "wind_speed": cached.wind_speed,
+            "pm10": cached.pm10,
+            "pm2_5": cached.pm2_5,
+            "cached": True,
+            "fetched_at": cached.fetched_at
+        }
 
+    async def fetch_combined_weather(
+        self,
+        latitude: float,
+        longitude: float,
+        sido_name: str = "서울"
+    ) -> Dict:
+        """외부 API 로 날씨 + 미세먼지 조회 후 병합 (DB 세션 사용 안 함)"""
         weather_data = await self.fetch_weather_data(latitude, longitude)
         air_quality_data = await self.fetch_air_quality_data(sido_name)
 
@@ -264,7 +254,7 @@ class WeatherService:
             }
 
         # 병합
-        combined = {
+        return {
             "temperature": weather_data.get("temperature") if weather_data else None,
             "humidity": weather_data.get("humidity") if weather_data else None,
             "precipitation": weather_data.get("precipitation") if weather_data else None,
@@ -275,7 +265,15 @@ class WeatherService:
             "fetched_at": datetime.now(timezone.utc)
         }
 
-        # 캐시 저장 (10분 유효)
+    def save_cached_weather(
+        self,
+        db: Session,
+        latitude: float,
+        longitude: float,
+        combined: Dict
+    ) -> None:
+        """조회 결과를 DB 캐시에 저장 (10분 유효, 동기)"""
+        location_key = self._generate_location_key(latitude, longitude)
         expires_at = datetime.now(timezone.utc) + timedelta(minutes=10)
 
         # 기존 캐시 삭제 후 새로 저장
@@ -296,6 +294,37 @@ class WeatherService:
         db.commit()
 
         logger.info(f"✅ Weather cached: {location_key}")
+
+    async def get_combined_weather(
+        self,
+        db: Session,
+        latitude: float,
+        longitude: float,
+        sido_name: str = "서울"
+    ) -> Dict:
+        """
+        날씨 + 미세먼지 통합 조회 (캐싱 포함)
+
+        캐시 유효 시간: 10분
+
+        Returns:
+            {
+                "temperature": 25.3,
+                "humidity": 65.0,
+                "precipitation": 0.0,
+                "wind_speed": 2.5,
+                "pm10": 45.0,
+                "pm2_5": 25.0,
+                "cached": True/False
+            }
+        """
+        cached = self.get_cached_weather(db, latitude, longitude)
+        if cached is not None:
+            return cached
+
+        # 캐시 미스 - API 호출
+        combined = await self.fetch_combined_weather(latitude, longitude, sido_name)
+        self.save_cached_weather(db, latitude, longitude, combined)
         return combined
 
 
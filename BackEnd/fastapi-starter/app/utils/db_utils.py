@@ -0,0 +1,230 @@
+"""
+DB 관련 유틸리티 함수
+PostgreSQL INSERT ... ON CONFLICT 업서트 / 다건 INSERT / Core INSERT 헬퍼
+"""
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Type, TypeVar, Union
+
+from sqlalchemy import Row, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+ModelT = TypeVar("ModelT")
+
+
+def commit_or_flush(db: Session, commit: bool) -> None:
+    """
+    commit=True면 바로 커밋, False면 flush만 수행
+
+    - 여러 CRUD를 한 요청에서 묶을 때 commit=False로 호출하면
+      get_db 의존성이 요청 끝에서 한 번만 커밋 (COMMIT / WAL fsync 1회)
+    """
+    if commit:
+        db.commit()
+    else:
+        db.flush()
+
+
+def pg_upsert(
+    db: Session,
+    model: Type[ModelT],
+    values: Dict[str, Any],
+    conflict_cols: Iterable[str],
+    update_values: Optional[Dict[str, Any]] = None,
+    commit: bool = True,
+    as_orm: bool = True,
+) -> Union[ModelT, Row]:
+    """
+    단일 문장 업서트 (INSERT ... ON CONFLICT DO UPDATE ... RETURNING)
+    PostgreSQL 기준, SQLite(3.35+)에서도 동일하게 동작
+
+    - SELECT 후 INSERT/UPDATE 하던 2회 왕복을 1회로 줄이고 경쟁 조건도 제거
+    - updated_at 은 BEFORE UPDATE 트리거가 갱신 (ON CONFLICT DO UPDATE 에도 적용)
+    - 모델에 onupdate 가 지정된 컬럼은 UPDATE 시 SET 에 함께 포함
+
+    Args:
+        db: 데이터베이스 세션
+        model: ORM 모델 클래스
+        values: INSERT 할 값 (충돌 키 포함)
+        conflict_cols: 충돌 판단 컬럼 (PK 또는 UNIQUE 제약 컬럼)
+        update_values: 충돌 시 UPDATE 할 값 (기본값: values 에서 충돌 키 제외)
+        commit: False면 flush만 하고 커밋은 호출 측(요청 단위)에 맡김
+        as_orm: False면 model.__table__ 에 Core 문장으로 실행하고 Row 반환
+            (매퍼 이벤트 / identity map 갱신 없이 쓰기만 하는 경로)
+
+    Returns:
+        업서트된 ORM 객체 (as_orm=False면 Row)
+    """
+    conflict_cols = list(conflict_cols)
+    if update_values is None:
+        update_values = values
+
+    table = model.__table__
+    target = model if as_orm else table
+    # 테스트용 SQLite 도 같은 ON CONFLICT 문법을 지원하므로 방언에 맞는 insert 사용
+    if db.get_bind().dialect.name == "sqlite":
+        stmt = sqlite_insert(target).values(**values)
+    else:
+        stmt = pg_insert(target).values(**values)
+
+    set_ = {
+        key: stmt.excluded[key]
+        for key in update_values
+        if key not in conflict_cols
+    }
+    for column in table.columns:
+        if (
+            column.name not in set_
+            and column.onupdate is not None
+            and column.onupdate.is_clause_element
+        ):
+            set_[column.name] = column.onupdate.arg
+    if not set_:
+        # 갱신할 컬럼이 없어도 RETURNING 으로 기존 행을 받기 위해 no-op UPDATE
+        set_ = {key: stmt.excluded[key] for key in conflict_cols}
+
+    stmt = stmt.on_conflict_do_update(index_elements=conflict_cols, set_=set_)
+
+    if as_orm:
+        stmt = stmt.returning(model).execution_options(populate_existing=True)
+        result = db.scalars(stmt).one()
+    else:
+        result = db.execute(stmt.returning(*table.c)).one()
+    commit_or_flush(db, commit)
+    return result
+
+
+def pg_upsert_many(
+    db: Session,
+    model: Type[ModelT],
+    rows: Sequence[Dict[str, Any]],
+    conflict_cols: Iterable[str],
+    update_cols: Optional[Iterable[str]] = None,
+    commit: bool = True,
+) -> List[ModelT]:
+    """
+    다건 업서트 (INSERT ... VALUES (...), (...) ON CONFLICT DO UPDATE ... RETURNING)
+
+    - 백필처럼 수천 행을 한 번에 보낼 때 행마다 pg_upsert 를 호출하지 않고
+      insertmanyvalues 로 묶어서 전송 (왕복 / 문장 파싱 횟수 최소화)
+    - 같은 충돌 키가 한 문장에 두 번 들어가면 PostgreSQL 이 거부하므로
+      호출 측에서 키 중복을 제거해서 넘겨야 함
+
+    Args:
+        db: 데이터베이스 세션
+        model: ORM 모델 클래스
+        rows: INSERT 할 값 목록 (모든 행이 같은 키를 가져야 함)
+        conflict_cols: 충돌 판단 컬럼 (PK 또는 UNIQUE 제약 컬럼)
+        update_cols: 충돌 시 UPDATE 할 컬럼 (기본값: 행의 키에서 충돌 키 제외)
+        commit: False면 flush만 하고 커밋은 호출 측(요청 단위)에 맡김
+
+    Returns:
+        업서트된 ORM 객체 목록 (입력 순서 유지)
+    """
+    if not rows:
+        return []
+
+    conflict_cols = list(conflict_cols)
+    if update_cols is None:
+        update_cols = rows[0].keys()
+
+    if db.get_bind().dialect.name == "sqlite":
+        stmt = sqlite_insert(model)
+    else:
+        stmt = pg_insert(model)
+
+    set_ = {
+        key: stmt.excluded[key]
+        for key in update_cols
+        if key not in conflict_cols
+    }
+    for column in model.__table__.columns:
+        if (
+            column.name not in set_
+            and column.onupdate is not None
+            and column.onupdate.is_clause_element
+        ):
+            set_[column.name] = column.onupdate.arg
+    if not set_:
+        set_ = {key: stmt.excluded[key] for key in conflict_cols}
+
+    stmt = (
+        stmt.on_conflict_do_update(index_elements=conflict_cols, set_=set_)
+        .returning(model, sort_by_parameter_order=True)
+        .execution_options(populate_existing=True)
+    )
+    db_objs = list(db.scalars(stmt, list(rows)))
+    commit_or_flush(db, commit)
+    return db_objs
+
+
+def bulk_insert(
+    db: Session,
+    model: Type[ModelT],
+    rows: Sequence[Dict[str, Any]],
+    commit: bool = True,
+) -> List[ModelT]:
+    """
+    다건 INSERT ... RETURNING (한 번의 커밋)
+
+    - 행마다 add + commit + refresh 하던 방식 대신 ORM bulk INSERT 사용
+    - psycopg2에서는 여러 행을 묶은 multi-VALUES INSERT로 전송됨
+
+    Args:
+        db: 데이터베이스 세션
+        model: ORM 모델 클래스
+        rows: INSERT 할 값 목록 (모든 행이 같은 키를 가져야 함)
+        commit: False면 flush만 하고 커밋은 호출 측(요청 단위)에 맡김
+
+    Returns:
+        생성된 ORM 객체 목록 (입력 순서 유지)
+    """
+    if not rows:
+        return []
+
+    db_objs = list(
+        db.scalars(
+            insert(model).returning(model, sort_by_parameter_order=True),
+            list(rows),
+        )
+    )
+    commit_or_flush(db, commit)
+    return db_objs
+
+
+def core_insert_one(
+    db: Session,
+    model: Type[Any],
+    values: Dict[str, Any],
+    commit: bool = True,
+) -> Row:
+    """
+    ORM 을 거치지 않는 단건 INSERT ... RETURNING
+
+    - 매퍼 이벤트 / identity map / flush 상태 관리 비용 없이 테이블에 바로 INSERT
+    - 반환값은 ORM 객체가 아닌 Row (속성 접근 가능, from_attributes 스키마로 직렬화 가능)
+    """
+    table = model.__table__
+    row = db.execute(insert(table).values(**values).returning(*table.c)).one()
+    commit_or_flush(db, commit)
+    return row
+
+
+def core_insert_many(
+    db: Session,
+    model: Type[Any],
+    rows: Sequence[Dict[str, Any]],
+    commit: bool = True,
+) -> int:
+    """
+    ORM 을 거치지 않는 다건 INSERT (결과 행이 필요 없는 대량 적재용)
+
+    Returns:
+        INSERT 한 행 수
+    """
+    if not rows:
+        return 0
+
+    db.execute(insert(model.__table__), list(rows))
+    commit_or_flush(db, commit)
+    return len(rows)
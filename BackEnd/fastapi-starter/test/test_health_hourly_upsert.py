@@ -0,0 +1,67 @@
+"""
+health_hourly 다건 업서트 테스트 (SQLite 메모리 DB)
+- 행마다 보낸 필드만 갱신되고, 다른 행이 보낸 필드로 기존 값이 NULL 로 덮이지 않는지 확인
+"""
+import os
+import sys
+import uuid
+from datetime import datetime, timezone
+
+# 프로젝트 루트(app 패키지가 있는 디렉터리)를 sys.path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.config.db import Base
+from app.cruds.tracking import bulk_upsert_health_hourly, upsert_health_hourly
+from app.models.tracking import HealthHourly
+from app.models.user import User
+from app.schemas.tracking import HealthHourlyCreate
+
+
+def _make_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine, tables=[User.__table__, HealthHourly.__table__])
+    return sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)()
+
+
+def test_bulk_upsert_keeps_fields_not_sent_per_row():
+    db = _make_session()
+    user_id = uuid.uuid4()
+    db.add(User(id=user_id, email=f"test_{str(user_id)[:8]}@example.com"))
+    db.commit()
+
+    h1 = datetime(2025, 12, 1, 9, tzinfo=timezone.utc)
+    h2 = datetime(2025, 12, 1, 10, tzinfo=timezone.utc)
+
+    # 기존 값: h1 은 심박 + 산소포화도, h2 는 심박만
+    upsert_health_hourly(db, HealthHourlyCreate(user_id=user_id, ts_hour=h1, heart_rate_bpm=60, spo2_pct=98))
+    upsert_health_hourly(db, HealthHourlyCreate(user_id=user_id, ts_hour=h2, heart_rate_bpm=70))
+
+    # h1 은 심박만, h2 는 산소포화도만 보냄 (행마다 보낸 필드 조합이 다름)
+    result = bulk_upsert_health_hourly(
+        db,
+        [
+            HealthHourlyCreate(user_id=user_id, ts_hour=h1, heart_rate_bpm=65),
+            HealthHourlyCreate(user_id=user_id, ts_hour=h2, spo2_pct=97),
+        ],
+    )
+
+    assert len(result) == 2
+    db.expire_all()
+    rows = {row.heart_rate_bpm: row for row in db.query(HealthHourly).all()}
+
+    row1 = rows[65]
+    assert row1.spo2_pct == 98  # 보내지 않은 필드는 유지
+
+    row2 = rows[70]
+    assert row2.spo2_pct == 97
+    assert row2.heart_rate_bpm == 70  # 다른 행이 보낸 필드로 NULL 이 되지 않음
+
+    db.close()
+
+
+if __name__ == "__main__":
+    test_bulk_upsert_keeps_fields_not_sent_per_row()
+    print("✅ bulk_upsert_health_hourly test passed")
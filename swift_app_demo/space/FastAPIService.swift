@@ -453,7 +453,7 @@ class FastAPIService {
 
             if httpResponse.statusCode == 200 {
                 let decoder = JSONDecoder()
-                let slots = try decoder.decode([TimeSlotRead].self, from: data)
+                let slots = try decoder.decode(TimeSlotPage.self, from: data).items
                 print("✅ [FastAPI] Retrieved \(slots.count) time slots")
                 return slots
             } else {
@@ -238,6 +238,17 @@ struct TimeSlotRead: Codable {
     }
 }
 
+/// Paginated time slot response from FastAPI
+struct TimeSlotPage: Codable {
+    let items: [TimeSlotRead]
+    let nextCursor: String?
+
+    enum CodingKeys: String, CodingKey {
+        case items
+        case nextCursor = "next_cursor"
+    }
+}
+
 // MARK: - Place
 
 /// Place data for FastAPI upload